@@ -0,0 +1,143 @@
+"""Compare query plans and latency before and after the index migrations.
+
+Usage: python -m benchmarks.schema_indexes [--rows 1000000] [--path bench.db]
+"""
+import argparse
+import asyncio
+import os
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+import aiosqlite
+
+from utils.migrations import run_migrations, SCHEMA_VERSION
+
+GUILDS = 50
+WEEKS = 8
+
+QUERIES = {
+    'player lookup': (
+        "SELECT * FROM players WHERE user_id = ? AND guild_id = ?",
+        lambda p: (p['user_id'], p['guild_id'])
+    ),
+    'leaderboard cash': (
+        "SELECT user_id, cash FROM players WHERE guild_id = ? ORDER BY cash DESC LIMIT 10",
+        lambda p: (p['guild_id'],)
+    ),
+    'leaderboard winnings': (
+        "SELECT user_id, total_winnings FROM players WHERE guild_id = ? ORDER BY total_winnings DESC LIMIT 10",
+        lambda p: (p['guild_id'],)
+    ),
+    'leaderboard games': (
+        "SELECT user_id, games_played FROM players WHERE guild_id = ? ORDER BY games_played DESC LIMIT 10",
+        lambda p: (p['guild_id'],)
+    ),
+    'player game history': (
+        "SELECT COUNT(*), SUM(winnings) FROM game_stats WHERE guild_id = ? AND user_id = ?",
+        lambda p: (p['guild_id'], p['user_id'])
+    ),
+    'guild recent games': (
+        "SELECT COUNT(*) FROM game_stats WHERE guild_id = ? AND created_at >= ?",
+        lambda p: (p['guild_id'], p['since'])
+    ),
+    'lottery week': (
+        "SELECT user_id, tickets FROM lottery WHERE guild_id = ? AND week_start = ?",
+        lambda p: (p['guild_id'], p['week_start'])
+    )
+}
+
+async def populate(db, rows: int):
+    """Fill the baseline schema with synthetic data."""
+    players = max(1000, rows // 10)
+    now = datetime(2024, 1, 1)
+    weeks = [(now - timedelta(weeks=i)).isoformat() for i in range(WEEKS)]
+
+    await db.execute("BEGIN")
+    await db.executemany(
+        "INSERT INTO players (user_id, guild_id, cash, total_winnings, games_played) VALUES (?, ?, ?, ?, ?)",
+        (
+            (user_id, user_id % GUILDS, random.randint(0, 10**7), random.randint(0, 10**7), random.randint(0, 5000))
+            for user_id in range(1, players + 1)
+        )
+    )
+    await db.executemany(
+        "INSERT INTO game_stats (user_id, guild_id, game_name, bet_amount, winnings, result, created_at) "
+        "VALUES (?, ?, 'slots', ?, ?, 'win', ?)",
+        (
+            (user_id, user_id % GUILDS, 100, random.randint(0, 500),
+             (now - timedelta(minutes=random.randint(0, 60 * 24 * 90))).isoformat(' ', 'seconds'))
+            for user_id in (random.randint(1, players) for _ in range(rows))
+        )
+    )
+    await db.executemany(
+        "INSERT INTO lottery (guild_id, user_id, tickets, week_start) VALUES (?, ?, ?, ?)",
+        (
+            (user_id % GUILDS, user_id, random.randint(1, 1000), random.choice(weeks))
+            for user_id in random.sample(range(1, players + 1), min(players, rows // 20))
+        )
+    )
+    await db.commit()
+    return players, weeks
+
+async def measure(db, params: list, runs: int) -> dict:
+    """Get the query plan and mean latency of every benchmark query."""
+    results = {}
+    for name, (sql, bind) in QUERIES.items():
+        cursor = await db.execute(f"EXPLAIN QUERY PLAN {sql}", bind(params[0]))
+        plan = "; ".join(row[3] for row in await cursor.fetchall())
+
+        start = time.perf_counter()
+        for i in range(runs):
+            cursor = await db.execute(sql, bind(params[i % len(params)]))
+            await cursor.fetchall()
+        elapsed = (time.perf_counter() - start) / runs
+
+        results[name] = {'plan': plan, 'latency_ms': elapsed * 1000}
+    return results
+
+async def main(rows: int, path: str, runs: int):
+    if os.path.exists(path):
+        os.remove(path)
+
+    async with aiosqlite.connect(path) as db:
+        # Baseline schema only, then load data before the later migrations run
+        await run_migrations(db, target_version=1)
+
+        start = time.perf_counter()
+        players, weeks = await populate(db, rows)
+        print(f"Loaded {rows:,} game_stats rows and {players:,} players in {time.perf_counter() - start:.1f}s")
+
+        params = []
+        for _ in range(runs):
+            user_id = random.randint(1, players)
+            params.append({
+                'user_id': user_id,
+                'guild_id': user_id % GUILDS,
+                'since': '2023-12-25 00:00:00',
+                'week_start': random.choice(weeks)
+            })
+
+        before = await measure(db, params, runs)
+
+        start = time.perf_counter()
+        await run_migrations(db)
+        print(f"Migrated to schema version {SCHEMA_VERSION} in {time.perf_counter() - start:.1f}s\n")
+
+        after = await measure(db, params, runs)
+
+    for name in QUERIES:
+        speedup = before[name]['latency_ms'] / max(after[name]['latency_ms'], 1e-9)
+        print(f"{name}: {before[name]['latency_ms']:.3f} ms -> {after[name]['latency_ms']:.3f} ms ({speedup:.1f}x)")
+        print(f"  before: {before[name]['plan']}")
+        print(f"  after:  {after[name]['plan']}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000, help="game_stats rows to generate")
+    parser.add_argument("--runs", type=int, default=50, help="executions per query")
+    parser.add_argument("--path", default=os.path.join(tempfile.gettempdir(), "schema_bench.db"))
+    args = parser.parse_args()
+
+    asyncio.run(main(args.rows, args.path, args.runs))
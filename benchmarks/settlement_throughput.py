@@ -0,0 +1,62 @@
+"""Measure game settlement throughput with and without write batching.
+
+Usage: python -m benchmarks.settlement_throughput [--settlements 5000] [--profile durable]
+"""
+import argparse
+import asyncio
+import glob
+import os
+import random
+import tempfile
+import time
+
+from database import Database
+
+PLAYERS = 500
+GUILD_ID = 1
+
+async def run(path: str, profile: str, batching: bool, settlements: int, concurrency: int) -> float:
+    """Settle games from concurrent workers and return settlements per second."""
+    for leftover in glob.glob(f"{path}*"):
+        os.remove(leftover)
+
+    db = Database(path, storage_profile=profile, batch_settlements=batching)
+    await db.initialize()
+    for user_id in range(PLAYERS):
+        await db.get_player(user_id, GUILD_ID)
+
+    per_worker = settlements // concurrency
+
+    async def worker():
+        for _ in range(per_worker):
+            payout = random.choice([-100, 100, 250])
+            await db.settle_game(random.randrange(PLAYERS), GUILD_ID, "coinflip", 100, payout)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    if batching:
+        stats = db.settlements.stats()
+        print(f"  batches: {stats['batches']:,}, avg size: {stats['avg_batch']:.1f}, "
+              f"avg flush: {stats['avg_flush_time'] * 1000:.2f} ms")
+
+    await db.close()
+    return per_worker * concurrency / elapsed
+
+async def main(args):
+    for batching in (False, True):
+        label = "batched" if batching else "unbatched"
+        print(f"{label}:")
+        rate = await run(args.path, args.profile, batching, args.settlements, args.concurrency)
+        print(f"  {rate:,.0f} settlements/s")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--settlements", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=200, help="concurrent games in flight")
+    parser.add_argument("--profile", default="durable", help="storage profile to benchmark")
+    parser.add_argument("--path", default=os.path.join(tempfile.gettempdir(), "settlement_bench.db"))
+    args = parser.parse_args()
+
+    asyncio.run(main(args))
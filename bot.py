@@ -1,13 +1,63 @@
 import discord
 from discord.ext import commands
+from discord import app_commands
 import asyncio
 import logging
 from database import Database
 from config import Config
+from utils.edits import EditScheduler
+from utils.rng import RNGService
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 
+class GamblingCommandTree(app_commands.CommandTree):
+    """Command tree that enforces each guild's allowed channels before any command runs."""
+    
+    def __init__(self, client):
+        super().__init__(client)
+        # Channel gate statistics
+        self.checked = 0
+        self.blocked = 0
+    
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        """Reject commands used outside the guild's allowed channels."""
+        if interaction.guild_id is None:
+            return True
+        
+        self.checked += 1
+        
+        # Cached config only; guilds not loaded yet are left unrestricted
+        guild_config = self.client.db.get_cached_guild_config(interaction.guild_id)
+        if not guild_config or not guild_config['allowed_channels']:
+            return True
+        
+        allowed_channels = guild_config['allowed_channels']
+        if interaction.channel_id in allowed_channels:
+            return True
+        
+        # Threads inherit their parent channel's permission
+        if getattr(interaction.channel, 'parent_id', None) in allowed_channels:
+            return True
+        
+        # Config commands stay usable everywhere so admins cannot lock themselves out
+        if interaction.command and interaction.command.name.startswith('config'):
+            return True
+        
+        self.blocked += 1
+        await interaction.response.send_message(
+            "Bot commands are disabled in this channel.", ephemeral=True
+        )
+        return False
+    
+    def stats(self) -> dict:
+        """Get channel gate statistics."""
+        return {
+            'checked': self.checked,
+            'blocked': self.blocked,
+            'block_ratio': self.blocked / self.checked if self.checked else 0.0
+        }
+
 class GamblingBot(commands.Bot):
     def __init__(self):
         intents = discord.Intents.default()
@@ -18,11 +68,14 @@ class GamblingBot(commands.Bot):
         super().__init__(
             command_prefix='!',
             intents=intents,
-            help_command=None
+            help_command=None,
+            tree_cls=GamblingCommandTree
         )
         
         self.db = Database()
         self.config = Config()
+        self.edits = EditScheduler(Config.EDIT_RATE, Config.EDIT_PER, Config.EDIT_MAX_PENDING)
+        self.rng = RNGService(Config.RNG_BUFFER_WORDS)
         
     async def setup_hook(self):
         """Load all cogs and sync commands."""
@@ -57,11 +110,19 @@ class GamblingBot(commands.Bot):
         except Exception as e:
             print(f"Error in setup_hook: {e}")
     
+    async def close(self):
+        """Shut down the bot and release database connections."""
+        await super().close()
+        await self.db.close()
+    
     async def on_ready(self):
         """Called when the bot is ready."""
         print(f'{self.user} has connected to Discord!')
         print(f'Bot is in {len(self.guilds)} guilds')
         
+        # Cache every guild's config so per-interaction checks never hit the database
+        await self.db.preload_guild_configs([guild.id for guild in self.guilds])
+        
         # Set bot activity
         activity = discord.Game(name="🎰 Gambling Games | /help")
         await self.change_presence(activity=activity)
@@ -70,8 +131,8 @@ class GamblingBot(commands.Bot):
         """Called when bot joins a new guild."""
         print(f"Joined new guild: {guild.name} (ID: {guild.id})")
         
-        # Initialize guild in database if needed
-        await self.db.ensure_guild_exists(guild.id)
+        # Initialize guild in database if needed and cache its config
+        await self.db.get_guild_config(guild.id)
     
     async def on_command_error(self, ctx, error):
         """Global error handler."""
@@ -120,9 +120,14 @@ class EconomyCog(commands.Cog):
             item = self.items[item_id]
             total_cost = item['price'] * buy_amount
             
-            # Check if player has enough money
-            player = await self.bot.db.get_player(interaction.user.id, interaction.guild.id)
-            if player['cash'] < total_cost:
+            # Charge the player only if they can cover the full cost
+            balance = await self.bot.db.debit_player_cash(interaction.user.id, interaction.guild.id, total_cost)
+            if balance is None:
+                # Only a failed charge reads the balance; this also creates a new player's row
+                player = await self.bot.db.get_player(interaction.user.id, interaction.guild.id)
+                if player['cash'] >= total_cost:
+                    balance = await self.bot.db.debit_player_cash(interaction.user.id, interaction.guild.id, total_cost)
+            if balance is None:
                 await interaction.followup.send(
                     embed=EmbedBuilder.error(
                         "Insufficient Funds",
@@ -131,9 +136,6 @@ class EconomyCog(commands.Cog):
                 )
                 return
             
-            # Process purchase
-            await self.bot.db.update_player_cash(interaction.user.id, interaction.guild.id, -total_cost)
-            
             # Add to inventory (simplified - just update cash for now)
             embed = EmbedBuilder.success(
                 "Purchase Successful!",
@@ -2,17 +2,21 @@ import discord
 from discord.ext import commands
 from discord import app_commands
 import asyncio
-import random
 from typing import Optional
 
+from config import Config
+from utils.controls import GameControls
 from utils.embeds import EmbedBuilder
 from utils.helpers import parse_bet_amount, format_currency, validate_prediction
-from games.blackjack import BlackjackGame
+from utils.rng import GameRNG
+from games.blackjack import BlackjackTable, BlackjackTableEngine
+from games.blackjack_odds import BlackjackAdvisor
 from games.coinflip import CoinflipGame
 from games.dice import DiceGame
 from games.slots import SlotsGame
-from games.roulette import RouletteGame
-from games.crash import CrashGame
+from games.outcomes import compile_roulette_bet
+from games.roulette import RouletteEngine, RouletteGame
+from games.crash import CrashEngine
 from games.findthelady import FindTheLadyGame
 from games.rockpaperscissors import RockPaperScissorsGame
 from games.sevens import SevensGame
@@ -24,28 +28,33 @@ class GamesCog(commands.Cog):
     
     def __init__(self, bot):
         self.bot = bot
-        # Store active games to prevent multiple games per user
-        self.active_games = {}
-    
-    def _check_active_game(self, user_id: int) -> bool:
-        """Check if user has an active game."""
-        return user_id in self.active_games
-    
-    def _start_game(self, user_id: int, game_type: str):
-        """Mark user as having an active game."""
-        self.active_games[user_id] = game_type
+        # Precomputed hit/stand odds for blackjack hints
+        self.advisor = BlackjackAdvisor()
+        # Shared blackjack tables, one shoe per channel and one ticker for every table
+        self.blackjack_tables = BlackjackTableEngine(
+            bot.edits, bot.rng, self._settle_blackjack_table, self.advisor, Config.BLACKJACK_BETTING_WINDOW,
+            Config.BLACKJACK_SEATS, Config.BLACKJACK_TURN_TIMEOUT
+        )
+        # Shared crash rounds, one ticker for every channel
+        self.crash_engine = CrashEngine(bot.edits, bot.rng, Config.CRASH_BETTING_WINDOW)
+        # Shared roulette spins, one open table per channel
+        self.roulette_engine = RouletteEngine(bot.rng, Config.ROULETTE_BETTING_WINDOW)
     
-    def _end_game(self, user_id: int):
-        """Mark user's game as ended."""
-        if user_id in self.active_games:
-            del self.active_games[user_id]
+    async def cog_unload(self):
+        """Stop the crash and blackjack tickers and close roulette tables, refunding unfinished bets."""
+        await self.crash_engine.stop()
+        await self.roulette_engine.stop()
+        await self.blackjack_tables.stop()
     
-    async def _validate_bet(self, interaction: discord.Interaction, bet_str: str) -> Optional[int]:
-        """Validate and parse bet amount."""
+    async def _validate_bet(self, interaction: discord.Interaction, bet_str: str, rounds: int = 1) -> Optional[int]:
+        """Validate and parse bet amount, then reserve it from the player's cash.
+        
+        With several rounds the bet is per round and all of them are reserved together.
+        """
         player = await self.bot.db.get_player(interaction.user.id, interaction.guild.id)
         player_cash = player['cash']
         
-        bet_amount = parse_bet_amount(bet_str, player_cash)
+        bet_amount = parse_bet_amount(bet_str, player_cash // rounds)
         
         if not bet_amount:
             await interaction.followup.send(
@@ -59,18 +68,19 @@ class GamesCog(commands.Cog):
             )
             return None
         
-        if bet_amount > player_cash:
+        total_bet = bet_amount * rounds
+        if total_bet > player_cash:
             await interaction.followup.send(
                 embed=EmbedBuilder.error(
                     "Insufficient Funds", 
-                    f"You only have {format_currency(player_cash)} but tried to bet {format_currency(bet_amount)}!"
+                    f"You only have {format_currency(player_cash)} but tried to bet {format_currency(total_bet)}!"
                 )
             )
             return None
         
         # Max bet is 50% of cash (configurable)
         max_bet = int(player_cash * 0.5)
-        if bet_str not in ['a', 'all', 'allin'] and bet_amount > max_bet:
+        if bet_str not in ['a', 'all', 'allin'] and total_bet > max_bet:
             await interaction.followup.send(
                 embed=EmbedBuilder.error(
                     "Bet Too High", 
@@ -79,18 +89,43 @@ class GamesCog(commands.Cog):
             )
             return None
         
+        # The balance above may be stale; the reservation is the authoritative check
+        if not await self._open_session(interaction, total_bet):
+            return None
+        
         return bet_amount
     
+    async def _open_session(self, interaction: discord.Interaction, bet_amount: int) -> bool:
+        """Lease the player's game slot for this interaction and escrow the bet."""
+        try:
+            funded = await self.bot.db.open_session(
+                interaction.user.id, interaction.guild.id, interaction.command.name, interaction.id, bet_amount
+            )
+        except ValueError as e:
+            await interaction.followup.send(embed=EmbedBuilder.error("Game In Progress", str(e)))
+            return False
+        
+        if not funded:
+            await interaction.followup.send(
+                embed=EmbedBuilder.error(
+                    "Insufficient Funds",
+                    f"You no longer have {format_currency(bet_amount)} available to bet!"
+                )
+            )
+        return funded
+    
+    async def _refund_bet(self, interaction: discord.Interaction):
+        """End the interaction's game session without a result, refunding its bet."""
+        await self.bot.db.cancel_session(interaction.user.id, interaction.guild.id, interaction.id)
+    
     async def _process_game_result(self, interaction: discord.Interaction, game_name: str, 
-                                 bet_amount: int, payout: int, embed: discord.Embed):
+                                 bet_amount: int, payout: int, embed: discord.Embed, result: Optional[str] = None,
+                                 rng: Optional[GameRNG] = None):
         """Process game result and update database."""
-        # Update player cash
-        await self.bot.db.update_player_cash(interaction.user.id, interaction.guild.id, payout)
-        
-        # Add game statistics
-        await self.bot.db.add_game_stat(
-            interaction.user.id, interaction.guild.id, game_name,
-            bet_amount, max(0, payout), "win" if payout > 0 else "loss"
+        # Release the session and return the escrowed bet plus payout in one settlement,
+        # recording the stream that decided the game
+        await self.bot.db.settle_session(
+            interaction.user.id, interaction.guild.id, interaction.id, game_name, bet_amount, payout, result, rng
         )
         
         # Add XP for wins
@@ -99,11 +134,16 @@ class GamesCog(commands.Cog):
             # TODO: Add XP to database and level system
             pass
         
-        # End the game
-        self._end_game(interaction.user.id)
-        
         return embed
     
+    async def _settle_blackjack_table(self, table: BlackjackTable):
+        """Release every seat's session and settle the whole table in one write."""
+        await self.bot.db.settle_sessions(
+            [(seat.user_id, seat.guild_id, seat.session_id, "blackjack", seat.bet_amount, seat.payout, None)
+             for seat in table.seats.values()],
+            table.shoe.rng
+        )
+    
     @app_commands.command(name="blackjack", description="Play a game of Blackjack")
     @app_commands.describe(
         bet="The amount to bet",
@@ -114,74 +154,17 @@ class GamesCog(commands.Cog):
         try:
             await interaction.response.defer()
             
-            if self._check_active_game(interaction.user.id):
-                await interaction.followup.send(
-                    embed=EmbedBuilder.error("Active Game", "You already have a game in progress!")
-                )
-                return
-            
             bet_amount = await self._validate_bet(interaction, bet)
             if not bet_amount:
                 return
             
             hard_mode = mode.lower() in ['hard', 'h']
             
-            # Start game
-            self._start_game(interaction.user.id, "blackjack")
-            game = BlackjackGame(bet_amount, hard_mode)
-            
-            # Show initial game state
-            embed = game.get_game_embed()
-            message = await interaction.followup.send(embed=embed)
-            
-            # If game is over (blackjack), process result
-            if game.game_over:
-                await self._process_game_result(interaction, "blackjack", bet_amount, game.payout, embed)
-                return
-            
-            # Add reactions for hit/stand
-            await message.add_reaction('🎯')  # Hit
-            await message.add_reaction('✋')   # Stand
-            
-            # Wait for user reaction
-            def check(reaction, user):
-                return (user.id == interaction.user.id and 
-                       reaction.message.id == message.id and
-                       str(reaction.emoji) in ['🎯', '✋'])
-            
-            while not game.game_over:
-                try:
-                    reaction, user = await self.bot.wait_for('reaction_add', timeout=60.0, check=check)
-                    
-                    if str(reaction.emoji) == '🎯':
-                        # Hit
-                        game.hit()
-                    elif str(reaction.emoji) == '✋':
-                        # Stand
-                        game.stand()
-                    
-                    # Update embed
-                    embed = game.get_game_embed()
-                    await message.edit(embed=embed)
-                    
-                    # Remove user's reaction
-                    try:
-                        await message.remove_reaction(reaction.emoji, user)
-                    except:
-                        pass
-                    
-                except asyncio.TimeoutError:
-                    # Auto-stand on timeout
-                    game.stand()
-                    embed = game.get_game_embed()
-                    await message.edit(embed=embed)
-                    break
-            
-            # Process final result
-            await self._process_game_result(interaction, "blackjack", bet_amount, game.payout, embed)
+            # Take a seat at this channel's next table and wait for it to settle
+            await self.blackjack_tables.join(interaction, bet_amount, hard_mode)
             
         except Exception as e:
-            self._end_game(interaction.user.id)
+            await self._refund_bet(interaction)
             await interaction.followup.send(
                 embed=EmbedBuilder.error("Error", f"Game error: {str(e)}")
             )
@@ -196,12 +179,6 @@ class GamesCog(commands.Cog):
         try:
             await interaction.response.defer()
             
-            if self._check_active_game(interaction.user.id):
-                await interaction.followup.send(
-                    embed=EmbedBuilder.error("Active Game", "You already have a game in progress!")
-                )
-                return
-            
             if not validate_prediction("coinflip", prediction):
                 await interaction.followup.send(
                     embed=EmbedBuilder.error("Invalid Prediction", "Choose 'heads' or 'tails'!")
@@ -213,15 +190,15 @@ class GamesCog(commands.Cog):
                 return
             
             # Play game
-            self._start_game(interaction.user.id, "coinflip")
-            game = CoinflipGame(prediction, bet_amount)
+            rng = self.bot.rng.stream()
+            game = CoinflipGame(prediction, bet_amount, rng)
             
             embed = game.get_result_embed()
-            await self._process_game_result(interaction, "coinflip", bet_amount, game.payout, embed)
+            await self._process_game_result(interaction, "coinflip", bet_amount, game.payout, embed, rng=rng)
             await interaction.followup.send(embed=embed)
             
         except Exception as e:
-            self._end_game(interaction.user.id)
+            await self._refund_bet(interaction)
             await interaction.followup.send(
                 embed=EmbedBuilder.error("Error", f"Game error: {str(e)}")
             )
@@ -237,12 +214,6 @@ class GamesCog(commands.Cog):
         try:
             await interaction.response.defer()
             
-            if self._check_active_game(interaction.user.id):
-                await interaction.followup.send(
-                    embed=EmbedBuilder.error("Active Game", "You already have a game in progress!")
-                )
-                return
-            
             valid_dice = ['d4', 'd6', 'd8', 'd10', 'd12', 'd20']
             if dice_type.lower() not in valid_dice:
                 await interaction.followup.send(
@@ -255,87 +226,111 @@ class GamesCog(commands.Cog):
                 return
             
             # Play game
-            self._start_game(interaction.user.id, "roll")
-            game = DiceGame(dice_type, prediction, bet_amount)
+            rng = self.bot.rng.stream()
+            game = DiceGame(dice_type, prediction, bet_amount, rng)
             
             if not game.dice_max:
                 await interaction.followup.send(
                     embed=EmbedBuilder.error("Error", "Invalid dice type!")
                 )
-                self._end_game(interaction.user.id)
+                await self._refund_bet(interaction)
                 return
             
             embed = game.get_result_embed()
-            await self._process_game_result(interaction, "roll", bet_amount, game.payout, embed)
+            await self._process_game_result(interaction, "roll", bet_amount, game.payout, embed, rng=rng)
             await interaction.followup.send(embed=embed)
             
         except Exception as e:
-            self._end_game(interaction.user.id)
+            await self._refund_bet(interaction)
             await interaction.followup.send(
                 embed=EmbedBuilder.error("Error", f"Game error: {str(e)}")
             )
     
     @app_commands.command(name="slots", description="Try your luck in the slots!")
-    @app_commands.describe(bet="The amount to bet")
-    async def slots(self, interaction: discord.Interaction, bet: str):
+    @app_commands.describe(
+        bet="The amount to bet on each spin",
+        times="How many spins to play at once (default: 1)"
+    )
+    async def slots(self, interaction: discord.Interaction, bet: str, times: int = 1):
         """Play Slots."""
         try:
             await interaction.response.defer()
             
-            if self._check_active_game(interaction.user.id):
+            if not 1 <= times <= Config.SLOTS_MAX_SPINS:
                 await interaction.followup.send(
-                    embed=EmbedBuilder.error("Active Game", "You already have a game in progress!")
+                    embed=EmbedBuilder.error("Invalid Spins", f"You can play 1 to {Config.SLOTS_MAX_SPINS} spins at once!")
                 )
                 return
             
-            bet_amount = await self._validate_bet(interaction, bet)
+            bet_amount = await self._validate_bet(interaction, bet, times)
             if not bet_amount:
                 return
             
-            # Play game
-            self._start_game(interaction.user.id, "slots")
-            game = SlotsGame(bet_amount)
+            # Play game; every spin settles in a single write
+            rng = self.bot.rng.stream()
+            game = SlotsGame(bet_amount, rng, times)
             
             embed = game.get_result_embed()
-            await self._process_game_result(interaction, "slots", bet_amount, game.payout, embed)
+            await self._process_game_result(interaction, "slots", bet_amount * times, game.payout, embed, rng=rng)
             await interaction.followup.send(embed=embed)
             
         except Exception as e:
-            self._end_game(interaction.user.id)
+            await self._refund_bet(interaction)
             await interaction.followup.send(
                 embed=EmbedBuilder.error("Error", f"Game error: {str(e)}")
             )
     
     @app_commands.command(name="roulette", description="Play a game of roulette!")
     @app_commands.describe(
-        prediction="What roulette bet you'd like to place",
-        bet="The amount to bet"
+        prediction="What roulette bet you'd like to place (separate several bets with spaces)",
+        bet="The amount to bet on each prediction"
     )
     async def roulette(self, interaction: discord.Interaction, prediction: str, bet: str):
         """Play Roulette."""
         try:
             await interaction.response.defer()
             
-            if self._check_active_game(interaction.user.id):
+            predictions = prediction.split()
+            if not 1 <= len(predictions) <= Config.ROULETTE_MAX_BETS:
                 await interaction.followup.send(
-                    embed=EmbedBuilder.error("Active Game", "You already have a game in progress!")
+                    embed=EmbedBuilder.error("Invalid Bets", f"Place 1 to {Config.ROULETTE_MAX_BETS} bets at once!")
                 )
                 return
             
-            bet_amount = await self._validate_bet(interaction, bet)
+            invalid = [p for p in predictions if not compile_roulette_bet(p).mask]
+            if invalid:
+                await interaction.followup.send(
+                    embed=EmbedBuilder.error("Invalid Prediction", f"Can't bet on: {', '.join(invalid)}")
+                )
+                return
+            
+            bet_amount = await self._validate_bet(interaction, bet, len(predictions))
             if not bet_amount:
                 return
             
-            # Play game
-            self._start_game(interaction.user.id, "roulette")
-            game = RouletteGame(prediction, bet_amount)
+            # Join the channel's table and wait for its shared spin
+            table = self.roulette_engine.join(interaction.channel_id)
+            loop = asyncio.get_running_loop()
+            await interaction.followup.send(
+                embed=EmbedBuilder.info(
+                    "🎡 Bets Placed",
+                    f"Your bets on **{' '.join(predictions)}** are in! "
+                    f"The wheel spins in {max(0, round(table.spins_at - loop.time()))}s."
+                )
+            )
+            pocket = await table.wait()
+            
+            # The whole slip settles in one write
+            game = RouletteGame(predictions, bet_amount, pocket)
             
             embed = game.get_result_embed()
-            await self._process_game_result(interaction, "roulette", bet_amount, game.payout, embed)
+            await self._process_game_result(
+                interaction, "roulette", bet_amount * len(predictions), game.payout, embed, rng=table.rng
+            )
             await interaction.followup.send(embed=embed)
             
         except Exception as e:
-            self._end_game(interaction.user.id)
+            await self._refund_bet(interaction)
             await interaction.followup.send(
                 embed=EmbedBuilder.error("Error", f"Game error: {str(e)}")
             )
@@ -350,29 +345,19 @@ class GamesCog(commands.Cog):
         try:
             await interaction.response.defer()
             
-            if self._check_active_game(interaction.user.id):
-                await interaction.followup.send(
-                    embed=EmbedBuilder.error("Active Game", "You already have a game in progress!")
-                )
-                return
-            
             bet_amount = await self._validate_bet(interaction, bet)
             if not bet_amount:
                 return
             
             hard_mode = mode.lower() in ['hard', 'h']
             
-            # Start game
-            self._start_game(interaction.user.id, "crash")
-            game = CrashGame(bet_amount, hard_mode)
+            # Join this channel's next round and wait for it to finish
+            result = await self.crash_engine.join(interaction, bet_amount, hard_mode)
             
-            # Start the interactive game
-            result = await game.start_game(interaction)
-            
-            await self._process_game_result(interaction, "crash", bet_amount, result['payout'], None)
+            await self._process_game_result(interaction, "crash", bet_amount, result['payout'], None, rng=result['rng'])
             
         except Exception as e:
-            self._end_game(interaction.user.id)
+            await self._refund_bet(interaction)
             await interaction.followup.send(
                 embed=EmbedBuilder.error("Error", f"Game error: {str(e)}")
             )
@@ -387,12 +372,6 @@ class GamesCog(commands.Cog):
         try:
             await interaction.response.defer()
             
-            if self._check_active_game(interaction.user.id):
-                await interaction.followup.send(
-                    embed=EmbedBuilder.error("Active Game", "You already have a game in progress!")
-                )
-                return
-            
             bet_amount = await self._validate_bet(interaction, bet)
             if not bet_amount:
                 return
@@ -400,16 +379,15 @@ class GamesCog(commands.Cog):
             hard_mode = mode.lower() in ['hard', 'h']
             
             # Start game
-            self._start_game(interaction.user.id, "findthelady")
-            game = FindTheLadyGame(bet_amount, hard_mode)
+            game = FindTheLadyGame(bet_amount, hard_mode, self.bot.rng.stream())
             
             # Start the interactive game
             result = await game.start_game(interaction)
             
-            await self._process_game_result(interaction, "findthelady", bet_amount, result['payout'], None)
+            await self._process_game_result(interaction, "findthelady", bet_amount, result['payout'], None, rng=game.rng)
             
         except Exception as e:
-            self._end_game(interaction.user.id)
+            await self._refund_bet(interaction)
             await interaction.followup.send(
                 embed=EmbedBuilder.error("Error", f"Game error: {str(e)}")
             )
@@ -424,12 +402,6 @@ class GamesCog(commands.Cog):
         try:
             await interaction.response.defer()
             
-            if self._check_active_game(interaction.user.id):
-                await interaction.followup.send(
-                    embed=EmbedBuilder.error("Active Game", "You already have a game in progress!")
-                )
-                return
-            
             if not validate_prediction("rps", selection):
                 await interaction.followup.send(
                     embed=EmbedBuilder.error("Invalid Selection", "Choose 'rock', 'paper', or 'scissors'!")
@@ -441,15 +413,15 @@ class GamesCog(commands.Cog):
                 return
             
             # Play game
-            self._start_game(interaction.user.id, "rps")
-            game = RockPaperScissorsGame(selection, bet_amount)
+            rng = self.bot.rng.stream()
+            game = RockPaperScissorsGame(selection, bet_amount, rng)
             
             embed = game.get_result_embed()
-            await self._process_game_result(interaction, "rps", bet_amount, game.payout, embed)
+            await self._process_game_result(interaction, "rps", bet_amount, game.payout, embed, rng=rng)
             await interaction.followup.send(embed=embed)
             
         except Exception as e:
-            self._end_game(interaction.user.id)
+            await self._refund_bet(interaction)
             await interaction.followup.send(
                 embed=EmbedBuilder.error("Error", f"Game error: {str(e)}")
             )
@@ -464,12 +436,6 @@ class GamesCog(commands.Cog):
         try:
             await interaction.response.defer()
             
-            if self._check_active_game(interaction.user.id):
-                await interaction.followup.send(
-                    embed=EmbedBuilder.error("Active Game", "You already have a game in progress!")
-                )
-                return
-            
             if not validate_prediction("sevens", prediction):
                 await interaction.followup.send(
                     embed=EmbedBuilder.error("Invalid Prediction", "Choose '7', 'low' (1-6), or 'high' (8-13)!")
@@ -481,15 +447,15 @@ class GamesCog(commands.Cog):
                 return
             
             # Play game
-            self._start_game(interaction.user.id, "sevens")
-            game = SevensGame(prediction, bet_amount)
+            rng = self.bot.rng.stream()
+            game = SevensGame(prediction, bet_amount, rng)
             
             embed = game.get_result_embed()
-            await self._process_game_result(interaction, "sevens", bet_amount, game.payout, embed)
+            await self._process_game_result(interaction, "sevens", bet_amount, game.payout, embed, rng=rng)
             await interaction.followup.send(embed=embed)
             
         except Exception as e:
-            self._end_game(interaction.user.id)
+            await self._refund_bet(interaction)
             await interaction.followup.send(
                 embed=EmbedBuilder.error("Error", f"Game error: {str(e)}")
             )
@@ -500,42 +466,39 @@ class GamesCog(commands.Cog):
         try:
             await interaction.response.defer()
             
-            if self._check_active_game(interaction.user.id):
-                await interaction.followup.send(
-                    embed=EmbedBuilder.error("Active Game", "You already have a game in progress!")
-                )
+            # Start game (no bet required, payout based on score); the payout needs a player row
+            await self.bot.db.ensure_player_exists(interaction.user.id, interaction.guild.id)
+            if not await self._open_session(interaction, 0):
                 return
             
-            # Start game (no bet required, payout based on score)
-            self._start_game(interaction.user.id, "higherorlower")
-            game = HigherOrLowerGame()
-            
-            # Show initial game state
-            embed = game.get_game_embed()
-            message = await interaction.followup.send(embed=embed)
+            game = HigherOrLowerGame(self.bot.rng.stream())
             
-            # Add reactions
-            await message.add_reaction('⬆️')  # Higher
-            await message.add_reaction('⬇️')  # Lower
-            await message.add_reaction('💰')  # Cash out
-            
-            # Game loop
-            def check(reaction, user):
-                return (user.id == interaction.user.id and 
-                       reaction.message.id == message.id and
-                       str(reaction.emoji) in ['⬆️', '⬇️', '💰'])
-            
-            while not game.game_over:
-                try:
-                    reaction, user = await self.bot.wait_for('reaction_add', timeout=60.0, check=check)
+            # Show initial game state with higher/lower/cash out buttons
+            controls = GameControls(
+                interaction.user.id, interaction.id,
+                [('higher', "Higher", '⬆️'), ('lower', "Lower", '⬇️'), ('cashout', "Cash Out", '💰')]
+            )
+            try:
+                embed = game.get_game_embed()
+                message = await interaction.followup.send(embed=embed, view=controls)
+                loop = asyncio.get_running_loop()
+                renewed_at = loop.time()
+                
+                # Game loop; guesses stay in memory until the streak settles
+                while not game.game_over:
+                    action = await controls.next_action(timeout=60.0)
+                    # Keep the session lease from expiring mid-game, renewing at most once per half TTL
+                    if loop.time() - renewed_at > Config.SESSION_TTL / 2:
+                        await self.bot.db.renew_session(interaction.user.id, interaction.guild.id, interaction.id)
+                        renewed_at = loop.time()
                     
-                    if str(reaction.emoji) == '⬆️':
-                        result = game.make_guess('higher')
-                    elif str(reaction.emoji) == '⬇️':
-                        result = game.make_guess('lower')
-                    elif str(reaction.emoji) == '💰':
-                        # Cash out
-                        result = game.cash_out()
+                    if action in ('higher', 'lower'):
+                        result = game.make_guess(action)
+                    else:
+                        # Cash out, or auto cash out on timeout
+                        game.cash_out()
+                        embed = game.get_game_embed()
+                        await controls.update(message, embed, finished=True)
                         break
                     
                     if not result['success']:
@@ -546,43 +509,21 @@ class GamesCog(commands.Cog):
                     
                     # Update embed
                     embed = game.get_game_embed()
-                    await message.edit(embed=embed)
-                    
-                    # Remove user's reaction
-                    try:
-                        await message.remove_reaction(reaction.emoji, user)
-                    except:
-                        pass
+                    await controls.update(message, embed, finished=not result['continue'])
                     
                     if not result['continue']:
                         break
-                    
-                except asyncio.TimeoutError:
-                    # Auto cash out on timeout
-                    game.cash_out()
-                    embed = game.get_game_embed()
-                    await message.edit(embed=embed)
-                    break
+            finally:
+                # Unregister the buttons even if the game loop failed
+                controls.stop()
             
-            # Process final result
-            final_result = game.cash_out() if not game.game_over else {'payout': 100 * game.score, 'xp': 10 * game.score}
-            
-            # Update player cash
-            if final_result['payout'] > 0:
-                await self.bot.db.update_player_cash(
-                    interaction.user.id, interaction.guild.id, final_result['payout']
-                )
-            
-            # Add game stat
-            await self.bot.db.add_game_stat(
-                interaction.user.id, interaction.guild.id, "higherorlower",
-                0, final_result['payout'], f"score_{game.score}"
+            # Settle the whole streak in one write; a wrong guess pays nothing
+            await self._process_game_result(
+                interaction, "higherorlower", 0, game.payout, embed, f"score_{game.score}", game.rng
             )
             
-            self._end_game(interaction.user.id)
-            
         except Exception as e:
-            self._end_game(interaction.user.id)
+            await self._refund_bet(interaction)
             await interaction.followup.send(
                 embed=EmbedBuilder.error("Error", f"Game error: {str(e)}")
             )
@@ -598,40 +539,34 @@ class GamesCog(commands.Cog):
         try:
             await interaction.response.defer()
             
-            if self._check_active_game(interaction.user.id):
-                await interaction.followup.send(
-                    embed=EmbedBuilder.error("Active Game", "You already have a game in progress!")
-                )
-                return
-            
             bet_amount = await self._validate_bet(interaction, bet)
             if not bet_amount:
                 return
             
             # Start game
-            self._start_game(interaction.user.id, "race")
-            game = RaceGame(racer_type, prediction, bet_amount)
+            game = RaceGame(racer_type, prediction, bet_amount, self.bot.rng.stream())
             
             if not game.config:
                 await interaction.followup.send(
                     embed=EmbedBuilder.error("Invalid Racer", "Choose from: turtle/t, dog/d, horse/h, dinosaur/di")
                 )
-                self._end_game(interaction.user.id)
+                await self._refund_bet(interaction)
                 return
             
-            # Start the race
-            result = await game.start_race(interaction)
+            # The outcome is decided before the animation, so the bet settles right away
+            result = game.run()
             
             if result['success']:
-                await self._process_game_result(interaction, "race", bet_amount, result['payout'], None)
+                await self._process_game_result(interaction, "race", bet_amount, result['payout'], None, rng=game.rng)
+                await game.animate(interaction)
             else:
                 await interaction.followup.send(
                     embed=EmbedBuilder.error("Error", result['message'])
                 )
-                self._end_game(interaction.user.id)
+                await self._refund_bet(interaction)
             
         except Exception as e:
-            self._end_game(interaction.user.id)
+            await self._refund_bet(interaction)
             await interaction.followup.send(
                 embed=EmbedBuilder.error("Error", f"Game error: {str(e)}")
             )
@@ -646,22 +581,15 @@ class GamesCog(commands.Cog):
         try:
             await interaction.response.defer()
             
-            if self._check_active_game(interaction.user.id):
-                await interaction.followup.send(
-                    embed=EmbedBuilder.error("Active Game", "You already have a game in progress!")
-                )
-                return
-            
-            # Pick a random game
+            # Pick a random game; the pick is part of the recorded stream too
+            rng = self.bot.rng.stream()
             simple_games = ['coinflip', 'slots', 'rps', 'sevens']
-            chosen_game = random.choice(simple_games)
+            chosen_game = rng.choice(simple_games)
             
             bet_amount = await self._validate_bet(interaction, bet)
             if not bet_amount:
                 return
             
-            self._start_game(interaction.user.id, "gamble")
-            
             embed = EmbedBuilder.info("🎰 Random Gamble", f"Playing random game: **{chosen_game.title()}**!")
             await interaction.followup.send(embed=embed)
             
@@ -670,36 +598,36 @@ class GamesCog(commands.Cog):
             
             # Play the chosen game with random parameters
             if chosen_game == 'coinflip':
-                prediction = random.choice(['heads', 'tails'])
-                game = CoinflipGame(prediction, bet_amount)
+                prediction = rng.choice(['heads', 'tails'])
+                game = CoinflipGame(prediction, bet_amount, rng)
                 embed = game.get_result_embed()
                 payout = game.payout
             
             elif chosen_game == 'slots':
-                game = SlotsGame(bet_amount)
+                game = SlotsGame(bet_amount, rng)
                 embed = game.get_result_embed()
                 payout = game.payout
             
             elif chosen_game == 'rps':
-                selection = random.choice(['rock', 'paper', 'scissors'])
-                game = RockPaperScissorsGame(selection, bet_amount)
+                selection = rng.choice(['rock', 'paper', 'scissors'])
+                game = RockPaperScissorsGame(selection, bet_amount, rng)
                 embed = game.get_result_embed()
                 payout = game.payout
             
             elif chosen_game == 'sevens':
-                prediction = random.choice(['7', 'low', 'high'])
-                game = SevensGame(prediction, bet_amount)
+                prediction = rng.choice(['7', 'low', 'high'])
+                game = SevensGame(prediction, bet_amount, rng)
                 embed = game.get_result_embed()
                 payout = game.payout
             
             # Add random gamble indicator
             embed.title = f"🎰 Random Gamble - {embed.title}"
             
-            await self._process_game_result(interaction, "gamble", bet_amount, payout, embed)
+            await self._process_game_result(interaction, "gamble", bet_amount, payout, embed, rng=rng)
             await interaction.followup.send(embed=embed)
             
         except Exception as e:
-            self._end_game(interaction.user.id)
+            await self._refund_bet(interaction)
             await interaction.followup.send(
                 embed=EmbedBuilder.error("Error", f"Game error: {str(e)}")
             )
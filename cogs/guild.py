@@ -1,7 +1,6 @@
 import discord
 from discord.ext import commands
 from discord import app_commands
-import json
 from typing import List, Optional
 
 from utils.embeds import EmbedBuilder
@@ -67,7 +66,7 @@ class GuildConfigCog(commands.Cog):
             allowed_channels = guild_config.get('allowed_channels', [])
             if allowed_channels:
                 channel_mentions = []
-                for channel_id in allowed_channels:
+                for channel_id in sorted(allowed_channels):
                     channel = interaction.guild.get_channel(channel_id)
                     if channel:
                         channel_mentions.append(channel.mention)
@@ -89,7 +88,7 @@ class GuildConfigCog(commands.Cog):
             admin_ids = guild_config.get('admin_ids', [])
             if admin_ids:
                 admin_mentions = []
-                for user_id in admin_ids:
+                for user_id in sorted(admin_ids):
                     user = interaction.guild.get_member(user_id)
                     if user:
                         admin_mentions.append(user.mention)
@@ -168,12 +167,7 @@ class GuildConfigCog(commands.Cog):
                 description = f"Bot commands are now restricted to:\n{', '.join(channel_mentions)}"
             
             # Update database
-            async with self.bot.db.db.connect() as db:
-                await db.execute(
-                    "UPDATE guild_config SET allowed_channels = ? WHERE guild_id = ?",
-                    (json.dumps(channel_ids), interaction.guild.id)
-                )
-                await db.commit()
+            await self.bot.db.update_guild_config(interaction.guild.id, allowed_channels=channel_ids)
             
             embed = EmbedBuilder.success("Channels Updated", description)
             await interaction.followup.send(embed=embed)
@@ -198,7 +192,7 @@ class GuildConfigCog(commands.Cog):
                 )
                 return
             
-            admin_ids = guild_config.get('admin_ids', [])
+            admin_ids = guild_config.get('admin_ids', frozenset())
             
             if user.id in admin_ids:
                 await interaction.followup.send(
@@ -206,15 +200,10 @@ class GuildConfigCog(commands.Cog):
                 )
                 return
             
-            admin_ids.append(user.id)
+            admin_ids = admin_ids | {user.id}
             
             # Update database
-            async with self.bot.db.db.connect() as db:
-                await db.execute(
-                    "UPDATE guild_config SET admin_ids = ? WHERE guild_id = ?",
-                    (json.dumps(admin_ids), interaction.guild.id)
-                )
-                await db.commit()
+            await self.bot.db.update_guild_config(interaction.guild.id, admin_ids=admin_ids)
             
             embed = EmbedBuilder.success(
                 "Admin Added",
@@ -242,7 +231,7 @@ class GuildConfigCog(commands.Cog):
                 )
                 return
             
-            admin_ids = guild_config.get('admin_ids', [])
+            admin_ids = guild_config.get('admin_ids', frozenset())
             
             if user.id not in admin_ids:
                 await interaction.followup.send(
@@ -250,15 +239,10 @@ class GuildConfigCog(commands.Cog):
                 )
                 return
             
-            admin_ids.remove(user.id)
+            admin_ids = admin_ids - {user.id}
             
             # Update database
-            async with self.bot.db.db.connect() as db:
-                await db.execute(
-                    "UPDATE guild_config SET admin_ids = ? WHERE guild_id = ?",
-                    (json.dumps(admin_ids), interaction.guild.id)
-                )
-                await db.commit()
+            await self.bot.db.update_guild_config(interaction.guild.id, admin_ids=admin_ids)
             
             embed = EmbedBuilder.success(
                 "Admin Removed",
@@ -293,12 +277,7 @@ class GuildConfigCog(commands.Cog):
                 return
             
             # Update database
-            async with self.bot.db.db.connect() as db:
-                await db.execute(
-                    "UPDATE guild_config SET cash_name = ? WHERE guild_id = ?",
-                    (name, interaction.guild.id)
-                )
-                await db.commit()
+            await self.bot.db.update_guild_config(interaction.guild.id, cash_name=name)
             
             embed = EmbedBuilder.success(
                 "Cash Name Updated",
@@ -333,12 +312,7 @@ class GuildConfigCog(commands.Cog):
                 return
             
             # Update database
-            async with self.bot.db.db.connect() as db:
-                await db.execute(
-                    "UPDATE guild_config SET cash_emoji = ? WHERE guild_id = ?",
-                    (emoji, interaction.guild.id)
-                )
-                await db.commit()
+            await self.bot.db.update_guild_config(interaction.guild.id, cash_emoji=emoji)
             
             embed = EmbedBuilder.success(
                 "Cash Emoji Updated",
@@ -373,12 +347,7 @@ class GuildConfigCog(commands.Cog):
                 return
             
             # Update database
-            async with self.bot.db.db.connect() as db:
-                await db.execute(
-                    "UPDATE guild_config SET crypto_name = ? WHERE guild_id = ?",
-                    (name, interaction.guild.id)
-                )
-                await db.commit()
+            await self.bot.db.update_guild_config(interaction.guild.id, crypto_name=name)
             
             embed = EmbedBuilder.success(
                 "Crypto Name Updated",
@@ -413,12 +382,7 @@ class GuildConfigCog(commands.Cog):
                 return
             
             # Update database
-            async with self.bot.db.db.connect() as db:
-                await db.execute(
-                    "UPDATE guild_config SET crypto_emoji = ? WHERE guild_id = ?",
-                    (emoji, interaction.guild.id)
-                )
-                await db.commit()
+            await self.bot.db.update_guild_config(interaction.guild.id, crypto_emoji=emoji)
             
             embed = EmbedBuilder.success(
                 "Crypto Emoji Updated",
@@ -449,12 +413,7 @@ class GuildConfigCog(commands.Cog):
             # Update database (note: enabled=True means disable_update_messages=False)
             disable_updates = not enabled
             
-            async with self.bot.db.db.connect() as db:
-                await db.execute(
-                    "UPDATE guild_config SET disable_update_messages = ? WHERE guild_id = ?",
-                    (disable_updates, interaction.guild.id)
-                )
-                await db.commit()
+            await self.bot.db.update_guild_config(interaction.guild.id, disable_update_messages=disable_updates)
             
             status = "enabled" if enabled else "disabled"
             embed = EmbedBuilder.success(
@@ -3,7 +3,6 @@ from discord.ext import commands, tasks
 from discord import app_commands
 import random
 import asyncio
-import aiosqlite
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any, List
 
@@ -57,48 +56,6 @@ class LotteryCog(commands.Cog):
         """Clean up when cog is unloaded."""
         self.lottery_draw_task.cancel()
     
-    async def _ensure_lottery_table(self):
-        """Ensure lottery table exists."""
-        async with aiosqlite.connect(self.bot.db.db_path) as db:
-            await db.execute('''
-                CREATE TABLE IF NOT EXISTS lottery (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    guild_id INTEGER,
-                    user_id INTEGER,
-                    tickets INTEGER DEFAULT 0,
-                    week_start TEXT,
-                    created_at TEXT DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
-            
-            await db.execute('''
-                CREATE TABLE IF NOT EXISTS lottery_history (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    guild_id INTEGER,
-                    week_start TEXT,
-                    winner_id INTEGER,
-                    winner_tickets INTEGER,
-                    total_tickets INTEGER,
-                    prize_amount INTEGER,
-                    draw_date TEXT,
-                    created_at TEXT DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
-            
-            await db.execute('''
-                CREATE TABLE IF NOT EXISTS weekly_events (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    guild_id INTEGER,
-                    event_type TEXT,
-                    start_date TEXT,
-                    end_date TEXT,
-                    active BOOLEAN DEFAULT TRUE,
-                    created_at TEXT DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
-            
-            await db.commit()
-    
     def _get_week_start(self) -> str:
         """Get the start of the current lottery week (Monday)."""
         now = datetime.now()
@@ -137,13 +94,10 @@ class LotteryCog(commands.Cog):
     async def before_lottery_task(self):
         """Wait until bot is ready before starting the task."""
         await self.bot.wait_until_ready()
-        await self._ensure_lottery_table()
     
     async def _conduct_lottery_draws(self):
         """Conduct lottery draws for all guilds."""
-        await self._ensure_lottery_table()
-        
-        async with aiosqlite.connect(self.bot.db.db_path) as db:
+        async with self.bot.db.reader() as db:
             # Get all guilds with lottery participants
             cursor = await db.execute('''
                 SELECT DISTINCT guild_id FROM lottery 
@@ -151,21 +105,22 @@ class LotteryCog(commands.Cog):
             ''', (self._get_week_start(),))
             
             guild_ids = [row[0] for row in await cursor.fetchall()]
-            
-            for guild_id in guild_ids:
-                await self._draw_lottery_for_guild(guild_id, db)
+        
+        for guild_id in guild_ids:
+            await self._draw_lottery_for_guild(guild_id)
     
-    async def _draw_lottery_for_guild(self, guild_id: int, db):
+    async def _draw_lottery_for_guild(self, guild_id: int):
         """Conduct lottery draw for a specific guild."""
         week_start = self._get_week_start()
         
         # Get all participants and their tickets
-        cursor = await db.execute('''
-            SELECT user_id, tickets FROM lottery 
-            WHERE guild_id = ? AND week_start = ?
-        ''', (guild_id, week_start))
-        
-        participants = await cursor.fetchall()
+        async with self.bot.db.reader() as db:
+            cursor = await db.execute('''
+                SELECT user_id, tickets FROM lottery 
+                WHERE guild_id = ? AND week_start = ?
+            ''', (guild_id, week_start))
+            
+            participants = await cursor.fetchall()
         
         if not participants:
             return
@@ -194,19 +149,20 @@ class LotteryCog(commands.Cog):
         # Award prize to winner
         await self.bot.db.update_player_cash(winner_id, guild_id, prize_amount)
         
-        # Record draw in history
-        await db.execute('''
-            INSERT INTO lottery_history 
-            (guild_id, week_start, winner_id, winner_tickets, total_tickets, prize_amount, draw_date)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        ''', (guild_id, week_start, winner_id, winner_tickets, total_tickets, prize_amount, datetime.now().isoformat()))
-        
-        # Clear current week's tickets
-        await db.execute('''
-            DELETE FROM lottery WHERE guild_id = ? AND week_start = ?
-        ''', (guild_id, week_start))
-        
-        await db.commit()
+        async with self.bot.db.writer() as db:
+            # Record draw in history
+            await db.execute('''
+                INSERT INTO lottery_history 
+                (guild_id, week_start, winner_id, winner_tickets, total_tickets, prize_amount, draw_date)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''', (guild_id, week_start, winner_id, winner_tickets, total_tickets, prize_amount, datetime.now().isoformat()))
+            
+            # Clear current week's tickets
+            await db.execute('''
+                DELETE FROM lottery WHERE guild_id = ? AND week_start = ?
+            ''', (guild_id, week_start))
+            
+            await db.commit()
         
         # Announce winner in guild
         guild = self.bot.get_guild(guild_id)
@@ -250,7 +206,6 @@ class LotteryCog(commands.Cog):
         """Participate in the weekly lottery."""
         try:
             await interaction.response.defer()
-            await self._ensure_lottery_table()
             
             if not tickets:
                 # Show lottery info
@@ -283,7 +238,7 @@ class LotteryCog(commands.Cog):
             # Check current tickets for this week
             week_start = self._get_week_start()
             
-            async with aiosqlite.connect(self.bot.db.db_path) as db:
+            async with self.bot.db.reader() as db:
                 cursor = await db.execute('''
                     SELECT tickets FROM lottery 
                     WHERE user_id = ? AND guild_id = ? AND week_start = ?
@@ -291,32 +246,41 @@ class LotteryCog(commands.Cog):
                 
                 result = await cursor.fetchone()
                 current_tickets = result[0] if result else 0
-                
-                # Check if adding tickets would exceed maximum
-                if current_tickets + tickets_to_buy > self.max_tickets_per_player:
-                    max_can_buy = self.max_tickets_per_player - current_tickets
-                    await interaction.followup.send(
-                        embed=EmbedBuilder.error(
-                            "Too Many Tickets",
-                            f"You can only buy {max_can_buy} more tickets this week! (Current: {current_tickets:,}/1,000)"
-                        )
+            
+            # Check if adding tickets would exceed maximum
+            if current_tickets + tickets_to_buy > self.max_tickets_per_player:
+                max_can_buy = self.max_tickets_per_player - current_tickets
+                await interaction.followup.send(
+                    embed=EmbedBuilder.error(
+                        "Too Many Tickets",
+                        f"You can only buy {max_can_buy} more tickets this week! (Current: {current_tickets:,}/1,000)"
                     )
-                    return
-                
-                # Check if player has enough money
-                total_cost = tickets_to_buy * self.ticket_price
-                if total_cost > player_cash:
-                    await interaction.followup.send(
-                        embed=EmbedBuilder.error(
-                            "Insufficient Funds",
-                            f"You need {format_currency(total_cost)} but only have {format_currency(player_cash)}!"
-                        )
+                )
+                return
+            
+            # Check if player has enough money
+            total_cost = tickets_to_buy * self.ticket_price
+            if total_cost > player_cash:
+                await interaction.followup.send(
+                    embed=EmbedBuilder.error(
+                        "Insufficient Funds",
+                        f"You need {format_currency(total_cost)} but only have {format_currency(player_cash)}!"
                     )
-                    return
-                
-                # Process purchase
-                await self.bot.db.update_player_cash(interaction.user.id, interaction.guild.id, -total_cost)
-                
+                )
+                return
+            
+            # Process purchase, charging only if the player can still cover it
+            balance = await self.bot.db.debit_player_cash(interaction.user.id, interaction.guild.id, total_cost)
+            if balance is None:
+                await interaction.followup.send(
+                    embed=EmbedBuilder.error(
+                        "Insufficient Funds",
+                        f"You need {format_currency(total_cost)} to buy {tickets_to_buy:,} tickets!"
+                    )
+                )
+                return
+            
+            async with self.bot.db.writer() as db:
                 # Update or insert lottery entry
                 if current_tickets > 0:
                     await db.execute('''
@@ -330,31 +294,31 @@ class LotteryCog(commands.Cog):
                     ''', (interaction.guild.id, interaction.user.id, tickets_to_buy, week_start))
                 
                 await db.commit()
-                
-                # Get updated ticket count
-                new_total = current_tickets + tickets_to_buy
-                
-                embed = EmbedBuilder.success(
-                    "🎫 Lottery Tickets Purchased!",
-                    f"You bought {tickets_to_buy:,} tickets for {format_currency(total_cost)}!\n\n"
-                    f"**Your total tickets this week:** {new_total:,}\n"
-                    f"**Remaining tickets you can buy:** {self.max_tickets_per_player - new_total:,}"
-                )
-                
-                embed.add_field(
-                    name="🏆 Next Draw",
-                    value=f"{format_time_remaining(self._get_next_draw_time())}",
-                    inline=True
-                )
-                
-                embed.add_field(
-                    name="💰 Current Prize Pool",
-                    value=await self._get_current_prize_pool(interaction.guild.id),
-                    inline=True
-                )
-                
-                await interaction.followup.send(embed=embed)
-                
+            
+            # Get updated ticket count
+            new_total = current_tickets + tickets_to_buy
+            
+            embed = EmbedBuilder.success(
+                "🎫 Lottery Tickets Purchased!",
+                f"You bought {tickets_to_buy:,} tickets for {format_currency(total_cost)}!\n\n"
+                f"**Your total tickets this week:** {new_total:,}\n"
+                f"**Remaining tickets you can buy:** {self.max_tickets_per_player - new_total:,}"
+            )
+            
+            embed.add_field(
+                name="🏆 Next Draw",
+                value=f"{format_time_remaining(self._get_next_draw_time())}",
+                inline=True
+            )
+            
+            embed.add_field(
+                name="💰 Current Prize Pool",
+                value=await self._get_current_prize_pool(interaction.guild.id),
+                inline=True
+            )
+            
+            await interaction.followup.send(embed=embed)
+            
         except Exception as e:
             await interaction.followup.send(
                 embed=EmbedBuilder.error("Error", f"Failed to process lottery: {str(e)}")
@@ -379,7 +343,7 @@ class LotteryCog(commands.Cog):
         
         # Current week info
         week_start = self._get_week_start()
-        async with aiosqlite.connect(self.bot.db.db_path) as db:
+        async with self.bot.db.reader() as db:
             cursor = await db.execute('''
                 SELECT COUNT(*) as participants, SUM(tickets) as total_tickets
                 FROM lottery WHERE guild_id = ? AND week_start = ?
@@ -420,7 +384,7 @@ class LotteryCog(commands.Cog):
     async def _get_current_prize_pool(self, guild_id: int) -> str:
         """Get current prize pool amount."""
         week_start = self._get_week_start()
-        async with aiosqlite.connect(self.bot.db.db_path) as db:
+        async with self.bot.db.reader() as db:
             cursor = await db.execute('''
                 SELECT SUM(tickets) FROM lottery 
                 WHERE guild_id = ? AND week_start = ?
@@ -437,9 +401,8 @@ class LotteryCog(commands.Cog):
         """View lottery history."""
         try:
             await interaction.response.defer()
-            await self._ensure_lottery_table()
             
-            async with aiosqlite.connect(self.bot.db.db_path) as db:
+            async with self.bot.db.reader() as db:
                 cursor = await db.execute('''
                     SELECT winner_id, winner_tickets, total_tickets, prize_amount, draw_date
                     FROM lottery_history 
@@ -491,10 +454,9 @@ class LotteryCog(commands.Cog):
         """View current weekly events."""
         try:
             await interaction.response.defer()
-            await self._ensure_lottery_table()
             
             # Get active events
-            async with aiosqlite.connect(self.bot.db.db_path) as db:
+            async with self.bot.db.reader() as db:
                 cursor = await db.execute('''
                     SELECT event_type, start_date, end_date FROM weekly_events
                     WHERE guild_id = ? AND active = TRUE AND end_date > ?
@@ -92,10 +92,33 @@ class MiningCog(commands.Cog):
                 'emoji': '🏭'
             }
         }
+        
+        # Dig yield table: what can be dug up, how likely and up to how many at a time.
+        # Diamonds and emeralds come from processing only; unprocessed materials are common.
+        self.dig_items = [item_id for item_id in self.mining_items if item_id not in ['diamond', 'emerald']]
+        self.dig_items.append('unprocessed_materials')
+        self.dig_weights = [self.mining_items[item_id]['rarity'] for item_id in self.dig_items[:-1]]
+        self.dig_weights.append(0.25)
+        self.dig_max_amounts = [2] * (len(self.dig_items) - 1) + [3]
+        
+        # Processing yield: each unprocessed material has a 15% chance of one of these gems
+        self.process_gem_chance = 0.15
+        self.rare_gems = ['diamond', 'emerald', 'lapis', 'redstone']
     
     async def _ensure_mine_exists(self, user_id: int, guild_id: int, mine_name: str = None) -> Dict[str, Any]:
         """Ensure user has a mine and return mine data."""
-        async with self.bot.db.db.connect() as db:
+        async with self.bot.db.reader() as db:
+            cursor = await db.execute(
+                "SELECT * FROM mining WHERE user_id = ? AND guild_id = ?",
+                (user_id, guild_id)
+            )
+            mine = await cursor.fetchone()
+            
+            if mine:
+                columns = [description[0] for description in cursor.description]
+                return dict(zip(columns, mine))
+        
+        async with self.bot.db.writer() as db:
             cursor = await db.execute(
                 "SELECT * FROM mining WHERE user_id = ? AND guild_id = ?",
                 (user_id, guild_id)
@@ -139,7 +162,7 @@ class MiningCog(commands.Cog):
             
             # Update name if provided
             if name:
-                async with self.bot.db.db.connect() as db:
+                async with self.bot.db.writer() as db:
                     await db.execute(
                         "UPDATE mining SET mine_name = ? WHERE user_id = ? AND guild_id = ?",
                         (mine_name, interaction.user.id, interaction.guild.id)
@@ -252,39 +275,27 @@ class MiningCog(commands.Cog):
             mine = await self._ensure_mine_exists(interaction.user.id, interaction.guild.id)
             
             # Generate dig results
+            rng = self.bot.rng.stream()
             results = {}
             total_found = 0
             
-            # Base number of items found (3-8)
-            base_items = random.randint(3, 8)
+            # Base number of items found (3-8), split across the yield table in one draw
+            base_items = rng.randint(3, 8)
+            counts = rng.multinomial(base_items, self.dig_weights)
             
-            for _ in range(base_items):
-                # Weighted random selection based on rarity
-                weights = []
-                items = []
-                
-                for item_id, item_data in self.mining_items.items():
-                    if item_id in ['diamond', 'emerald']:
-                        continue  # These come from processing only
-                    items.append(item_id)
-                    weights.append(item_data['rarity'])
-                
-                # Add unprocessed materials (higher chance)
-                items.append('unprocessed_materials')
-                weights.append(0.25)
-                
-                found_item = random.choices(items, weights=weights)[0]
+            for found_item, count, max_amount in zip(self.dig_items, counts, self.dig_max_amounts):
+                if not count:
+                    continue
                 
-                if found_item == 'unprocessed_materials':
-                    amount = random.randint(1, 3)
-                else:
-                    amount = random.randint(1, 2)
+                # Each find is worth 1 to max_amount, equally likely; count the finds of each size
+                sizes = rng.multinomial(count, [1] * max_amount)
+                amount = sum(size * finds for size, finds in enumerate(sizes, start=1))
                 
-                results[found_item] = results.get(found_item, 0) + amount
+                results[found_item] = amount
                 total_found += amount
             
             # Update database
-            async with self.bot.db.db.connect() as db:
+            async with self.bot.db.writer() as db:
                 update_query = "UPDATE mining SET "
                 update_values = []
                 update_params = []
@@ -358,15 +369,11 @@ class MiningCog(commands.Cog):
                 await interaction.followup.send(embed=embed)
                 return
             
-            # Process materials
-            results = {}
-            
-            for _ in range(um_amount):
-                # 15% chance for rare gems
-                if random.random() < 0.15:
-                    rare_gems = ['diamond', 'emerald', 'lapis', 'redstone']
-                    gem = random.choice(rare_gems)
-                    results[gem] = results.get(gem, 0) + 1
+            # Process materials: how many turn into gems, then which gems, in one draw each
+            rng = self.bot.rng.stream()
+            found = rng.binomialvariate(um_amount, self.process_gem_chance)
+            counts = rng.multinomial(found, [1] * len(self.rare_gems))
+            results = {gem: amount for gem, amount in zip(self.rare_gems, counts) if amount}
             
             if not results:
                 embed = EmbedBuilder.warning(
@@ -376,7 +383,7 @@ class MiningCog(commands.Cog):
                 )
             else:
                 # Update database
-                async with self.bot.db.db.connect() as db:
+                async with self.bot.db.writer() as db:
                     update_values = ["unprocessed_materials = 0"]
                     update_params = []
                     
@@ -495,7 +502,7 @@ class MiningCog(commands.Cog):
                 craft_amount = max(1, int(max_craftable))
             
             # Craft packs
-            async with self.bot.db.db.connect() as db:
+            async with self.bot.db.writer() as db:
                 update_values = []
                 update_params = []
                 
@@ -645,9 +652,14 @@ class MiningCog(commands.Cog):
             unit = self.mining_units[upgrade_id]
             total_cost = unit['price'] * amount
             
-            # Check if player has enough cash
-            player = await self.bot.db.get_player(interaction.user.id, interaction.guild.id)
-            if player['cash'] < total_cost:
+            # Charge the player only if they can cover the full cost
+            balance = await self.bot.db.debit_player_cash(interaction.user.id, interaction.guild.id, total_cost)
+            if balance is None:
+                # Only a failed charge reads the balance; this also creates a new player's row
+                player = await self.bot.db.get_player(interaction.user.id, interaction.guild.id)
+                if player['cash'] >= total_cost:
+                    balance = await self.bot.db.debit_player_cash(interaction.user.id, interaction.guild.id, total_cost)
+            if balance is None:
                 await interaction.followup.send(
                     embed=EmbedBuilder.error(
                         "Insufficient Funds",
@@ -656,9 +668,6 @@ class MiningCog(commands.Cog):
                 )
                 return
             
-            # Process purchase
-            await self.bot.db.update_player_cash(interaction.user.id, interaction.guild.id, -total_cost)
-            
             embed = EmbedBuilder.success(
                 "⚡ Upgrade Purchased!",
                 f"You bought {amount}x {unit['emoji']} **{unit['name']}** for {format_currency(total_cost)}!"
@@ -731,7 +740,7 @@ class MiningCog(commands.Cog):
             # Perform prestige
             crypto_reward = random.randint(5, 15)  # Simplified crypto reward
             
-            async with self.bot.db.db.connect() as db:
+            async with self.bot.db.writer() as db:
                 # Reset materials and increase prestige level
                 await db.execute('''
                     UPDATE mining SET 
@@ -279,8 +279,15 @@ class PlayerCog(commands.Cog):
             tax = int(send_amount * 0.05)
             final_amount = send_amount - tax
             
-            # Transfer money
-            await self.bot.db.update_player_cash(interaction.user.id, interaction.guild.id, -send_amount)
+            # Transfer money, debiting the sender only if they still have it
+            balance = await self.bot.db.debit_player_cash(interaction.user.id, interaction.guild.id, send_amount)
+            if balance is None:
+                await interaction.followup.send(
+                    embed=EmbedBuilder.error("Error", "You don't have enough money!")
+                )
+                return
+            
+            await self.bot.db.get_player(recipient.id, interaction.guild.id)
             await self.bot.db.update_player_cash(recipient.id, interaction.guild.id, final_amount)
             
             embed = EmbedBuilder.success(
@@ -334,11 +341,12 @@ class PlayerCog(commands.Cog):
             # Check various cooldowns
             cooldown_commands = ["daily", "weekly", "monthly", "work", "overtime", "spin"]
             active_cooldowns = []
+            cooldowns, ready = await self.bot.db.get_cooldowns(
+                interaction.user.id, interaction.guild.id, cooldown_commands
+            )
             
             for cmd in cooldown_commands:
-                cooldown = await self.bot.db.check_cooldown(
-                    interaction.user.id, interaction.guild.id, cmd
-                )
+                cooldown = cooldowns.get(cmd)
                 if cooldown:
                     if detailed:
                         time_str = cooldown.strftime("%Y-%m-%d %H:%M:%S UTC")
@@ -350,6 +358,11 @@ class PlayerCog(commands.Cog):
                 embed = EmbedBuilder.info("Cooldowns", "No active cooldowns! 🎉")
             else:
                 embed = EmbedBuilder.info("Active Cooldowns", "\n".join(active_cooldowns))
+                embed.add_field(
+                    name="✅ Ready",
+                    value=", ".join(cmd.title() for cmd in cooldown_commands if cmd in ready) or "Nothing yet",
+                    inline=False
+                )
             
             await interaction.followup.send(embed=embed)
             
@@ -6,6 +6,28 @@ class Config:
     # Bot settings
     BOT_TOKEN = os.getenv("DISCORD_TOKEN")
     DEFAULT_PREFIX = "!"
+    EDIT_RATE = 5  # Message edits allowed per channel...
+    EDIT_PER = 5.0  # ...every this many seconds
+    EDIT_MAX_PENDING = 10  # Messages per channel waiting for an edit before animation frames are dropped
+    RNG_BUFFER_WORDS = 256  # Random words each game stream pre-draws per refill
+    
+    # Database settings
+    DB_PATH = "bot.db"
+    DB_READER_CONNECTIONS = 4  # Pooled read-only connections (plus one writer)
+    DB_STORAGE_PROFILE = "balanced"  # durable, balanced or throughput
+    DB_CHECKPOINT_INTERVAL = 300  # Seconds between WAL checkpoints
+    DB_CHECKPOINT_WAL_BYTES = 32 * 1024 * 1024  # Checkpoint early once the WAL reaches 32 MB
+    SETTLEMENT_BATCHING = True  # Group game settlements into shared transactions
+    SETTLEMENT_BATCH_SIZE = 100  # Flush once this many settlements are queued
+    SETTLEMENT_BATCH_DELAY = 0.005  # Or after 5 ms, whichever comes first
+    PLAYER_CACHE_SIZE = 10000  # Players kept in memory
+    PLAYER_CACHE_TTL = 300  # Seconds before a cached player is re-read from disk
+    COOLDOWN_FLUSH_INTERVAL = 1.0  # Seconds between cooldown write-behind flushes
+    COOLDOWN_SWEEP_INTERVAL = 60  # Seconds between expired cooldown purges
+    SESSION_BACKEND = "sqlite"  # sqlite survives restarts and is shared by shards, memory is per process
+    SESSION_OWNER = os.getenv("SESSION_OWNER", "main")  # Unique per process when running several
+    SESSION_TTL = 300  # Seconds a game session lease lasts without renewal
+    SESSION_SWEEP_INTERVAL = 30  # Seconds between refunds of expired sessions
     
     # Economy settings
     STARTING_CASH = 1000
@@ -39,7 +61,14 @@ class Config:
     # Game settings
     BLACKJACK_EASY_ODDS = 1.5  # 3:2
     BLACKJACK_HARD_ODDS = 2.0  # 2:1
+    BLACKJACK_SEATS = 7  # Players per blackjack table
+    BLACKJACK_BETTING_WINDOW = 5  # Seconds a table takes seats before dealing
+    BLACKJACK_TURN_TIMEOUT = 60  # Seconds seats have to play before open hands stand
     COINFLIP_ODDS = 1.0  # 1:1
+    CRASH_BETTING_WINDOW = 5  # Seconds players have to join a crash round
+    SLOTS_MAX_SPINS = 100  # Spins one /slots command can play and settle at once
+    ROULETTE_BETTING_WINDOW = 5  # Seconds a channel's roulette table takes bets before the shared spin
+    ROULETTE_MAX_BETS = 10  # Bets one /roulette slip can hold
     
     # XP rewards
     GAME_WIN_XP = 100
@@ -1,116 +1,128 @@
-import aiosqlite
 import asyncio
 import json
-from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, List
+from datetime import datetime
+from typing import Optional, Dict, Any, List, Set, Tuple
+
+from config import Config
+from utils.cache import LRUCache
+from utils.cooldowns import CooldownStore
+from utils.migrations import run_migrations
+from utils.pool import ConnectionPool
+from utils.rng import GameRNG
+from utils.sessions import GameSession, SessionRegistry, debit_cash, get_session_backend
+from utils.settlement import Settlement, SettlementQueue, write_settlements
+from utils.storage import CheckpointScheduler, get_storage_profile
 
 class Database:
-    def __init__(self, db_path: str = "bot.db"):
+    def __init__(self, db_path: str = Config.DB_PATH, readers: int = Config.DB_READER_CONNECTIONS,
+                 storage_profile: str = Config.DB_STORAGE_PROFILE,
+                 batch_settlements: bool = Config.SETTLEMENT_BATCHING):
         self.db_path = db_path
+        self.storage_profile = storage_profile
+        self.pool = ConnectionPool(db_path, readers, get_storage_profile(storage_profile))
+        self.checkpointer = CheckpointScheduler(
+            self.pool, Config.DB_CHECKPOINT_INTERVAL, Config.DB_CHECKPOINT_WAL_BYTES
+        )
+        self.batch_settlements = batch_settlements
+        self.settlements = SettlementQueue(
+            self.pool, Config.SETTLEMENT_BATCH_SIZE, Config.SETTLEMENT_BATCH_DELAY,
+            on_commit=self._cache_settlements
+        )
+        # Player rows keyed by (guild_id, user_id), kept in step by the mutators below
+        self.player_cache = LRUCache(Config.PLAYER_CACHE_SIZE, Config.PLAYER_CACHE_TTL)
+        # Decoded guild configs keyed by guild_id, replaced by update_guild_config
+        self.guild_configs: Dict[int, Dict[str, Any]] = {}
+        self.cooldowns = CooldownStore(
+            self.pool, Config.COOLDOWN_FLUSH_INTERVAL, Config.COOLDOWN_SWEEP_INTERVAL
+        )
+        self.sessions = SessionRegistry(
+            self.pool, get_session_backend(Config.SESSION_BACKEND), Config.SESSION_TTL,
+            Config.SESSION_SWEEP_INTERVAL, Config.SESSION_OWNER, on_commit=self._cache_cash_changes
+        )
+    
+    def reader(self):
+        """Check out a pooled read-only connection."""
+        return self.pool.reader()
+    
+    def writer(self):
+        """Check out the pooled writer connection."""
+        return self.pool.writer()
         
     async def initialize(self):
-        """Initialize database tables."""
-        async with aiosqlite.connect(self.db_path) as db:
-            # Players table
-            await db.execute('''
-                CREATE TABLE IF NOT EXISTS players (
-                    user_id INTEGER PRIMARY KEY,
-                    guild_id INTEGER,
-                    cash INTEGER DEFAULT 1000,
-                    level INTEGER DEFAULT 1,
-                    xp INTEGER DEFAULT 0,
-                    total_winnings INTEGER DEFAULT 0,
-                    total_losses INTEGER DEFAULT 0,
-                    games_played INTEGER DEFAULT 0,
-                    daily_last_claimed TEXT,
-                    weekly_last_claimed TEXT,
-                    monthly_last_claimed TEXT,
-                    yearly_last_claimed TEXT,
-                    work_last_used TEXT,
-                    overtime_last_used TEXT,
-                    created_at TEXT DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
-            
-            # Game statistics table
-            await db.execute('''
-                CREATE TABLE IF NOT EXISTS game_stats (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    user_id INTEGER,
-                    guild_id INTEGER,
-                    game_name TEXT,
-                    bet_amount INTEGER,
-                    winnings INTEGER,
-                    result TEXT,
-                    created_at TEXT DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (user_id) REFERENCES players (user_id)
-                )
-            ''')
-            
-            # Player inventory table
-            await db.execute('''
-                CREATE TABLE IF NOT EXISTS inventory (
-                    user_id INTEGER,
-                    guild_id INTEGER,
-                    item_id TEXT,
-                    quantity INTEGER DEFAULT 0,
-                    PRIMARY KEY (user_id, guild_id, item_id),
-                    FOREIGN KEY (user_id) REFERENCES players (user_id)
-                )
-            ''')
-            
-            # Mining system table
-            await db.execute('''
-                CREATE TABLE IF NOT EXISTS mining (
-                    user_id INTEGER PRIMARY KEY,
-                    guild_id INTEGER,
-                    mine_name TEXT,
-                    coal INTEGER DEFAULT 0,
-                    iron INTEGER DEFAULT 0,
-                    gold INTEGER DEFAULT 0,
-                    diamond INTEGER DEFAULT 0,
-                    emerald INTEGER DEFAULT 0,
-                    lapis INTEGER DEFAULT 0,
-                    redstone INTEGER DEFAULT 0,
-                    unprocessed_materials INTEGER DEFAULT 0,
-                    prestige_level INTEGER DEFAULT 0,
-                    last_dig TEXT,
-                    FOREIGN KEY (user_id) REFERENCES players (user_id)
-                )
-            ''')
-            
-            # Guild configuration table
-            await db.execute('''
-                CREATE TABLE IF NOT EXISTS guild_config (
-                    guild_id INTEGER PRIMARY KEY,
-                    prefix TEXT DEFAULT '!',
-                    allowed_channels TEXT,
-                    cash_name TEXT DEFAULT 'coins',
-                    cash_emoji TEXT DEFAULT '🪙',
-                    crypto_name TEXT DEFAULT 'crypto',
-                    crypto_emoji TEXT DEFAULT '💎',
-                    force_commands BOOLEAN DEFAULT FALSE,
-                    disable_update_messages BOOLEAN DEFAULT FALSE,
-                    admin_ids TEXT DEFAULT '[]'
-                )
-            ''')
-            
-            # Cooldowns table
-            await db.execute('''
-                CREATE TABLE IF NOT EXISTS cooldowns (
-                    user_id INTEGER,
-                    guild_id INTEGER,
-                    command_name TEXT,
-                    expires_at TEXT,
-                    PRIMARY KEY (user_id, guild_id, command_name)
+        """Open the connection pool, apply the storage profile and migrate the schema."""
+        await self.pool.open()
+        
+        async with self.pool.writer() as db:
+            await run_migrations(db)
+        
+        await self.cooldowns.load()
+        self.cooldowns.start()
+        await self.sessions.recover()
+        self.sessions.start()
+        self.checkpointer.start()
+        if self.batch_settlements:
+            self.settlements.start()
+    
+    async def close(self):
+        """Stop background tasks and close all pooled connections."""
+        await self.settlements.stop()
+        await self.sessions.stop()
+        await self.cooldowns.stop()
+        await self.checkpointer.stop()
+        await self.pool.close()
+    
+    def stats(self) -> Dict[str, Any]:
+        """Get statistics for the pool, caches and background writers."""
+        return {
+            'pool': self.pool.stats(),
+            'checkpoints': self.checkpointer.stats(),
+            'settlements': self.settlements.stats(),
+            'player_cache': self.player_cache.stats(),
+            'cooldowns': self.cooldowns.stats(),
+            'sessions': self.sessions.stats()
+        }
+    
+    @staticmethod
+    def _add_to_player(player: Dict[str, Any], **deltas: int):
+        """Apply committed column deltas to a cached player row."""
+        for column, delta in deltas.items():
+            player[column] += delta
+    
+    def _cache_settlements(self, settlements: List[Settlement]):
+        """Apply committed settlements to cached player rows."""
+        for settlement in settlements:
+            cash, winnings, losses, _, _ = settlement.player_params()
+            self.player_cache.update(
+                (settlement.guild_id, settlement.user_id),
+                lambda player: self._add_to_player(
+                    player, cash=cash, total_winnings=winnings, total_losses=losses, games_played=1
                 )
-            ''')
-            
-            await db.commit()
+            )
+    
+    def _cache_cash_changes(self, changes: List[Tuple[int, int, int]]):
+        """Apply committed (guild_id, user_id, cash_delta) changes to cached player rows."""
+        for guild_id, user_id, amount in changes:
+            self.player_cache.update((guild_id, user_id), lambda player: self._add_to_player(player, cash=amount))
     
     async def ensure_player_exists(self, user_id: int, guild_id: int) -> Dict[str, Any]:
         """Ensure player exists in database and return player data."""
-        async with aiosqlite.connect(self.db_path) as db:
+        key = (guild_id, user_id)
+        player = self.player_cache.get(key)
+        if player is not None:
+            return dict(player)
+        
+        self.player_cache.begin_load(key)
+        player = None
+        try:
+            player = await self._load_player(user_id, guild_id)
+        finally:
+            self.player_cache.finish_load(key, player)
+        
+        return dict(player)
+    
+    async def _load_player(self, user_id: int, guild_id: int) -> Dict[str, Any]:
+        """Read a player from disk, creating them if needed."""
+        async with self.pool.reader() as db:
             # Check if player exists
             cursor = await db.execute(
                 "SELECT * FROM players WHERE user_id = ? AND guild_id = ?",
@@ -118,6 +130,18 @@ class Database:
             )
             player = await cursor.fetchone()
             
+            if player:
+                columns = [description[0] for description in cursor.description]
+                return dict(zip(columns, player))
+        
+        async with self.pool.writer() as db:
+            # Re-check under the write lock in case a concurrent call created it
+            cursor = await db.execute(
+                "SELECT * FROM players WHERE user_id = ? AND guild_id = ?",
+                (user_id, guild_id)
+            )
+            player = await cursor.fetchone()
+            
             if not player:
                 # Create new player
                 await db.execute('''
@@ -143,26 +167,30 @@ class Database:
     
     async def update_player_cash(self, user_id: int, guild_id: int, amount: int):
         """Update player cash amount."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.pool.writer() as db:
             await db.execute(
                 "UPDATE players SET cash = cash + ? WHERE user_id = ? AND guild_id = ?",
                 (amount, user_id, guild_id)
             )
             await db.commit()
+        
+        self.player_cache.update((guild_id, user_id), lambda player: self._add_to_player(player, cash=amount))
     
     async def set_player_cash(self, user_id: int, guild_id: int, amount: int):
         """Set player cash to specific amount."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.pool.writer() as db:
             await db.execute(
                 "UPDATE players SET cash = ? WHERE user_id = ? AND guild_id = ?",
                 (amount, user_id, guild_id)
             )
             await db.commit()
+        
+        self.player_cache.update((guild_id, user_id), lambda player: player.update(cash=amount))
     
     async def add_game_stat(self, user_id: int, guild_id: int, game_name: str, 
                            bet_amount: int, winnings: int, result: str):
         """Add game statistics."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.pool.writer() as db:
             await db.execute('''
                 INSERT INTO game_stats (user_id, guild_id, game_name, bet_amount, winnings, result)
                 VALUES (?, ?, ?, ?, ?, ?)
@@ -181,62 +209,169 @@ class Database:
                 )
             
             await db.commit()
+        
+        if winnings > 0:
+            totals = {'total_winnings': winnings}
+        else:
+            totals = {'total_losses': bet_amount}
+        self.player_cache.update(
+            (guild_id, user_id), lambda player: self._add_to_player(player, games_played=1, **totals)
+        )
+    
+    async def debit_player_cash(self, user_id: int, guild_id: int, amount: int) -> Optional[int]:
+        """Take amount from player cash if they can afford it, returning the new balance."""
+        async with self.pool.writer() as db:
+            balance = await debit_cash(db, user_id, guild_id, amount)
+            await db.commit()
+        
+        if balance is None:
+            return None
+        
+        self.player_cache.update((guild_id, user_id), lambda player: player.update(cash=balance))
+        return balance
+    
+    async def settle_game(self, user_id: int, guild_id: int, game_name: str,
+                          bet_amount: int, payout: int, result: Optional[str] = None,
+                          rng: Optional[GameRNG] = None):
+        """Apply a game's cash delta and statistics, returning once they are committed."""
+        await self._settle(Settlement(
+            user_id, guild_id, game_name, bet_amount, payout,
+            result or ("win" if payout > 0 else "loss"), **self._rng_audit(rng)
+        ))
+    
+    @staticmethod
+    def _rng_audit(rng: Optional[GameRNG]) -> Dict[str, Optional[int]]:
+        """Seed and draw count recorded with a game decided by rng."""
+        if rng is None:
+            return {}
+        return {'rng_seed': rng.stream_seed, 'rng_draws': rng.draws}
+    
+    async def open_session(self, user_id: int, guild_id: int, game_name: str,
+                           session_id: int, bet_amount: int) -> bool:
+        """Lease the player's game slot and escrow their bet.
+        
+        Returns False if the player cannot cover the bet and raises ValueError if they
+        already have a game running in this guild.
+        """
+        return await self.sessions.open(user_id, guild_id, game_name, session_id, bet_amount)
+    
+    async def renew_session(self, user_id: int, guild_id: int, session_id: int) -> bool:
+        """Keep a long-running game's lease from expiring."""
+        return await self.sessions.renew(user_id, guild_id, session_id)
+    
+    async def cancel_session(self, user_id: int, guild_id: int, session_id: int) -> Optional[GameSession]:
+        """End a game that did not finish, refunding its escrowed bet."""
+        return await self.sessions.cancel(user_id, guild_id, session_id)
+    
+    async def settle_session(self, user_id: int, guild_id: int, session_id: int, game_name: str,
+                             bet_amount: int, payout: int, result: Optional[str] = None,
+                             rng: Optional[GameRNG] = None):
+        """End a finished game and settle it.
+        
+        The lease is dropped in the same transaction as the settlement, so a failed write
+        leaves the bet escrowed for cancel_session or the sweep to refund.
+        """
+        await self.settle_sessions([(user_id, guild_id, session_id, game_name, bet_amount, payout, result)], rng)
+    
+    async def settle_sessions(self, games: List[Tuple[int, int, int, str, int, int, Optional[str]]],
+                              rng: Optional[GameRNG] = None):
+        """End several finished games and settle them in a single transaction.
+        
+        Takes (user_id, guild_id, session_id, game_name, bet_amount, payout, result)
+        tuples, such as every seat at a table decided by the same rng.
+        """
+        async with self.pool.writer() as db:
+            closed = await self.sessions.close_many(db, [(user_id, guild_id, session_id)
+                                                         for user_id, guild_id, session_id, *_ in games])
+            # Bets whose lease expired were already refunded by the sweep
+            settlements = [
+                Settlement(
+                    user_id, guild_id, game_name, bet_amount, payout,
+                    result or ("win" if payout > 0 else "loss"),
+                    escrow=bet_amount if session is not None else 0, **self._rng_audit(rng)
+                )
+                for (user_id, guild_id, _, game_name, bet_amount, payout, result), session in zip(games, closed)
+            ]
+            await write_settlements(db, settlements)
+        
+        self._cache_settlements(settlements)
+    
+    async def _settle(self, settlement: Settlement):
+        """Write a settlement through the batching queue or directly."""
+        if self.batch_settlements:
+            await self.settlements.submit(settlement)
+        else:
+            async with self.pool.writer() as db:
+                await write_settlements(db, [settlement])
+            self._cache_settlements([settlement])
     
     async def check_cooldown(self, user_id: int, guild_id: int, command_name: str) -> Optional[datetime]:
         """Check if command is on cooldown."""
-        async with aiosqlite.connect(self.db_path) as db:
-            cursor = await db.execute(
-                "SELECT expires_at FROM cooldowns WHERE user_id = ? AND guild_id = ? AND command_name = ?",
-                (user_id, guild_id, command_name)
-            )
-            result = await cursor.fetchone()
-            
-            if result:
-                expires_at = datetime.fromisoformat(result[0])
-                if expires_at > datetime.now():
-                    return expires_at
-                else:
-                    # Cooldown expired, remove it
-                    await db.execute(
-                        "DELETE FROM cooldowns WHERE user_id = ? AND guild_id = ? AND command_name = ?",
-                        (user_id, guild_id, command_name)
-                    )
-                    await db.commit()
-            
-            return None
+        expires_at = self.cooldowns.get(user_id, guild_id, command_name)
+        return datetime.fromtimestamp(expires_at) if expires_at else None
+    
+    async def get_cooldowns(self, user_id: int, guild_id: int,
+                            names: List[str]) -> Tuple[Dict[str, datetime], Set[str]]:
+        """Get active cooldowns for the given commands and the set of commands that are ready."""
+        active, ready = self.cooldowns.lookup(user_id, guild_id, names)
+        return {name: datetime.fromtimestamp(expires_at) for name, expires_at in active.items()}, ready
     
     async def set_cooldown(self, user_id: int, guild_id: int, command_name: str, duration_hours: float):
         """Set cooldown for a command."""
-        expires_at = datetime.now() + timedelta(hours=duration_hours)
-        
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute('''
-                INSERT OR REPLACE INTO cooldowns (user_id, guild_id, command_name, expires_at)
-                VALUES (?, ?, ?, ?)
-            ''', (user_id, guild_id, command_name, expires_at.isoformat()))
-            await db.commit()
+        self.cooldowns.set(user_id, guild_id, command_name, duration_hours * 3600)
+    
+    GUILD_CONFIG_COLUMNS = (
+        'prefix', 'allowed_channels', 'cash_name', 'cash_emoji', 'crypto_name',
+        'crypto_emoji', 'force_commands', 'disable_update_messages', 'admin_ids'
+    )
+    
+    @staticmethod
+    def _decode_guild_config(columns: List[str], row) -> Dict[str, Any]:
+        """Decode a guild_config row, parsing the JSON id lists into frozensets."""
+        config = dict(zip(columns, row))
+        config['admin_ids'] = frozenset(json.loads(config['admin_ids'])) if config['admin_ids'] else frozenset()
+        config['allowed_channels'] = frozenset(json.loads(config['allowed_channels'])) if config['allowed_channels'] else frozenset()
+        return config
     
     async def ensure_guild_exists(self, guild_id: int):
         """Ensure guild exists in configuration."""
-        async with aiosqlite.connect(self.db_path) as db:
-            cursor = await db.execute(
-                "SELECT guild_id FROM guild_config WHERE guild_id = ?",
-                (guild_id,)
+        if guild_id in self.guild_configs:
+            return
+        
+        async with self.pool.writer() as db:
+            await db.execute("INSERT OR IGNORE INTO guild_config (guild_id) VALUES (?)", (guild_id,))
+            await db.commit()
+    
+    async def preload_guild_configs(self, guild_ids: List[int]):
+        """Create any missing guild rows and cache every guild's config."""
+        async with self.pool.writer() as db:
+            await db.executemany(
+                "INSERT OR IGNORE INTO guild_config (guild_id) VALUES (?)",
+                [(guild_id,) for guild_id in guild_ids]
             )
-            result = await cursor.fetchone()
+            await db.commit()
             
-            if not result:
-                await db.execute(
-                    "INSERT INTO guild_config (guild_id) VALUES (?)",
-                    (guild_id,)
-                )
-                await db.commit()
+            cursor = await db.execute("SELECT * FROM guild_config")
+            rows = await cursor.fetchall()
+            columns = [description[0] for description in cursor.description]
+        
+        for row in rows:
+            config = self._decode_guild_config(columns, row)
+            self.guild_configs[config['guild_id']] = config
+    
+    def get_cached_guild_config(self, guild_id: int) -> Optional[Dict[str, Any]]:
+        """Get a guild's config from the cache without touching the database."""
+        return self.guild_configs.get(guild_id)
     
     async def get_guild_config(self, guild_id: int) -> Dict[str, Any]:
         """Get guild configuration."""
+        config = self.guild_configs.get(guild_id)
+        if config is not None:
+            return dict(config)
+        
         await self.ensure_guild_exists(guild_id)
         
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.pool.reader() as db:
             cursor = await db.execute(
                 "SELECT * FROM guild_config WHERE guild_id = ?",
                 (guild_id,)
@@ -245,17 +380,42 @@ class Database:
             
             if result:
                 columns = [description[0] for description in cursor.description]
-                config = dict(zip(columns, result))
-                # Parse JSON fields
-                config['admin_ids'] = json.loads(config['admin_ids']) if config['admin_ids'] else []
-                config['allowed_channels'] = json.loads(config['allowed_channels']) if config['allowed_channels'] else []
-                return config
+                config = self._decode_guild_config(columns, result)
+                self.guild_configs[guild_id] = config
+                return dict(config)
             
             return {}
     
+    async def update_guild_config(self, guild_id: int, **fields):
+        """Update guild config columns and refresh the cached config."""
+        for column in fields:
+            if column not in self.GUILD_CONFIG_COLUMNS:
+                raise ValueError(f"Unknown guild config setting '{column}'")
+        
+        values = {
+            column: json.dumps(sorted(value)) if column in ('admin_ids', 'allowed_channels') else value
+            for column, value in fields.items()
+        }
+        assignments = ", ".join(f"{column} = ?" for column in values)
+        
+        await self.ensure_guild_exists(guild_id)
+        async with self.pool.writer() as db:
+            await db.execute(
+                f"UPDATE guild_config SET {assignments} WHERE guild_id = ?",
+                (*values.values(), guild_id)
+            )
+            await db.commit()
+            
+            # Replace the cached config with the committed row
+            cursor = await db.execute("SELECT * FROM guild_config WHERE guild_id = ?", (guild_id,))
+            row = await cursor.fetchone()
+            columns = [description[0] for description in cursor.description]
+        
+        self.guild_configs[guild_id] = self._decode_guild_config(columns, row)
+    
     async def get_leaderboard(self, guild_id: int, stat: str, limit: int = 10) -> List[Dict]:
         """Get leaderboard for a specific stat."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.pool.reader() as db:
             if stat == 'cash':
                 cursor = await db.execute(
                     "SELECT user_id, cash FROM players WHERE guild_id = ? ORDER BY cash DESC LIMIT ?",
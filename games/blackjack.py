@@ -1,78 +1,67 @@
-import random
-from typing import List, Dict, Tuple
+import asyncio
+import math
+from array import array
+from typing import List, Dict, Tuple, Optional, Any, Callable, Awaitable
 import discord
+from config import Config
 from utils.embeds import EmbedBuilder
+from utils.rng import GameRNG
 
-class Card:
-    """Represents a playing card."""
-    
-    def __init__(self, suit: str, rank: str):
-        self.suit = suit
-        self.rank = rank
-    
-    def __str__(self):
-        return f"{self.rank}{self.suit}"
+# Cards are ints 0-51: rank = card % 13 (0 is the ace), suit = card // 13
+SUITS = ['♠', '♥', '♦', '♣']
+RANKS = ['A', '2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K']
+CARD_NAMES = [f"{rank}{suit}" for suit in SUITS for rank in RANKS]
+# Hard value of each card, aces count 1
+CARD_VALUES = [min(rank + 1, 10) for _ in SUITS for rank in range(13)]
+NATURAL_ODDS = 1.5  # Blackjack pays 3:2 in both modes
+
+def showdown(player_hand: 'BlackjackHand', dealer_hand: 'BlackjackHand', hard_mode: bool) -> Tuple[str, float]:
+    """Compare a finished hand with the dealer's, returning (result, payout per unit bet)."""
+    # 2:1 in hard mode, 3:2 in easy mode
+    odds = Config.BLACKJACK_HARD_ODDS if hard_mode else Config.BLACKJACK_EASY_ODDS
+    player_value = player_hand.get_value()
+    dealer_value = dealer_hand.get_value()
     
-    @property
-    def value(self) -> int:
-        """Get numeric value of card."""
-        if self.rank in ['J', 'Q', 'K']:
-            return 10
-        elif self.rank == 'A':
-            return 11  # Ace high by default
-        else:
-            return int(self.rank)
+    if player_hand.is_busted():
+        return "Busted! You lose!", -1
+    if dealer_hand.is_busted():
+        return "Dealer busted! You win!", odds
+    if player_value > dealer_value:
+        return "You win!", odds
+    if player_value == dealer_value:
+        return "Push (tie)!", 0
+    return "Dealer wins!", -1
 
 class BlackjackHand:
-    """Represents a blackjack hand."""
+    """Represents a blackjack hand with a running total."""
+    
+    __slots__ = ('cards', 'hard_total', 'aces')
     
     def __init__(self):
-        self.cards: List[Card] = []
+        self.cards: List[int] = []
+        self.hard_total = 0  # Aces counted as 1
+        self.aces = 0
     
-    def add_card(self, card: Card):
+    def add_card(self, card: int):
         """Add a card to the hand."""
         self.cards.append(card)
+        value = CARD_VALUES[card]
+        self.hard_total += value
+        if value == 1:
+            self.aces += 1
     
     def get_value(self) -> int:
         """Get the best value of the hand."""
-        value = 0
-        aces = 0
-        
-        for card in self.cards:
-            if card.rank == 'A':
-                aces += 1
-                value += 11
-            else:
-                value += card.value
-        
-        # Adjust for aces
-        while value > 21 and aces > 0:
-            value -= 10
-            aces -= 1
-        
-        return value
+        # At most one ace can count as 11 without busting
+        if self.aces and self.hard_total <= 11:
+            return self.hard_total + 10
+        return self.hard_total
     
     def get_soft_value(self) -> Tuple[int, bool]:
         """Get value and whether it's a soft hand (ace counted as 11)."""
-        value = 0
-        aces = 0
-        
-        for card in self.cards:
-            if card.rank == 'A':
-                aces += 1
-                value += 11
-            else:
-                value += card.value
-        
-        # Check if we have a soft hand
-        soft = aces > 0 and value <= 21
-        
-        # Adjust for aces if busted
-        while value > 21 and aces > 0:
-            value -= 10
-            aces -= 1
-        
-        return value, soft
+        if self.aces and self.hard_total <= 11:
+            return self.hard_total + 10, True
+        return self.hard_total, False
     
     def is_blackjack(self) -> bool:
         """Check if hand is blackjack (21 with 2 cards)."""
@@ -80,190 +69,445 @@ class BlackjackHand:
     
     def is_busted(self) -> bool:
         """Check if hand is busted (over 21)."""
-        return self.get_value() > 21
+        return self.hard_total > 21
     
     def __str__(self):
         """String representation of hand."""
-        return " ".join(str(card) for card in self.cards)
+        return " ".join(CARD_NAMES[card] for card in self.cards)
 
-class BlackjackDeck:
-    """Represents a 6-deck shoe for blackjack."""
+class BlackjackShoe:
+    """A multi-deck shoe that persists across games at a table.
     
-    def __init__(self):
-        self.cards: List[Card] = []
-        self.reset()
-    
-    def reset(self):
-        """Reset and shuffle the deck."""
-        self.cards = []
-        suits = ['♠', '♥', '♦', '♣']
-        ranks = ['A', '2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K']
-        
-        # Create 6 decks
-        for _ in range(6):
-            for suit in suits:
-                for rank in ranks:
-                    self.cards.append(Card(suit, rank))
-        
-        random.shuffle(self.cards)
+    The cards live in one byte array that is shuffled in place; dealing moves an
+    index. Once the cut card comes out the shoe is reshuffled before the next game.
+    """
+    
+    def __init__(self, decks: int = 6, cut_card: int = 50, rng: Optional[GameRNG] = None):
+        # The shoe outlives single games, so it shuffles from its own stream
+        self.rng = rng or GameRNG()
+        self.cards = array('B', range(52)) * decks
+        self.cut_card = len(self.cards) - cut_card  # Reshuffle after this many cards
+        self.position = 0
+        self.shuffles = 0
+        self.shuffle()
+    
+    def shuffle(self):
+        """Shuffle every card back into the shoe."""
+        self.rng.shuffle(self.cards)
+        self.position = 0
+        self.shuffles += 1
     
-    def deal_card(self) -> Card:
-        """Deal a card from the deck."""
-        if len(self.cards) < 50:  # Reshuffle when deck gets low
-            self.reset()
-        return self.cards.pop()
+    def start_game(self):
+        """Reshuffle between games once the cut card has been reached."""
+        if self.position >= self.cut_card:
+            self.shuffle()
+    
+    def deal_card(self) -> int:
+        """Deal a card from the shoe."""
+        if self.position >= len(self.cards):
+            self.shuffle()
+        card = self.cards[self.position]
+        self.position += 1
+        return card
 
-class BlackjackGame:
-    """Manages a blackjack game."""
+class BlackjackSeat:
+    """One player's hand at a shared blackjack table."""
+    
+    __slots__ = ('user_id', 'guild_id', 'session_id', 'name', 'bet_amount', 'hand',
+                 'standing', 'result', 'payout', 'future')
     
-    def __init__(self, bet_amount: int, hard_mode: bool = False):
+    def __init__(self, user_id: int, guild_id: int, session_id: int, name: str,
+                 bet_amount: int, future: asyncio.Future):
+        self.user_id = user_id
+        self.guild_id = guild_id
+        self.session_id = session_id
+        self.name = name
         self.bet_amount = bet_amount
-        self.hard_mode = hard_mode
-        self.deck = BlackjackDeck()
-        self.player_hand = BlackjackHand()
-        self.dealer_hand = BlackjackHand()
-        self.game_over = False
+        self.hand = BlackjackHand()
+        self.standing = False
         self.result = ""
         self.payout = 0
+        self.future = future
+    
+    @property
+    def done(self) -> bool:
+        """Whether the seat has no more decisions to make."""
+        return self.standing or self.hand.is_busted() or self.hand.get_value() == 21
+
+class BlackjackTableControls(discord.ui.View):
+    """Hit, stand and hint buttons shared by every seat at a table."""
+    
+    def __init__(self, table: 'BlackjackTable', advisor=None):
+        super().__init__(timeout=None)
+        self.table = table
+        self.advisor = advisor
+        # Hints are easy mode only
+        if table.hard_mode or advisor is None:
+            self.remove_item(self.hint)
+    
+    async def _act(self, interaction: discord.Interaction, action: str):
+        """Apply the pressing player's action; the next frame shows it."""
+        error = self.table.act(interaction.user.id, action)
+        if error:
+            await interaction.response.send_message(error, ephemeral=True)
+        else:
+            await interaction.response.defer()
+    
+    @discord.ui.button(label="Hit", emoji='🎯', style=discord.ButtonStyle.secondary)
+    async def hit(self, interaction: discord.Interaction, button: discord.ui.Button):
+        """Draw a card for the pressing player."""
+        await self._act(interaction, 'hit')
+    
+    @discord.ui.button(label="Stand", emoji='✋', style=discord.ButtonStyle.secondary)
+    async def stand(self, interaction: discord.Interaction, button: discord.ui.Button):
+        """Stand the pressing player's hand."""
+        await self._act(interaction, 'stand')
+    
+    @discord.ui.button(label="Hint", emoji='💡', style=discord.ButtonStyle.secondary)
+    async def hint(self, interaction: discord.Interaction, button: discord.ui.Button):
+        """Show the pressing player the better move for their hand."""
+        seat = self.table.seats.get(interaction.user.id)
+        if seat is None or self.table.state != 'playing' or seat.done:
+            await interaction.response.send_message("You don't have a hand to play!", ephemeral=True)
+            return
         
-        # Deal initial cards
-        self.player_hand.add_card(self.deck.deal_card())
-        self.dealer_hand.add_card(self.deck.deal_card())
-        self.player_hand.add_card(self.deck.deal_card())
-        self.dealer_hand.add_card(self.deck.deal_card())
-        
-        # Check for blackjacks
-        if self.dealer_hand.is_blackjack():
-            self.game_over = True
-            self.result = "Dealer Blackjack - You lose!"
-            self.payout = -self.bet_amount
-        elif self.player_hand.is_blackjack():
-            self.game_over = True
-            self.result = "Blackjack! You win!"
-            self.payout = int(self.bet_amount * 1.5)  # 3:2 payout
-    
-    def hit(self) -> bool:
-        """Player hits (takes another card)."""
-        if self.game_over:
-            return False
+        advice, stand_ev, hit_ev = self.advisor.advise(seat.hand, self.table.dealer_hand.cards[0])
+        await interaction.response.send_message(
+            f"💡 **{advice.title()}**\nExpected return: Hit {hit_ev:+.1%} / Stand {stand_ev:+.1%}",
+            ephemeral=True
+        )
+
+class BlackjackTable:
+    """One round of blackjack shared by every player seated in a channel.
+    
+    Players take seats during the betting window, then every seat plays its own hand
+    against a single dealer hand, which is played once for the whole table.
+    """
+    
+    def __init__(self, key: Tuple[int, bool], hard_mode: bool, shoe: BlackjackShoe,
+                 starts_at: float, max_seats: int, turn_timeout: float, advisor=None):
+        self.key = key
+        self.hard_mode = hard_mode
+        self.shoe = shoe
+        self.starts_at = starts_at
+        self.max_seats = max_seats
+        self.turn_timeout = turn_timeout
+        self.deadline = starts_at + turn_timeout
+        self.state = 'betting'
+        self.seats: Dict[int, BlackjackSeat] = {}
+        self.dealer_hand = BlackjackHand()
+        self.message: Optional[discord.Message] = None
+        self.controls = BlackjackTableControls(self, advisor)
+        # Set when the message is out of date; the engine submits at most one frame per tick
+        self.dirty = False
+    
+    def add_seat(self, user_id: int, guild_id: int, session_id: int, name: str, bet_amount: int) -> BlackjackSeat:
+        """Seat a player while the table is taking bets."""
+        if user_id in self.seats:
+            raise ValueError("You already have a seat at this table!")
+        if len(self.seats) >= self.max_seats:
+            raise ValueError("This table is full! Wait for the next round.")
         
-        self.player_hand.add_card(self.deck.deal_card())
+        seat = BlackjackSeat(user_id, guild_id, session_id, name, bet_amount,
+                             asyncio.get_running_loop().create_future())
+        self.seats[user_id] = seat
+        self.dirty = True
+        return seat
+    
+    def deal(self, now: float):
+        """Close betting and deal two cards to every seat and the dealer."""
+        self.state = 'playing'
+        self.deadline = now + self.turn_timeout
+        self.shoe.start_game()
+        for _ in range(2):
+            for seat in self.seats.values():
+                seat.hand.add_card(self.shoe.deal_card())
+            self.dealer_hand.add_card(self.shoe.deal_card())
         
-        if self.player_hand.is_busted():
-            self.game_over = True
-            self.result = "Busted! You lose!"
-            self.payout = -self.bet_amount
-            return False
+        # A dealer blackjack ends every hand at once, player blackjacks included
+        if self.dealer_hand.is_blackjack():
+            for seat in self.seats.values():
+                seat.standing = True
+        self.dirty = True
+    
+    def act(self, user_id: int, action: str) -> Optional[str]:
+        """Hit or stand a player's hand, returning an error message if they cannot."""
+        seat = self.seats.get(user_id)
+        if seat is None:
+            return "You don't have a seat at this table! Use `/blackjack` to join the next round."
+        if self.state != 'playing' or seat.done:
+            return "You don't have a hand to play!"
         
-        return True
+        if action == 'hit':
+            seat.hand.add_card(self.shoe.deal_card())
+        else:
+            seat.standing = True
+        self.dirty = True
+        return None
     
-    def stand(self):
-        """Player stands (dealer plays)."""
-        if self.game_over:
-            return
+    @property
+    def finished_playing(self) -> bool:
+        """Whether every seat has finished its hand."""
+        return all(seat.done for seat in self.seats.values())
+    
+    def finish(self):
+        """Stand any seat still playing, play the dealer once and settle every seat."""
+        for seat in self.seats.values():
+            seat.standing = True
         
-        # Dealer must hit on 16 and stand on 17
-        while self.dealer_hand.get_value() < 17:
-            self.dealer_hand.add_card(self.deck.deal_card())
+        if self.dealer_hand.is_blackjack():
+            for seat in self.seats.values():
+                seat.result, seat.payout = "Dealer Blackjack - You lose!", -seat.bet_amount
+        else:
+            # The dealer only draws if some hand is still live
+            if any(not seat.hand.is_busted() and not seat.hand.is_blackjack() for seat in self.seats.values()):
+                while self.dealer_hand.get_value() < 17:
+                    self.dealer_hand.add_card(self.shoe.deal_card())
+            
+            for seat in self.seats.values():
+                if seat.hand.is_blackjack():
+                    seat.result, seat.payout = "Blackjack! You win!", int(seat.bet_amount * NATURAL_ODDS)
+                else:
+                    seat.result, odds = showdown(seat.hand, self.dealer_hand, self.hard_mode)
+                    seat.payout = int(seat.bet_amount * odds)
         
-        self.game_over = True
-        self._determine_winner()
+        self.state = 'finished'
+        self.dirty = True
     
-    def _determine_winner(self):
-        """Determine the winner and set result/payout."""
-        player_value = self.player_hand.get_value()
-        dealer_value = self.dealer_hand.get_value()
+    def _seat_line(self, seat: BlackjackSeat) -> str:
+        """Format one seat for the table embed."""
+        line = f"**{seat.name}** ({seat.bet_amount:,}): {str(seat.hand) or '...'}"
+        if seat.hand.cards and not self.hard_mode:
+            line += f" = {seat.hand.get_value()}"
         
-        if self.dealer_hand.is_busted():
-            self.result = "Dealer busted! You win!"
-            if self.hard_mode:
-                self.payout = self.bet_amount * 2  # 2:1 in hard mode
-            else:
-                self.payout = int(self.bet_amount * 1.5)  # 3:2 in easy mode
-        elif player_value > dealer_value:
-            self.result = "You win!"
-            if self.hard_mode:
-                self.payout = self.bet_amount * 2
-            else:
-                self.payout = int(self.bet_amount * 1.5)
-        elif player_value == dealer_value:
-            self.result = "Push (tie)!"
-            self.payout = 0
-        else:
-            self.result = "Dealer wins!"
-            self.payout = -self.bet_amount
+        if self.state == 'finished':
+            line += f"\n{seat.result} {seat.payout:+,}"
+        elif seat.hand.is_busted():
+            line += " 💥"
+        elif seat.done and self.state == 'playing':
+            line += " ✋"
+        return line
     
-    def get_game_embed(self, show_dealer_hole: bool = False) -> discord.Embed:
-        """Get embed showing current game state."""
-        if self.hard_mode:
-            title = "🃏 Blackjack (Hard Mode)"
+    def get_embed(self, now: float) -> discord.Embed:
+        """Get the embed for the table's current state."""
+        title = "🃏 Blackjack Table (Hard Mode)" if self.hard_mode else "🃏 Blackjack Table"
+        
+        if self.state == 'betting':
+            seconds = max(0, math.ceil(self.starts_at - now))
+            description = (
+                f"Dealing in **{seconds}s**! Use `/blackjack` in this channel to take a seat "
+                f"({len(self.seats)}/{self.max_seats})."
+            )
+        elif self.state == 'playing':
+            seconds = max(0, math.ceil(self.deadline - now))
+            description = f"Press 🎯 to **Hit** or ✋ to **Stand**. Hands still open stand in **{seconds}s**."
+            if not self.hard_mode:
+                description += "\nPress 💡 for a **Hint**"
         else:
-            title = "🃏 Blackjack (Easy Mode)"
+            description = "Round over!"
         
-        embed = EmbedBuilder.game_result(title, "")
+        embed = EmbedBuilder.game_result(title, description)
         
-        # Player hand
-        player_value, is_soft = self.player_hand.get_soft_value()
-        if self.hard_mode:
-            player_display = f"Cards: {self.player_hand}"
-        else:
-            if is_soft and player_value != 21:
-                # Show both hard and soft values
-                hard_value = self.player_hand.get_value()
-                if hard_value != player_value:
-                    player_display = f"Cards: {self.player_hand}\nValue: {hard_value} ({player_value})"
-                else:
-                    player_display = f"Cards: {self.player_hand}\nValue: {player_value}"
+        if self.dealer_hand.cards:
+            if self.state == 'finished':
+                dealer_display = str(self.dealer_hand)
+                if not self.hard_mode:
+                    dealer_display += f" = {self.dealer_hand.get_value()}"
             else:
-                player_display = f"Cards: {self.player_hand}\nValue: {player_value}"
+                dealer_display = f"{CARD_NAMES[self.dealer_hand.cards[0]]} ?"
+            embed.add_field(name="🎭 Dealer", value=dealer_display, inline=False)
         
-        embed.add_field(
-            name="👤 Your Hand",
-            value=player_display,
-            inline=False
-        )
+        seats = "\n".join(self._seat_line(seat) for seat in self.seats.values())
+        embed.add_field(name=f"👥 Seats ({len(self.seats)})", value=seats or "No players yet", inline=False)
+        return embed
+
+class BlackjackTableEngine:
+    """Runs shared blackjack tables from a single ticker task.
+    
+    Players in the same channel and mode share a table, its channel's shoe and one
+    message. Each tick deals tables whose betting window closed, finishes tables whose
+    seats are all done or out of time, and submits at most one frame per table, so
+    REST calls and settlements scale with tables rather than players.
+    """
+    
+    def __init__(self, edits, rng, settle: Callable[['BlackjackTable'], Awaitable[None]],
+                 advisor=None, betting_window: float = 5.0, max_seats: int = 7,
+                 turn_timeout: float = 60.0, tick: float = 1.0):
+        self.edits = edits
+        self.rng = rng
+        # Writes every seat's result in one go once a table finishes
+        self.settle = settle
+        self.advisor = advisor
+        self.betting_window = betting_window
+        self.max_seats = max_seats
+        self.turn_timeout = turn_timeout
+        self.tick = tick
+        # One persistent shoe per channel
+        self.shoes: Dict[int, BlackjackShoe] = {}
+        # Tables still taking bets, keyed by (channel_id, hard_mode)
+        self.open_tables: Dict[Tuple[int, bool], BlackjackTable] = {}
+        self.live_tables = set()
+        self._task: Optional[asyncio.Task] = None
         
-        # Dealer hand
-        if show_dealer_hole or self.game_over:
-            dealer_value = self.dealer_hand.get_value()
-            if self.hard_mode:
-                dealer_display = f"Cards: {self.dealer_hand}"
-            else:
-                dealer_display = f"Cards: {self.dealer_hand}\nValue: {dealer_value}"
-        else:
-            # Hide hole card
-            visible_card = str(self.dealer_hand.cards[0])
-            if self.hard_mode:
-                dealer_display = f"Cards: {visible_card} ?"
+        # Engine statistics
+        self.tables = 0
+        self.seats = 0
+        self.ticks = 0
+        self.frames = 0
+    
+    async def join(self, interaction: discord.Interaction, bet_amount: int, hard_mode: bool) -> Dict[str, Any]:
+        """Seat a player at the channel's next table and wait for their settled result."""
+        loop = asyncio.get_running_loop()
+        key = (interaction.channel_id, hard_mode)
+        
+        table = self.open_tables.get(key)
+        new_table = table is None
+        if new_table:
+            shoe = self.shoes.get(interaction.channel_id)
+            if shoe is None:
+                shoe = self.shoes[interaction.channel_id] = BlackjackShoe(rng=self.rng.stream())
+            table = BlackjackTable(key, hard_mode, shoe, loop.time() + self.betting_window,
+                                   self.max_seats, self.turn_timeout, self.advisor)
+        
+        seat = table.add_seat(interaction.user.id, interaction.guild.id, interaction.id,
+                              interaction.user.display_name, bet_amount)
+        if new_table:
+            # Registered before the send so players joining meanwhile share this table
+            self.open_tables[key] = table
+            self.live_tables.add(table)
+        
+        try:
+            if new_table:
+                table.message = await interaction.followup.send(embed=table.get_embed(loop.time()), view=table.controls)
+                table.dirty = False
             else:
-                visible_value = self.dealer_hand.cards[0].value
-                dealer_display = f"Cards: {visible_card} ?\nVisible Value: {visible_value}"
+                await interaction.followup.send(
+                    embed=EmbedBuilder.info(
+                        "🃏 Took a Seat",
+                        f"Your bet of {bet_amount:,} coins is in! "
+                        f"Dealing in {max(0, math.ceil(table.starts_at - loop.time()))}s."
+                    )
+                )
+        except Exception:
+            # Give the seat up so the caller's refund is the only credit for this bet
+            if table.state == 'betting':
+                self._unseat(table, seat)
+                raise
+            # Too late, the hand is already dealt and is settled with the table
         
-        embed.add_field(
-            name="🎭 Dealer Hand",
-            value=dealer_display,
-            inline=False
-        )
+        self.seats += 1
+        if new_table:
+            self.tables += 1
         
-        # Game status
-        if self.game_over:
-            embed.add_field(
-                name="🎯 Result",
-                value=f"{self.result}\nPayout: {self.payout:+,} coins",
-                inline=False
-            )
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        
+        return await seat.future
+    
+    async def stop(self):
+        """Stop the ticker and fail any unsettled seats."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        
+        for table in self.live_tables:
+            self._fail(table, RuntimeError("Blackjack table was shut down"))
+        self.live_tables.clear()
+        self.open_tables.clear()
+    
+    def _unseat(self, table: BlackjackTable, seat: BlackjackSeat):
+        """Take a seat back off a table that is still taking bets, closing the table if it empties."""
+        del table.seats[seat.user_id]
+        table.dirty = True
+        if not table.seats:
+            self._close(table)
+    
+    def _close(self, table: BlackjackTable):
+        """Stop tracking a table."""
+        if self.open_tables.get(table.key) is table:
+            del self.open_tables[table.key]
+        self.live_tables.discard(table)
+        table.controls.stop()
+    
+    def _fail(self, table: BlackjackTable, error: Exception):
+        """Fail every unresolved seat so the players are refunded."""
+        table.controls.stop()
+        for seat in table.seats.values():
+            if not seat.future.done():
+                seat.future.set_exception(error)
+    
+    async def _run(self):
+        """Advance every live table once per tick until none are left."""
+        loop = asyncio.get_running_loop()
+        
+        while self.live_tables:
+            await asyncio.sleep(self.tick)
+            now = loop.time()
+            self.ticks += 1
             
-            if self.payout > 0:
-                embed.color = 0x00ff00  # Green for win
-            elif self.payout < 0:
-                embed.color = 0xff0000  # Red for loss
-            else:
-                embed.color = 0xffff00  # Yellow for push
-        else:
-            embed.add_field(
-                name="🎮 Actions",
-                value="React with 🎯 to **Hit** or ✋ to **Stand**",
-                inline=False
-            )
+            for table in list(self.live_tables):
+                try:
+                    await self._advance(table, now)
+                except Exception as e:
+                    # Fail this table's seats so they are refunded; the others keep ticking
+                    print(f"Blackjack table failed: {e}")
+                    self._close(table)
+                    self._fail(table, e)
+    
+    async def _advance(self, table: BlackjackTable, now: float):
+        """Move one table along and submit its frame."""
+        if table.state == 'betting':
+            table.dirty = True  # Countdown
+            if now >= table.starts_at:
+                if self.open_tables.get(table.key) is table:
+                    del self.open_tables[table.key]
+                table.deal(now)
+        elif table.state == 'playing':
+            table.dirty = True  # Turn timer
+            if table.finished_playing or now >= table.deadline:
+                table.finish()
+                self.live_tables.discard(table)
+                await self._settle(table)
         
-        return embed
+        self._schedule_edit(table, now)
+    
+    async def _settle(self, table: BlackjackTable):
+        """Settle every seat in one write, then hand each player their result."""
+        try:
+            await self.settle(table)
+        except Exception as e:
+            self._fail(table, e)
+            return
+        
+        for seat in table.seats.values():
+            if not seat.future.done():
+                seat.future.set_result({'payout': seat.payout, 'result': seat.result})
+    
+    def _schedule_edit(self, table: BlackjackTable, now: float):
+        """Submit a frame for a changed table; the final frame also removes the buttons."""
+        if not table.dirty or table.message is None:
+            return
+        
+        table.dirty = False
+        finished = table.state == 'finished'
+        self.edits.submit(
+            table.message, final=finished,
+            embed=table.get_embed(now), view=None if finished else table.controls
+        )
+        self.frames += 1
+        if finished:
+            table.controls.stop()
+    
+    def stats(self) -> Dict[str, Any]:
+        """Get blackjack table engine statistics."""
+        return {
+            'live_tables': len(self.live_tables),
+            'tables': self.tables,
+            'seats': self.seats,
+            'ticks': self.ticks,
+            'frames': self.frames
+        }
@@ -0,0 +1,250 @@
+"""Exact dealer probabilities and hit/stand expected values for blackjack.
+
+Models the game as BlackjackTable plays it: a 6-deck shoe, the dealer
+stands on every 17 and checks for blackjack before the player acts, a dealer blackjack
+beats a player blackjack, and the player can only hit or stand. Dealer outcomes are
+computed from the shoe's composition with every dealer draw removed from it, and
+memoized per upcard and cards already out of the shoe.
+
+The hit/stand table for a fresh shoe is shipped in blackjack_odds.json, so hints are a
+dictionary lookup and startup does not recompute it. Loading a table built for other
+rules or odds fails, so regenerate it after changing them or Config.BLACKJACK_* with:
+
+    python -m games.blackjack_odds --write
+"""
+import argparse
+import json
+import os
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Tuple
+
+from config import Config
+from games.blackjack import CARD_VALUES, NATURAL_ODDS, BlackjackHand
+
+TABLE_VERSION = 1
+TABLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'blackjack_odds.json')
+
+DECKS = 6
+RANKS = range(1, 11)  # Card values, 1 is the ace and 10 every ten-valued card
+DEALER_TOTALS = [17, 18, 19, 20, 21]  # Dealer outcomes in order, followed by bust
+MODE_ODDS = {'easy': Config.BLACKJACK_EASY_ODDS, 'hard': Config.BLACKJACK_HARD_ODDS}
+
+Shoe = Tuple[int, ...]  # Cards left of each value, indexed by value - 1
+
+def full_shoe(decks: int = DECKS) -> Shoe:
+    """Card counts of a fresh shoe."""
+    return tuple(4 * decks * (4 if value == 10 else 1) for value in RANKS)
+
+def _remove(shoe: Shoe, value: int) -> Shoe:
+    """Take one card of value out of the shoe."""
+    counts = list(shoe)
+    counts[value - 1] -= 1
+    return tuple(counts)
+
+def _shoe_without(removed: Tuple[int, ...]) -> Shoe:
+    """A fresh shoe minus the given card values."""
+    shoe = full_shoe()
+    for value in removed:
+        shoe = _remove(shoe, value)
+    return shoe
+
+def _hand_value(hard: int, ace: bool) -> int:
+    """Best value of a hand from its hard total."""
+    return hard + 10 if ace and hard <= 11 else hard
+
+def _dealer_draws(shoe: Shoe, hard: int, ace: bool, memo: Dict) -> Tuple[float, ...]:
+    """Distribution of the dealer's final total over DEALER_TOTALS and bust."""
+    value = _hand_value(hard, ace)
+    if hard > 21:
+        return (0.0,) * len(DEALER_TOTALS) + (1.0,)
+    if value >= 17:
+        outcome = [0.0] * (len(DEALER_TOTALS) + 1)
+        outcome[value - 17] = 1.0
+        return tuple(outcome)
+
+    key = (shoe, hard, ace)
+    if key in memo:
+        return memo[key]
+
+    cards = sum(shoe)
+    outcome = [0.0] * (len(DEALER_TOTALS) + 1)
+    for value in RANKS:
+        count = shoe[value - 1]
+        if count:
+            p = count / cards
+            for i, q in enumerate(_dealer_draws(_remove(shoe, value), hard + value, ace or value == 1, memo)):
+                outcome[i] += p * q
+    memo[key] = tuple(outcome)
+    return memo[key]
+
+def _hole_cards(upcard: int, shoe: Shoe) -> List[Tuple[int, float]]:
+    """Possible hole cards and their chances, given the dealer has no blackjack."""
+    # The peek rules out a ten under an ace and an ace under a ten
+    excluded = {1: 10, 10: 1}.get(upcard)
+    cards = sum(shoe) - (shoe[excluded - 1] if excluded else 0)
+    return [(value, shoe[value - 1] / cards) for value in RANKS if value != excluded and shoe[value - 1]]
+
+@lru_cache(maxsize=4096)
+def dealer_outcomes(upcard: int, removed: Tuple[int, ...] = ()) -> Tuple[float, ...]:
+    """Chances of the dealer finishing on 17-21 or busting from upcard.
+
+    removed holds the values of other cards already out of the shoe, sorted, such as
+    the player's hand. Conditioned on the dealer not having blackjack.
+    """
+    shoe = _shoe_without(removed + (upcard,))
+    memo: Dict = {}
+    outcome = [0.0] * (len(DEALER_TOTALS) + 1)
+    for value, p in _hole_cards(upcard, shoe):
+        for i, q in enumerate(_dealer_draws(_remove(shoe, value), upcard + value, upcard == 1 or value == 1, memo)):
+            outcome[i] += p * q
+    return tuple(outcome)
+
+@lru_cache(maxsize=4096)
+def dealer_blackjack_chance(upcard: int, removed: Tuple[int, ...] = ()) -> float:
+    """Chance the dealer's hole card makes blackjack with upcard."""
+    hole = {1: 10, 10: 1}.get(upcard)
+    if hole is None:
+        return 0.0
+    shoe = _shoe_without(removed + (upcard,))
+    return shoe[hole - 1] / sum(shoe)
+
+def stand_ev(total: int, dealer: Tuple[float, ...], odds: float) -> float:
+    """Expected value per unit bet of standing on total."""
+    if total > 21:
+        return -1.0
+    win = dealer[-1] + sum(p for dealer_total, p in zip(DEALER_TOTALS, dealer) if dealer_total < total)
+    lose = sum(p for dealer_total, p in zip(DEALER_TOTALS, dealer) if dealer_total > total)
+    return win * odds - lose
+
+def _player_evs(upcard: int, odds: float, removed: Tuple[int, ...] = ()) -> Dict[Tuple[int, bool], Tuple[float, float]]:
+    """(stand EV, hit EV) for every player hand against upcard, playing on optimally.
+
+    Hands are keyed by (value, soft). The player's later hits are drawn from the shoe
+    as it stood when the hand was dealt.
+    """
+    dealer = dealer_outcomes(upcard, removed)
+    shoe = _shoe_without(removed + (upcard,))
+    cards = sum(shoe)
+    chances = [(value, shoe[value - 1] / cards) for value in RANKS]
+    best: Dict[Tuple[int, bool], float] = {}
+    evs: Dict[Tuple[int, bool], Tuple[float, float]] = {}
+
+    # Highest hard totals first, so every hit lands on a hand that is already solved
+    for hard in range(21, 1, -1):
+        for ace in (True, False):
+            hit = 0.0
+            for value, p in chances:
+                next_hard = hard + value
+                if next_hard > 21:
+                    hit -= p
+                else:
+                    hit += p * best[(next_hard, ace or value == 1)]
+            stand = stand_ev(_hand_value(hard, ace), dealer, odds)
+            best[(hard, ace)] = max(stand, hit)
+            key = (_hand_value(hard, ace), ace and hard <= 11)
+            evs.setdefault(key, (stand, hit))
+    return evs
+
+def build_table() -> Dict[str, Any]:
+    """Compute the shipped table for a fresh shoe."""
+    table: Dict[str, Any] = {
+        'version': TABLE_VERSION,
+        'decks': DECKS,
+        'odds': {'natural': NATURAL_ODDS, **MODE_ODDS},
+        'dealer': {str(upcard): dealer_outcomes(upcard) for upcard in RANKS},
+        'dealer_blackjack': {str(upcard): dealer_blackjack_chance(upcard) for upcard in RANKS}
+    }
+    for mode, odds in MODE_ODDS.items():
+        table[mode] = {
+            str(upcard): {
+                f"{'s' if soft else 'h'}{value}": list(ev)
+                for (value, soft), ev in sorted(_player_evs(upcard, odds).items())
+            }
+            for upcard in RANKS
+        }
+    return table
+
+def _table_matches(table: Dict[str, Any]) -> bool:
+    """Check a loaded table was built for the current rules and odds."""
+    return (
+        table.get('version') == TABLE_VERSION
+        and table.get('decks') == DECKS
+        and table.get('odds') == {'natural': NATURAL_ODDS, **MODE_ODDS}
+    )
+
+def load_table(path: str = TABLE_PATH) -> Dict[str, Any]:
+    """Load the shipped table, refusing one built for other rules or odds."""
+    with open(path) as f:
+        table = json.load(f)
+    if not _table_matches(table):
+        raise RuntimeError(
+            f"{os.path.basename(path)} does not match the current blackjack rules or odds; "
+            "regenerate it with: python -m games.blackjack_odds --write"
+        )
+    return table
+
+class BlackjackAdvisor:
+    """Hit/stand advice for a hand against the dealer's upcard in O(1)."""
+
+    def __init__(self, table: Optional[Dict[str, Any]] = None):
+        table = table or load_table()
+        # (hard_mode, upcard, value, soft) -> (stand EV, hit EV)
+        self.evs: Dict[Tuple[bool, int, int, bool], Tuple[float, float]] = {
+            (mode == 'hard', int(upcard), int(key[1:]), key[0] == 's'): tuple(ev)
+            for mode in MODE_ODDS
+            for upcard, hands in table[mode].items()
+            for key, ev in hands.items()
+        }
+
+    def advise(self, hand: BlackjackHand, dealer_card: int, hard_mode: bool = False) -> Tuple[str, float, float]:
+        """Get ('hit' or 'stand', stand EV, hit EV) per unit bet for a hand."""
+        value, soft = hand.get_soft_value()
+        stand, hit = self.evs[(hard_mode, CARD_VALUES[dealer_card], value, soft)]
+        return ('hit' if hit > stand else 'stand'), stand, hit
+
+def round_ev(hard_mode: bool = False) -> float:
+    """Expected value per unit bet of a whole round with optimal hit/stand play.
+
+    Dealt from a fresh shoe with each card's removal taken into account, so this is
+    the house edge of the odds in Config.BLACKJACK_*, negated.
+    """
+    odds = MODE_ODDS['hard' if hard_mode else 'easy']
+    shoe = full_shoe()
+    cards = sum(shoe)
+    ev = 0.0
+    for upcard in RANKS:
+        p_up = shoe[upcard - 1] / cards
+        after_up = _remove(shoe, upcard)
+        for first in RANKS:
+            p_first = after_up[first - 1] / (cards - 1)
+            after_first = _remove(after_up, first)
+            for second in range(first, 11):
+                # Either order of two different cards
+                p_second = after_first[second - 1] / (cards - 2) * (1 if first == second else 2)
+                removed = (first, second)
+                p_dealer = dealer_blackjack_chance(upcard, removed)
+                if {first, second} == {1, 10}:
+                    hand_ev = NATURAL_ODDS
+                else:
+                    ace = first == 1 or second == 1
+                    stand, hit = _player_evs(upcard, odds, removed)[(_hand_value(first + second, ace), ace and first + second <= 11)]
+                    hand_ev = max(stand, hit)
+                ev += p_up * p_first * p_second * (p_dealer * -1 + (1 - p_dealer) * hand_ev)
+    return ev
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--write', action='store_true', help=f"Rebuild and save {os.path.basename(TABLE_PATH)}")
+    args = parser.parse_args()
+
+    if args.write:
+        with open(TABLE_PATH, 'w') as f:
+            json.dump(build_table(), f, indent=1)
+        print(f"Wrote {TABLE_PATH}")
+
+    for mode, odds in MODE_ODDS.items():
+        ev = round_ev(mode == 'hard')
+        print(f"{mode:<5} wins pay {odds}:1  RTP {1 + ev:.2%}  house edge {-ev:.2%}")
+
+if __name__ == '__main__':
+    main()
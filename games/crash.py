@@ -1,155 +1,354 @@
-import random
+import math
 import asyncio
 import discord
-from discord.ext import commands
+from typing import Optional, Dict, Any, Tuple
 from utils.embeds import EmbedBuilder
+from utils.rng import GameRNG
+from games.outcomes import CRASH_CHANCE, MAX_DURATION, TICK_INTERVAL, MULTIPLIER_STEP
 
-class CrashGame:
-    """Manages a crash game."""
-    
-    def __init__(self, bet_amount: int, hard_mode: bool = False):
+MAX_LISTED_BETS = 15  # Bettors shown on the round message
+
+class CrashBet:
+    """A single player's stake in a crash round."""
+
+    __slots__ = ('user_id', 'name', 'bet_amount', 'cashed_out_at', 'future')
+
+    def __init__(self, user_id: int, name: str, bet_amount: int, future: asyncio.Future):
+        self.user_id = user_id
+        self.name = name
         self.bet_amount = bet_amount
+        self.cashed_out_at: Optional[float] = None
+        self.future = future
+
+    def payout(self) -> int:
+        """Net payout for this bet once the round is over."""
+        if self.cashed_out_at is None:
+            return -self.bet_amount
+        return int(self.bet_amount * self.cashed_out_at) - self.bet_amount
+
+class CrashControls(discord.ui.View):
+    """Cash out button shared by everyone in a round."""
+
+    def __init__(self, crash_round: 'CrashRound'):
+        super().__init__(timeout=None)
+        self.crash_round = crash_round
+
+    @discord.ui.button(label="Cash Out", emoji='🛑', style=discord.ButtonStyle.danger)
+    async def cash_out(self, interaction: discord.Interaction, button: discord.ui.Button):
+        """Cash out the pressing player's bet at the current multiplier."""
+        message = self.crash_round.cash_out(interaction.user.id)
+        await interaction.response.send_message(message, ephemeral=True)
+
+class CrashRound:
+    """One crash round shared by every player who joined it in a channel."""
+
+    def __init__(self, key: Tuple[int, bool], hard_mode: bool, starts_at: float,
+                 rng: Optional[GameRNG] = None):
+        self.key = key
+        # One stream per round; every bettor's result records it
+        self.rng = rng or GameRNG()
         self.hard_mode = hard_mode
+        self.tick_interval = TICK_INTERVAL[hard_mode]
+        self.starts_at = starts_at
+        self.next_tick_at = starts_at
+        self.tick = 0
+        self.crash_tick = self._draw_crash_tick()
         self.multiplier = 1.0
-        self.crashed = False
-        self.cashed_out = False
-        self.game_active = True
-        self.start_time = None
-        self.max_duration = 120  # 2 minutes max
-        
-    async def start_game(self, interaction: discord.Interaction):
-        """Start the crash game."""
-        self.start_time = asyncio.get_event_loop().time()
-        
-        if self.hard_mode:
-            embed = EmbedBuilder.game_result(
-                "💥 Crash Game (Hard Mode)",
-                "Game started! You have 2 minutes to cash out.\n"
-                "React with 🛑 when you want to cash out!\n\n"
-                "**Hard Mode:** Multiplier and crash status are hidden!"
-            )
-        else:
-            embed = EmbedBuilder.game_result(
-                "💥 Crash Game",
-                f"Current multiplier: **{self.multiplier:.2f}x**\n"
-                "React with 🛑 to cash out before it crashes!\n\n"
-                "💡 10% chance to crash on each multiplier increase"
+        self.state = 'betting'
+        self.bets: Dict[int, CrashBet] = {}
+        self.message: Optional[discord.Message] = None
+        self.controls = CrashControls(self)
+        # Set when the message is out of date; the engine submits at most one frame per tick
+        self.dirty = False
+
+    def _draw_crash_tick(self) -> int:
+        """Pre-draw the tick the round crashes on.
+
+        Geometric with p = CRASH_CHANCE, the same odds as rolling for a crash on every
+        tick, capped at MAX_DURATION.
+        """
+        ticks = int(math.log(1.0 - self.rng.random()) / math.log(1.0 - CRASH_CHANCE)) + 1
+        return min(ticks, MAX_DURATION // self.tick_interval)
+
+    def add_bet(self, user_id: int, name: str, bet_amount: int) -> CrashBet:
+        """Add a player's bet while the round is taking bets."""
+        if user_id in self.bets:
+            raise ValueError("You already have a bet in this round!")
+
+        bet = CrashBet(user_id, name, bet_amount, asyncio.get_running_loop().create_future())
+        self.bets[user_id] = bet
+        self.dirty = True
+        return bet
+
+    def cash_out(self, user_id: int) -> str:
+        """Cash out a player's bet, returning a message for them."""
+        bet = self.bets.get(user_id)
+        if bet is None:
+            return "You don't have a bet in this round! Use `/crash` to join the next one."
+        if self.state == 'betting':
+            return "The round hasn't started yet!"
+        if self.state == 'crashed':
+            return "Too late, the round already crashed!"
+        if bet.cashed_out_at is not None:
+            return f"You already cashed out at {bet.cashed_out_at:.2f}x!"
+
+        bet.cashed_out_at = self.multiplier
+        self.dirty = True
+        return f"🛑 Cashed out at **{self.multiplier:.2f}x** for {bet.payout():+,} coins!"
+
+    def start(self):
+        """Close betting and start the multiplier."""
+        self.state = 'running'
+        self.next_tick_at = self.starts_at + self.tick_interval
+        self.dirty = True
+
+    def advance(self) -> bool:
+        """Run one tick, returning True if the round crashed."""
+        self.tick += 1
+        self.next_tick_at += self.tick_interval
+
+        if self.tick >= self.crash_tick:
+            self.state = 'crashed'
+            self.dirty = True
+            return True
+
+        # Increase multiplier
+        self.multiplier += self.rng.uniform(*MULTIPLIER_STEP[self.hard_mode])
+        if not self.hard_mode:
+            self.dirty = True  # Multiplier is hidden in hard mode
+        return False
+
+    def resolve(self):
+        """Resolve every bettor's future with their result."""
+        for bet in self.bets.values():
+            if bet.future.done():
+                continue
+
+            if bet.cashed_out_at is not None:
+                result = {
+                    'won': True,
+                    'payout': bet.payout(),
+                    'multiplier': bet.cashed_out_at,
+                    'result': f"Cashed out at {bet.cashed_out_at:.2f}x",
+                    'rng': self.rng
+                }
+            else:
+                result = {
+                    'won': False,
+                    'payout': bet.payout(),
+                    'multiplier': self.multiplier,
+                    'result': f"Crashed at {self.multiplier:.2f}x",
+                    'rng': self.rng
+                }
+            bet.future.set_result(result)
+
+    def abort(self, error: Exception):
+        """Fail every unresolved bet so the players are refunded."""
+        for bet in self.bets.values():
+            if not bet.future.done():
+                bet.future.set_exception(error)
+
+    def _bets_field(self) -> str:
+        """Format the bettor list for the round embed."""
+        lines = []
+        for bet in list(self.bets.values())[:MAX_LISTED_BETS]:
+            if bet.cashed_out_at is not None:
+                lines.append(f"🛑 **{bet.name}** cashed out at {bet.cashed_out_at:.2f}x ({bet.payout():+,})")
+            elif self.state == 'crashed':
+                lines.append(f"💥 **{bet.name}** lost {bet.bet_amount:,}")
+            else:
+                lines.append(f"🎲 **{bet.name}** bet {bet.bet_amount:,}")
+
+        hidden = len(self.bets) - MAX_LISTED_BETS
+        if hidden > 0:
+            lines.append(f"...and {hidden} more")
+        return "\n".join(lines) or "No bets yet"
+
+    def get_embed(self, now: float) -> discord.Embed:
+        """Get the embed for the round's current state."""
+        title = "💥 Crash Game (Hard Mode)" if self.hard_mode else "💥 Crash Game"
+
+        if self.state == 'betting':
+            seconds = max(0, math.ceil(self.starts_at - now))
+            description = (
+                f"Round starts in **{seconds}s**! Use `/crash` in this channel to join.\n"
+                "Press 🛑 once it starts to cash out before it crashes!"
             )
-        
-        message = await interaction.followup.send(embed=embed)
-        await message.add_reaction('🛑')
-        
-        # Game loop
-        await self._run_game_loop(message, interaction)
-        
-        return self._get_final_result()
-    
-    async def _run_game_loop(self, message: discord.Message, interaction: discord.Interaction):
-        """Run the main game loop."""
-        while self.game_active and not self.crashed and not self.cashed_out:
-            await asyncio.sleep(2 if not self.hard_mode else 1)  # Update every 2 seconds (1 in hard mode)
-            
-            # Check for timeout
-            if asyncio.get_event_loop().time() - self.start_time > self.max_duration:
-                self.crashed = True
-                break
-            
-            # 10% chance to crash
-            if random.random() < 0.1:
-                self.crashed = True
-                break
-            
-            # Increase multiplier
+            color = None
+        elif self.state == 'running':
             if self.hard_mode:
-                self.multiplier += random.uniform(0.1, 0.3)  # Faster in hard mode
+                description = (
+                    "Round in progress! Press 🛑 when you want to cash out!\n\n"
+                    "**Hard Mode:** Multiplier and crash status are hidden!"
+                )
             else:
-                self.multiplier += random.uniform(0.05, 0.15)
-            
-            # Update embed (only in easy mode)
-            if not self.hard_mode:
-                embed = EmbedBuilder.game_result(
-                    "💥 Crash Game",
+                description = (
                     f"Current multiplier: **{self.multiplier:.2f}x**\n"
-                    "React with 🛑 to cash out before it crashes!\n\n"
+                    "Press 🛑 to cash out before it crashes!\n\n"
                     "💡 10% chance to crash on each multiplier increase"
                 )
-                
-                try:
-                    await message.edit(embed=embed)
-                except discord.NotFound:
-                    break
-            
-            # Check for user reaction
-            try:
-                reaction, user = await interaction.client.wait_for(
-                    'reaction_add',
-                    timeout=0.1,
-                    check=lambda r, u: r.message.id == message.id and str(r.emoji) == '🛑' and u.id == interaction.user.id
-                )
-                self.cashed_out = True
-                break
-            except asyncio.TimeoutError:
-                continue
-        
-        # Final update
-        final_embed = self._get_final_embed()
-        try:
-            await message.edit(embed=final_embed)
-        except discord.NotFound:
-            pass
-    
-    def _get_final_result(self) -> dict:
-        """Get the final game result."""
-        if self.cashed_out:
-            payout = int(self.bet_amount * self.multiplier) - self.bet_amount
-            return {
-                'won': True,
-                'payout': payout,
-                'multiplier': self.multiplier,
-                'result': f"Cashed out at {self.multiplier:.2f}x"
-            }
-        else:
-            return {
-                'won': False,
-                'payout': -self.bet_amount,
-                'multiplier': self.multiplier,
-                'result': f"Crashed at {self.multiplier:.2f}x"
-            }
-    
-    def _get_final_embed(self) -> discord.Embed:
-        """Get the final game embed."""
-        if self.cashed_out:
-            title = "🛑 Cashed Out!"
-            payout = int(self.bet_amount * self.multiplier) - self.bet_amount
-            description = f"You cashed out at **{self.multiplier:.2f}x**!\n"
-            description += f"**You won {payout:,} coins!**"
-            color = 0x00ff00
+            color = None
         else:
             title = "💥 CRASHED!"
-            description = f"The game crashed at **{self.multiplier:.2f}x**!\n"
-            description += f"**You lost {self.bet_amount:,} coins!**"
+            description = f"The game crashed at **{self.multiplier:.2f}x**!"
             color = 0xff0000
-        
+
         embed = EmbedBuilder.game_result(title, description, color)
-        
-        embed.add_field(
-            name="🎯 Final Multiplier",
-            value=f"{self.multiplier:.2f}x",
-            inline=True
-        )
-        
-        if self.cashed_out:
-            payout = int(self.bet_amount * self.multiplier) - self.bet_amount
-            embed.add_field(
-                name="💰 Winnings",
-                value=f"+{payout:,} coins",
-                inline=True
-            )
-        else:
-            embed.add_field(
-                name="💸 Loss",
-                value=f"-{self.bet_amount:,} coins",
-                inline=True
-            )
-        
+        embed.add_field(name=f"🎰 Bets ({len(self.bets)})", value=self._bets_field(), inline=False)
         return embed
+
+class CrashEngine:
+    """Drives every live crash round from a single ticker task.
+
+    Players in the same channel and mode share a round. Each tick advances the rounds
+    that are due and submits at most one frame per round to the edit scheduler, so
+    timers, wakeups and REST calls scale with rounds rather than players.
+    """
+
+    def __init__(self, edits, rng, betting_window: float = 5.0, tick: float = 1.0):
+        self.edits = edits
+        self.rng = rng
+        self.betting_window = betting_window
+        self.tick = tick
+        # Rounds still taking bets, keyed by (channel_id, hard_mode)
+        self.open_rounds: Dict[Tuple[int, bool], CrashRound] = {}
+        self.live_rounds = set()
+        self._task: Optional[asyncio.Task] = None
+
+        # Engine statistics
+        self.rounds = 0
+        self.bets = 0
+        self.ticks = 0
+        self.frames = 0
+
+    async def join(self, interaction: discord.Interaction, bet_amount: int, hard_mode: bool) -> Dict[str, Any]:
+        """Add a player to the channel's next round and wait for their result."""
+        loop = asyncio.get_running_loop()
+        key = (interaction.channel_id, hard_mode)
+
+        crash_round = self.open_rounds.get(key)
+        new_round = crash_round is None
+        if new_round:
+            crash_round = CrashRound(key, hard_mode, loop.time() + self.betting_window, self.rng.stream())
+
+        bet = crash_round.add_bet(interaction.user.id, interaction.user.display_name, bet_amount)
+        if new_round:
+            # Registered before the send so players joining meanwhile share this round
+            self.open_rounds[key] = crash_round
+            self.live_rounds.add(crash_round)
+
+        try:
+            if new_round:
+                crash_round.message = await interaction.followup.send(
+                    embed=crash_round.get_embed(loop.time()), view=crash_round.controls
+                )
+                crash_round.dirty = False
+            else:
+                await interaction.followup.send(
+                    embed=EmbedBuilder.info(
+                        "💥 Joined Crash Round",
+                        f"Your bet of {bet_amount:,} coins is in! "
+                        f"The round starts in {max(0, math.ceil(crash_round.starts_at - loop.time()))}s."
+                    )
+                )
+        except Exception:
+            # Take the bet back so the caller's refund is the only credit for it
+            if crash_round.state == 'betting':
+                self._remove_bet(crash_round, bet)
+                raise
+            # Too late, the round is running and the bet is resolved with it
+
+        self.bets += 1
+        if new_round:
+            self.rounds += 1
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+        return await bet.future
+
+    async def stop(self):
+        """Stop the ticker and fail any unfinished bets."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        for crash_round in self.live_rounds:
+            crash_round.abort(RuntimeError("Crash game was shut down"))
+        self.live_rounds.clear()
+        self.open_rounds.clear()
+
+    def _remove_bet(self, crash_round: CrashRound, bet: CrashBet):
+        """Take a bet back off a round that is still taking bets, closing the round if it empties."""
+        del crash_round.bets[bet.user_id]
+        crash_round.dirty = True
+        if not crash_round.bets:
+            self._close(crash_round)
+
+    def _close(self, crash_round: CrashRound):
+        """Stop tracking a round."""
+        if self.open_rounds.get(crash_round.key) is crash_round:
+            del self.open_rounds[crash_round.key]
+        self.live_rounds.discard(crash_round)
+        crash_round.controls.stop()
+
+    async def _run(self):
+        """Advance every due round once per tick until none are left."""
+        loop = asyncio.get_running_loop()
+
+        while self.live_rounds:
+            await asyncio.sleep(self.tick)
+            now = loop.time()
+            self.ticks += 1
+
+            for crash_round in list(self.live_rounds):
+                try:
+                    self._advance(crash_round, now)
+                except Exception as e:
+                    # Fail this round's bets so they are refunded; the others keep ticking
+                    print(f"Crash round failed: {e}")
+                    self._close(crash_round)
+                    crash_round.abort(e)
+
+    def _advance(self, crash_round: CrashRound, now: float):
+        """Move one round along and submit its frame."""
+        if crash_round.state == 'betting':
+            crash_round.dirty = True  # Countdown
+            if now >= crash_round.starts_at:
+                if self.open_rounds.get(crash_round.key) is crash_round:
+                    del self.open_rounds[crash_round.key]
+                crash_round.start()
+        elif now >= crash_round.next_tick_at and crash_round.advance():
+            crash_round.resolve()
+            self.live_rounds.discard(crash_round)
+
+        self._schedule_edit(crash_round, now)
+
+    def _schedule_edit(self, crash_round: CrashRound, now: float):
+        """Submit a frame for a changed round; the final frame also removes the button."""
+        if not crash_round.dirty or crash_round.message is None:
+            return
+
+        crash_round.dirty = False
+        finished = crash_round.state == 'crashed'
+        self.edits.submit(
+            crash_round.message, final=finished,
+            embed=crash_round.get_embed(now), view=None if finished else crash_round.controls
+        )
+        self.frames += 1
+        if finished:
+            crash_round.controls.stop()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get crash engine statistics."""
+        return {
+            'live_rounds': len(self.live_rounds),
+            'rounds': self.rounds,
+            'bets': self.bets,
+            'ticks': self.ticks,
+            'frames': self.frames
+        }
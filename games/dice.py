@@ -1,73 +1,54 @@
-import random
-import re
+from typing import Optional
 import discord
+from games.outcomes import DiceResult, get_dice_max, play_dice
 from utils.embeds import EmbedBuilder
+from utils.rng import GameRNG
 
 class DiceGame:
-    """Manages a dice rolling game."""
+    """Renders a dice roll result."""
     
-    def __init__(self, dice_type: str, prediction: int, bet_amount: int):
-        self.dice_type = dice_type.lower()
-        self.prediction = prediction
-        self.bet_amount = bet_amount
-        self.result = None
-        self.payout = 0
-        self.dice_max = self._get_dice_max()
-        
-        if self.dice_max:
-            self.play()
-    
-    def _get_dice_max(self) -> int:
-        """Get maximum value for dice type."""
-        match = re.match(r'd(\d+)', self.dice_type)
-        if match:
-            return int(match.group(1))
-        return 0
-    
-    def play(self):
-        """Play the dice game."""
-        if not self.dice_max:
-            return
-        
-        self.result = random.randint(1, self.dice_max)
-        
-        if self.result == self.prediction:
-            self.payout = self.bet_amount * (self.dice_max - 1)  # (dice_max):1 odds
-        else:
-            self.payout = -self.bet_amount
+    def __init__(self, dice_type: str, prediction: int, bet_amount: int, rng: Optional[GameRNG] = None):
+        self.dice_max = get_dice_max(dice_type)
+        self.outcome = play_dice(dice_type, prediction, bet_amount, rng)
+        self.payout = self.outcome.payout if self.outcome else 0
     
     def get_result_embed(self) -> discord.Embed:
         """Get embed showing game result."""
-        title = f"🎲 {self.dice_type.upper()} Roll Result"
+        return self.render(self.outcome)
+    
+    @staticmethod
+    def render(outcome: DiceResult) -> discord.Embed:
+        """Build the result embed for a dice roll outcome."""
+        title = f"🎲 {outcome.dice_type.upper()} Roll Result"
         
         # Get dice emoji based on result (for d6)
         dice_emojis = ["", "⚀", "⚁", "⚂", "⚃", "⚄", "⚅"]
-        if self.dice_type == "d6" and 1 <= self.result <= 6:
-            dice_emoji = dice_emojis[self.result]
+        if outcome.dice_type == "d6" and 1 <= outcome.result <= 6:
+            dice_emoji = dice_emojis[outcome.result]
         else:
             dice_emoji = "🎲"
         
-        description = f"The {self.dice_type} landed on: **{self.result}** {dice_emoji}\n"
-        description += f"You predicted: **{self.prediction}**\n\n"
+        description = f"The {outcome.dice_type} landed on: **{outcome.result}** {dice_emoji}\n"
+        description += f"You predicted: **{outcome.prediction}**\n\n"
         
-        if self.payout > 0:
-            description += f"🎉 **You won {self.payout:,} coins!**"
+        if outcome.payout > 0:
+            description += f"🎉 **You won {outcome.payout:,} coins!**"
             color = 0x00ff00
         else:
-            description += f"💔 **You lost {abs(self.payout):,} coins!**"
+            description += f"💔 **You lost {abs(outcome.payout):,} coins!**"
             color = 0xff0000
         
         embed = EmbedBuilder.game_result(title, description, color)
         
         embed.add_field(
             name="💰 Payout",
-            value=f"{self.payout:+,} coins",
+            value=f"{outcome.payout:+,} coins",
             inline=True
         )
         
         embed.add_field(
             name="🎯 Odds",
-            value=f"{self.dice_max}:1",
+            value=f"{outcome.dice_max}:1",
             inline=True
         )
         
@@ -1,17 +1,20 @@
-import random
 import asyncio
+from typing import Optional
 import discord
 from discord.ext import commands
+from utils.controls import GameControls
 from utils.embeds import EmbedBuilder
+from utils.rng import GameRNG
 
 class FindTheLadyGame:
     """Manages a Find the Lady game."""
     
-    def __init__(self, bet_amount: int, hard_mode: bool = False):
+    def __init__(self, bet_amount: int, hard_mode: bool = False, rng: Optional[GameRNG] = None):
         self.bet_amount = bet_amount
         self.hard_mode = hard_mode
         self.num_cards = 5 if hard_mode else 3
-        self.lady_position = random.randint(0, self.num_cards - 1)
+        self.rng = rng or GameRNG()
+        self.lady_position = self.rng.randint(0, self.num_cards - 1)
         self.cards = ['👸' if i == self.lady_position else '👑' for i in range(self.num_cards)]
         self.shuffled = False
         self.game_over = False
@@ -32,42 +35,34 @@ class FindTheLadyGame:
             "🃏 Find the Lady",
             "🔄 **Shuffling cards...** 🔄\n\nWatch carefully!"
         )
-        await message.edit(embed=shuffle_embed)
+        interaction.client.edits.submit(message, embed=shuffle_embed)
         
         # Simulate shuffling
         await asyncio.sleep(2)
         
-        # Show face-down cards and add reactions
-        game_embed = self._get_game_embed()
-        await message.edit(embed=game_embed)
-        
-        # Add number reactions
-        for i in range(self.num_cards):
-            await message.add_reaction(f"{i+1}\u20e3")  # Number emojis
-        
-        # Wait for user selection
+        # Show face-down cards with a button per card
+        controls = GameControls(
+            interaction.user.id, interaction.id,
+            [(str(i), None, f"{i+1}\u20e3") for i in range(self.num_cards)]  # Number emojis
+        )
         try:
-            reaction, user = await interaction.client.wait_for(
-                'reaction_add',
-                timeout=30,
-                check=lambda r, u: (
-                    r.message.id == message.id and 
-                    u.id == interaction.user.id and
-                    str(r.emoji) in [f"{i+1}\u20e3" for i in range(self.num_cards)]
-                )
-            )
+            game_embed = self._get_game_embed()
+            await interaction.client.edits.submit(message, final=True, embed=game_embed, view=controls)
             
-            # Get selected position
-            selected = int(str(reaction.emoji)[0]) - 1
-            self._process_selection(selected)
+            # Wait for user selection
+            selected = await controls.next_action(timeout=30)
+            if selected is not None:
+                self._process_selection(int(selected))
+            else:
+                self.result = "timeout"
+                self.payout = -self.bet_amount
             
-        except asyncio.TimeoutError:
-            self.result = "timeout"
-            self.payout = -self.bet_amount
-        
-        # Show final result
-        final_embed = self._get_result_embed()
-        await message.edit(embed=final_embed)
+            # Show final result
+            final_embed = self._get_result_embed()
+            await controls.update(message, final_embed, finished=True)
+        finally:
+            # Unregister the buttons even if the game failed
+            controls.stop()
         
         return {
             'won': self.payout > 0,
@@ -99,7 +94,7 @@ class FindTheLadyGame:
         numbers = " ".join([f"{i+1}" for i in range(self.num_cards)])
         
         description = f"Find the lady among the kings!\n\n{face_down_cards}\n{numbers}\n\n"
-        description += "Click the number reaction for the card you think has the lady!"
+        description += "Press the number button for the card you think has the lady!"
         
         embed = EmbedBuilder.game_result(title, description)
         return embed
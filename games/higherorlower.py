@@ -1,49 +1,82 @@
-import random
+from array import array
+from typing import Optional, Dict
 import discord
+from games.blackjack import CARD_NAMES
 from utils.embeds import EmbedBuilder
+from utils.rng import GameRNG
+
+POINT_PAYOUT = 100  # Coins per correct guess
+FULL_SUITS = 0b1111  # Every suit of a rank still in the deck
 
 class HigherOrLowerGame:
-    """Manages a Higher or Lower game."""
+    """Manages a Higher or Lower game.
+    
+    Cards are ints 0-51 as in blackjack, ranked ace low to king high by card % 13.
+    The deck is a histogram of the 13 ranks plus a bitmask of the suits left of each,
+    so a draw and the odds of the next guess never scan the deck.
+    """
     
-    def __init__(self):
-        self.current_card = None
+    def __init__(self, rng: Optional[GameRNG] = None):
+        self.rng = rng or GameRNG()
         self.next_card = None
         self.score = 0
         self.game_over = False
-        self.suits = ['♠', '♥', '♦', '♣']
-        self.ranks = ['A', '2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K']
-        self.deck = self._create_deck()
+        self.busted = False
+        self._new_deck()
         
         # Draw first card
         self.current_card = self._draw_card()
     
-    def _create_deck(self) -> list:
-        """Create a shuffled deck of cards."""
-        deck = []
-        for suit in self.suits:
-            for rank in self.ranks:
-                deck.append({'suit': suit, 'rank': rank, 'value': self._get_card_value(rank)})
-        random.shuffle(deck)
-        return deck
+    def _new_deck(self):
+        """Put all 52 cards back in the deck."""
+        self.ranks_left = array('B', [4] * 13)
+        self.suits_left = array('B', [FULL_SUITS] * 13)
+        self.cards_left = 52
     
-    def _get_card_value(self, rank: str) -> int:
-        """Get numeric value of card rank."""
-        if rank == 'A':
-            return 1
-        elif rank in ['J', 'Q', 'K']:
-            return {'J': 11, 'Q': 12, 'K': 13}[rank]
-        else:
-            return int(rank)
-    
-    def _draw_card(self) -> dict:
+    def _draw_card(self) -> int:
         """Draw a card from the deck."""
-        if len(self.deck) < 2:
-            self.deck = self._create_deck()
-        return self.deck.pop()
+        if self.cards_left < 2:
+            self._new_deck()
+        
+        # Walk the histogram to the drawn card's rank, then to its suit
+        index = self.rng.randrange(self.cards_left)
+        rank = 0
+        while index >= self.ranks_left[rank]:
+            index -= self.ranks_left[rank]
+            rank += 1
+        suits = self.suits_left[rank]
+        for suit in range(4):
+            if suits >> suit & 1:
+                if index == 0:
+                    break
+                index -= 1
+        
+        self.ranks_left[rank] -= 1
+        self.suits_left[rank] &= ~(1 << suit)
+        self.cards_left -= 1
+        return suit * 13 + rank
+    
+    def odds(self) -> Dict[str, float]:
+        """Exact chances that the next card is higher, lower or the same rank."""
+        # A reshuffle happens before the draw once the deck runs this low
+        if self.cards_left < 2:
+            ranks_left, cards_left = [4] * 13, 52
+        else:
+            ranks_left, cards_left = self.ranks_left, self.cards_left
+        
+        rank = self.current_card % 13
+        lower = sum(ranks_left[:rank])
+        same = ranks_left[rank]
+        return {
+            'higher': (cards_left - lower - same) / cards_left,
+            'lower': lower / cards_left,
+            'tie': same / cards_left
+        }
     
-    def _format_card(self, card: dict) -> str:
-        """Format card for display."""
-        return f"{card['rank']}{card['suit']}"
+    @property
+    def payout(self) -> int:
+        """Winnings for the streak, lost on a wrong guess."""
+        return 0 if self.busted else POINT_PAYOUT * self.score
     
     def make_guess(self, guess: str) -> dict:
         """Make a higher/lower guess."""
@@ -62,22 +95,19 @@ class HigherOrLowerGame:
         
         # Draw next card
         self.next_card = self._draw_card()
+        current_rank = self.current_card % 13
+        next_rank = self.next_card % 13
         
-        # Check if guess is correct
-        current_value = self.current_card['value']
-        next_value = self.next_card['value']
-        
-        correct = False
-        if guess == 'higher' and next_value > current_value:
-            correct = True
-        elif guess == 'lower' and next_value < current_value:
-            correct = True
-        elif next_value == current_value:
+        if next_rank == current_rank:
             # Tie - player continues but no point
             correct = True
+        elif guess == 'higher':
+            correct = next_rank > current_rank
+        else:
+            correct = next_rank < current_rank
         
         if correct:
-            if next_value != current_value:  # Only award points for non-ties
+            if next_rank != current_rank:  # Only award points for non-ties
                 self.score += 1
             self.current_card = self.next_card
             self.next_card = None
@@ -90,6 +120,7 @@ class HigherOrLowerGame:
             }
         else:
             self.game_over = True
+            self.busted = True
             return {
                 'success': True,
                 'correct': False,
@@ -102,53 +133,46 @@ class HigherOrLowerGame:
     def cash_out(self) -> dict:
         """Cash out and end the game."""
         self.game_over = True
-        payout = 100 * self.score  # 100 coins per point
-        xp = 10 * self.score  # 10 XP per point
-        
         return {
             'score': self.score,
-            'payout': payout,
-            'xp': xp
+            'payout': self.payout
         }
     
     def get_game_embed(self) -> discord.Embed:
         """Get embed showing current game state."""
         title = "🃏 Higher or Lower"
         
-        description = f"**Current Card:** {self._format_card(self.current_card)}\n"
+        description = f"**Current Card:** {CARD_NAMES[self.current_card]}\n"
         description += f"**Score:** {self.score}\n\n"
         
         if not self.game_over:
+            odds = self.odds()
             description += "Will the next card be **higher** or **lower**?\n"
-            description += "React with ⬆️ for higher, ⬇️ for lower, or 💰 to cash out!"
+            description += f"⬆️ {odds['higher']:.1%} · ⬇️ {odds['lower']:.1%} · 🤝 {odds['tie']:.1%}\n"
+            description += "Press ⬆️ for higher, ⬇️ for lower, or 💰 to cash out!"
         else:
-            if self.next_card:
-                description += f"**Next Card:** {self._format_card(self.next_card)}\n"
+            if self.next_card is not None:
+                description += f"**Next Card:** {CARD_NAMES[self.next_card]}\n"
+            if self.busted:
+                description += "💔 **Wrong guess! Your streak is lost.**\n"
             description += f"**Final Score:** {self.score}\n"
-            description += f"**Payout:** {100 * self.score:,} coins\n"
-            description += f"**XP Earned:** {10 * self.score} XP"
+            description += f"**Payout:** {self.payout:,} coins"
         
-        color = 0x0099ff if not self.game_over else (0x00ff00 if self.score > 0 else 0xff0000)
+        color = 0x0099ff if not self.game_over else (0x00ff00 if self.payout > 0 else 0xff0000)
         embed = EmbedBuilder.game_result(title, description, color)
         
         if not self.game_over:
             embed.add_field(
                 name="💡 How to Play",
                 value="Guess if the next card will be higher or lower than the current card.\n"
-                      "Each correct guess gives you 1 point.\n"
-                      "Cash out anytime to secure your winnings!",
+                      "Each correct guess gives you 1 point; a tie keeps your streak going.\n"
+                      "Cash out anytime to secure your winnings, a wrong guess loses them!",
                 inline=False
             )
         
         embed.add_field(
             name="💰 Payout",
-            value=f"100 coins × {self.score} = {100 * self.score:,} coins",
-            inline=True
-        )
-        
-        embed.add_field(
-            name="⭐ XP",
-            value=f"10 XP × {self.score} = {10 * self.score} XP",
+            value=f"{POINT_PAYOUT} coins × {self.score} = {POINT_PAYOUT * self.score:,} coins",
             inline=True
         )
         
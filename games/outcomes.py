@@ -0,0 +1,368 @@
+"""Pure outcome layer and payout tables for the games.
+
+Each play_* function decides a round and returns a frozen result without touching
+discord.py, so simulators, load tests and settlement can evaluate games in bulk. The
+game classes in the per-game modules render these results as embeds. Every function
+takes an optional GameRNG stream; replaying it from the seed recorded with the game
+reproduces the result.
+"""
+import re
+from bisect import bisect
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import accumulate
+from typing import Callable, Iterable, List, Optional, Tuple
+
+from utils.helpers import get_roulette_numbers
+from utils.rng import GameRNG
+
+# Slot symbols and their rarities (higher weight = more common)
+SLOT_SYMBOLS = {
+    '🍒': 30,  # Cherry - most common
+    '🍋': 25,  # Lemon
+    '🍊': 20,  # Orange
+    '🍇': 15,  # Grapes
+    '🔔': 8,   # Bell
+    '⭐': 2    # Star - rarest
+}
+
+# Slots payout table
+SLOT_PAYOUTS = {
+    '⭐': {'3': 500, '2': 25},
+    '🔔': {'3': 25, '2': 10},
+    '🍇': {'3': 5, '2': 3},
+    '🍊': {'3': 3, '2': 2},
+    '🍋': {'3': 2, '2': 1},
+    '🍒': {'3': 1, '2': 1}
+}
+
+# Sevens: winning numbers and profit multiplier for each prediction
+SEVENS_PAYOUTS = {
+    '7': (range(7, 8), 10),  # 10:1 odds
+    'low': (range(1, 7), 2),  # 2:1 odds
+    'high': (range(8, 14), 2)  # 2:1 odds
+}
+
+RPS_CHOICES = ['rock', 'paper', 'scissors']
+# Each choice and the choice it beats
+RPS_BEATS = {'rock': 'scissors', 'paper': 'rock', 'scissors': 'paper'}
+RPS_WIN_MULTIPLIER = 0.5  # 3:2 odds
+
+ROULETTE_POCKETS = 38  # 0-36 plus 00 (37)
+ROULETTE_STRAIGHT_PAYOUT = 35  # Single number, 35:1
+ROULETTE_COLOR_PAYOUT = 1  # Red or black, 1:1
+ROULETTE_GREEN_PAYOUT = 17  # 0 or 00, 17:1
+ROULETTE_NUMBERS = get_roulette_numbers()
+ROULETTE_DOZEN_PAYOUT = 2  # 1st12, 2nd12 and 3rd12, 2:1
+ROULETTE_OUTSIDE_PAYOUT = 1  # Halves and columns, 1:1
+
+CRASH_CHANCE = 0.1  # 10% chance to crash on each multiplier increase
+MAX_DURATION = 120  # Rounds crash after 2 minutes
+# Crash seconds per tick and the range the multiplier rises by each tick, per mode
+TICK_INTERVAL = {False: 2, True: 1}
+MULTIPLIER_STEP = {False: (0.05, 0.15), True: (0.1, 0.3)}  # Faster in hard mode
+
+# Shared stream for callers that do not need to record their draws
+_default_rng = GameRNG()
+
+@dataclass(frozen=True, slots=True)
+class CoinflipResult:
+    """A settled coinflip."""
+
+    prediction: str
+    bet_amount: int
+    result: str
+    payout: int
+
+@dataclass(frozen=True, slots=True)
+class DiceResult:
+    """A settled dice roll."""
+
+    dice_type: str
+    dice_max: int
+    prediction: int
+    bet_amount: int
+    result: int
+    payout: int
+
+@dataclass(frozen=True, slots=True)
+class SlotsResult:
+    """A settled slots spin."""
+
+    bet_amount: int
+    reels: Tuple[str, ...]
+    multiplier: int
+    winning_combination: str
+    payout: int
+
+@dataclass(frozen=True, slots=True)
+class SlotsBatchResult:
+    """Several slots spins at the same bet, settled together."""
+
+    bet_amount: int  # Per spin
+    spins: Tuple[SlotsResult, ...]
+    payout: int
+
+    @property
+    def wins(self) -> int:
+        """Number of winning spins."""
+        return sum(1 for spin in self.spins if spin.payout > 0)
+
+@dataclass(frozen=True, slots=True)
+class SevensResult:
+    """A settled Sevens roll."""
+
+    prediction: str
+    bet_amount: int
+    result: int
+    payout: int
+
+@dataclass(frozen=True, slots=True)
+class RPSResult:
+    """A settled Rock Paper Scissors throw."""
+
+    player_choice: str
+    bet_amount: int
+    bot_choice: str
+    result: str  # win, tie or lose
+    payout: int
+
+@dataclass(frozen=True, slots=True)
+class RouletteBet:
+    """A roulette prediction compiled to the pockets it wins on."""
+
+    prediction: str
+    mask: int  # Bit n is set if pocket n wins (37 is 00)
+    multiplier: int
+    odds: str
+
+    def wins(self, pocket: int) -> bool:
+        """Check whether the ball landing on pocket wins this bet."""
+        return bool(self.mask >> pocket & 1)
+
+@dataclass(frozen=True, slots=True)
+class RouletteResult:
+    """A settled roulette spin."""
+
+    prediction: str
+    bet_amount: int
+    pocket: int  # 37 is 00
+    color: str
+    odds: str
+    payout: int
+
+@dataclass(frozen=True, slots=True)
+class RouletteSlipResult:
+    """Several roulette bets settled against one spin."""
+
+    pocket: int
+    color: str
+    bets: Tuple[RouletteResult, ...]
+    payout: int
+
+def play_coinflip(prediction: str, bet_amount: int, rng: Optional[GameRNG] = None) -> CoinflipResult:
+    """Flip a coin against a heads/tails prediction."""
+    rng = rng or _default_rng
+    prediction = prediction.lower()
+
+    # Normalize prediction
+    if prediction in ['h', 'head']:
+        prediction = 'heads'
+    elif prediction in ['t', 'tail']:
+        prediction = 'tails'
+
+    result = rng.choice(['heads', 'tails'])
+    payout = bet_amount if result == prediction else -bet_amount  # 1:1 odds
+    return CoinflipResult(prediction, bet_amount, result, payout)
+
+def get_dice_max(dice_type: str) -> int:
+    """Get maximum value for dice type, or 0 if it is not a dice."""
+    match = re.match(r'd(\d+)', dice_type.lower())
+    if match:
+        return int(match.group(1))
+    return 0
+
+def play_dice(dice_type: str, prediction: int, bet_amount: int, rng: Optional[GameRNG] = None) -> Optional[DiceResult]:
+    """Roll a dice against a number prediction, or None for an invalid dice type."""
+    rng = rng or _default_rng
+    dice_type = dice_type.lower()
+    dice_max = get_dice_max(dice_type)
+    if not dice_max:
+        return None
+
+    result = rng.randint(1, dice_max)
+    if result == prediction:
+        payout = bet_amount * (dice_max - 1)  # (dice_max):1 odds
+    else:
+        payout = -bet_amount
+    return DiceResult(dice_type, dice_max, prediction, bet_amount, result, payout)
+
+def _slot_line(reels: Tuple[str, ...]) -> Tuple[int, str]:
+    """Get (multiplier, combination) for a line, paying the best matching symbol."""
+    best_payout = 0
+    best_combination = "No match"
+    for symbol in set(reels):
+        count = reels.count(symbol)
+        payouts = SLOT_PAYOUTS.get(symbol, {})
+        key = '3' if count >= 3 else '2' if count == 2 else None
+        if key in payouts and payouts[key] > best_payout:
+            best_payout = payouts[key]
+            best_combination = f"{key}x {symbol}"
+    return best_payout, best_combination
+
+# Built once at import: cumulative reel weights and every line's payout, indexed by
+# (first * symbols + second) * symbols + third
+_SLOT_NAMES = list(SLOT_SYMBOLS)
+_SLOT_CUMULATIVE = list(accumulate(SLOT_SYMBOLS.values()))
+SLOT_LINES = [
+    _slot_line((first, second, third))
+    for first in _SLOT_NAMES for second in _SLOT_NAMES for third in _SLOT_NAMES
+]
+
+def _spin(bet_amount: int, first: int, second: int, third: int) -> SlotsResult:
+    """Settle a line from its three symbol indexes with one table lookup."""
+    count = len(_SLOT_NAMES)
+    multiplier, combination = SLOT_LINES[(first * count + second) * count + third]
+    reels = (_SLOT_NAMES[first], _SLOT_NAMES[second], _SLOT_NAMES[third])
+    payout = bet_amount * multiplier if multiplier else -bet_amount
+    return SlotsResult(bet_amount, reels, multiplier, combination, payout)
+
+def play_slots(bet_amount: int, rng: Optional[GameRNG] = None) -> SlotsResult:
+    """Spin three weighted reels."""
+    rng = rng or _default_rng
+    # All three reels come from the stream's pre-drawn buffer
+    first, second, third = (
+        bisect(_SLOT_CUMULATIVE, draw) for draw in rng.randbelow_batch(_SLOT_CUMULATIVE[-1], 3)
+    )
+    return _spin(bet_amount, first, second, third)
+
+def play_slots_batch(bet_amount: int, spins: int, rng: Optional[GameRNG] = None) -> SlotsBatchResult:
+    """Spin spins lines at bet_amount each."""
+    rng = rng or _default_rng
+    symbols = [bisect(_SLOT_CUMULATIVE, draw) for draw in rng.randbelow_batch(_SLOT_CUMULATIVE[-1], 3 * spins)]
+    results = tuple(
+        _spin(bet_amount, symbols[i], symbols[i + 1], symbols[i + 2]) for i in range(0, len(symbols), 3)
+    )
+    return SlotsBatchResult(bet_amount, results, sum(result.payout for result in results))
+
+def play_sevens(prediction: str, bet_amount: int, rng: Optional[GameRNG] = None) -> SevensResult:
+    """Roll 1-13 against a 7, low or high prediction."""
+    rng = rng or _default_rng
+    prediction = prediction.lower()
+    if prediction in ['seven']:
+        prediction = '7'
+
+    # Ball can land on 1-13
+    result = rng.randint(1, 13)
+    numbers, multiplier = SEVENS_PAYOUTS.get(prediction, ((), 0))
+    payout = bet_amount * multiplier if result in numbers else -bet_amount
+    return SevensResult(prediction, bet_amount, result, payout)
+
+def play_rps(player_choice: str, bet_amount: int, rng: Optional[GameRNG] = None) -> RPSResult:
+    """Throw rock, paper or scissors against the bot."""
+    rng = rng or _default_rng
+    choice_map = {'r': 'rock', 'p': 'paper', 's': 'scissors'}
+    player_choice = choice_map.get(player_choice.lower(), player_choice.lower())
+    bot_choice = rng.choice(RPS_CHOICES)
+
+    if player_choice == bot_choice:
+        return RPSResult(player_choice, bet_amount, bot_choice, "tie", 0)  # Tie returns bet
+    if RPS_BEATS.get(player_choice) == bot_choice:
+        return RPSResult(player_choice, bet_amount, bot_choice, "win", int(bet_amount * RPS_WIN_MULTIPLIER))
+    return RPSResult(player_choice, bet_amount, bot_choice, "lose", -bet_amount)
+
+def pocket_color(pocket: int) -> str:
+    """Get the color of a roulette pocket."""
+    if pocket == 0 or pocket == 37:
+        return "green"
+    if pocket in ROULETTE_NUMBERS['red']:
+        return "red"
+    return "black"
+
+def _pocket_mask(pockets: Iterable[int]) -> int:
+    """Set one bit per pocket."""
+    mask = 0
+    for pocket in pockets:
+        mask |= 1 << pocket
+    return mask
+
+# Named bets as (pocket mask, multiplier); green covers both 0 and 00
+_ROULETTE_NAMED = {
+    'red': (_pocket_mask(ROULETTE_NUMBERS['red']), ROULETTE_COLOR_PAYOUT),
+    'black': (_pocket_mask(ROULETTE_NUMBERS['black']), ROULETTE_COLOR_PAYOUT),
+    'green': (_pocket_mask([0, 37]), ROULETTE_GREEN_PAYOUT),
+    **{name: (_pocket_mask(ROULETTE_NUMBERS[name]), ROULETTE_DOZEN_PAYOUT) for name in ('1st12', '2nd12', '3rd12')},
+    **{name: (_pocket_mask(ROULETTE_NUMBERS[name]), ROULETTE_OUTSIDE_PAYOUT)
+       for name in ('1sthalf', '2ndhalf', '1stcol', '2ndcol', '3rdcol')}
+}
+_ROULETTE_ALIASES = {'col1': '1stcol', 'col2': '2ndcol', 'col3': '3rdcol'}
+
+@lru_cache(maxsize=1024)
+def compile_roulette_bet(prediction: str) -> RouletteBet:
+    """Compile a prediction to its winning pockets and multiplier.
+
+    Predictions that cannot win compile to an empty mask.
+    """
+    prediction = prediction.lower().strip()
+
+    # Direct number prediction
+    if prediction == "00":
+        return RouletteBet(prediction, 1 << 37, ROULETTE_STRAIGHT_PAYOUT, f"{ROULETTE_STRAIGHT_PAYOUT}:1")
+    if prediction.isdigit() and int(prediction) <= 36:
+        return RouletteBet(prediction, 1 << int(prediction), ROULETTE_STRAIGHT_PAYOUT, f"{ROULETTE_STRAIGHT_PAYOUT}:1")
+
+    # Colors and named ranges
+    name = _ROULETTE_ALIASES.get(prediction, prediction)
+    if name in _ROULETTE_NAMED:
+        mask, multiplier = _ROULETTE_NAMED[name]
+        return RouletteBet(prediction, mask, multiplier, f"{multiplier}:1")
+
+    # Range betting (e.g., "1-18", "19-36")
+    if '-' in prediction:
+        try:
+            start, end = map(int, prediction.split('-'))
+        except ValueError:
+            return RouletteBet(prediction, 0, 0, "")
+        mask = _pocket_mask(range(max(start, 1), min(end, 36) + 1))
+        # Ranges wider than half the board only return the bet
+        if end - start + 1 <= 18:
+            return RouletteBet(prediction, mask, 1, "1:1")
+        return RouletteBet(prediction, mask, 0, "")
+
+    # Comma-separated numbers
+    if ',' in prediction:
+        try:
+            numbers = [int(x.strip()) for x in prediction.split(',')]
+        except ValueError:
+            return RouletteBet(prediction, 0, 0, "")
+        # Odds based on number of selections
+        multiplier = max(1, 36 // len(numbers))
+        return RouletteBet(prediction, _pocket_mask(n for n in numbers if 0 <= n <= 36), multiplier, f"{multiplier}:1")
+
+    return RouletteBet(prediction, 0, 0, "")
+
+def settle_roulette(bet: RouletteBet, bet_amount: int, pocket: int) -> RouletteResult:
+    """Settle a compiled bet against the pocket the ball landed on."""
+    color = pocket_color(pocket)
+    if bet.wins(pocket):
+        return RouletteResult(bet.prediction, bet_amount, pocket, color, bet.odds, bet_amount * bet.multiplier)
+    return RouletteResult(bet.prediction, bet_amount, pocket, color, "Loss", -bet_amount)
+
+def spin_roulette(rng: Optional[GameRNG] = None) -> int:
+    """Spin an American wheel, returning the pocket (37 is 00)."""
+    rng = rng or _default_rng
+    return rng.randrange(ROULETTE_POCKETS)
+
+def play_roulette(prediction: str, bet_amount: int, rng: Optional[GameRNG] = None) -> RouletteResult:
+    """Spin an American wheel against a prediction."""
+    return settle_roulette(compile_roulette_bet(prediction), bet_amount, spin_roulette(rng))
+
+def settle_roulette_slip(predictions: List[str], bet_amount: int, pocket: int) -> RouletteSlipResult:
+    """Settle bet_amount on each prediction against one spin."""
+    results = tuple(settle_roulette(compile_roulette_bet(prediction), bet_amount, pocket)
+                    for prediction in predictions)
+    return RouletteSlipResult(pocket, pocket_color(pocket), results, sum(result.payout for result in results))
+
+def play_batch(play: Callable, rounds: int, *args, rng: Optional[GameRNG] = None, **kwargs) -> List:
+    """Play the same bet rounds times on one stream."""
+    return [play(*args, rng=rng, **kwargs) for _ in range(rounds)]
@@ -1,17 +1,23 @@
-import random
 import asyncio
+from typing import Optional
 import discord
 from utils.embeds import EmbedBuilder
+from utils.rng import GameRNG
+
+TRACK_LENGTH = 10
 
 class RaceGame:
     """Manages a racing game."""
     
-    def __init__(self, racer_type: str, prediction: int, bet_amount: int):
+    def __init__(self, racer_type: str, prediction: int, bet_amount: int, rng: Optional[GameRNG] = None):
         self.racer_type = racer_type.lower()
         self.prediction = prediction
         self.bet_amount = bet_amount
+        self.rng = rng or GameRNG()
         self.winner = None
         self.payout = 0
+        self.trajectory = []
+        self.photo_finish = False
         
         # Race configurations
         self.race_configs = {
@@ -32,44 +38,29 @@ class RaceGame:
         self.num_racers = self.config['racers']
         self.odds = self.config['odds']
     
-    async def start_race(self, interaction: discord.Interaction):
-        """Start the race with animation."""
+    def run(self):
+        """Decide the whole race upfront: trajectory, winner and payout."""
         if not self.config:
             return {'success': False, 'message': 'Invalid racer type'}
         
         if not (1 <= self.prediction <= self.num_racers):
             return {'success': False, 'message': f'Prediction must be between 1 and {self.num_racers}'}
         
-        # Initialize race
-        race_embed = self._get_pre_race_embed()
-        message = await interaction.followup.send(embed=race_embed)
-        
-        # Countdown
-        for i in range(3, 0, -1):
-            countdown_embed = EmbedBuilder.game_result(
-                f"🏁 {self.config['name']} Race",
-                f"Race starting in **{i}**..."
-            )
-            await message.edit(embed=countdown_embed)
-            await asyncio.sleep(1)
-        
-        # Start race animation
+        # Each step every racer has a 70% chance to move forward 1-2 spaces
         positions = [0] * self.num_racers
-        track_length = 10
-        
-        while max(positions) < track_length:
-            # Update positions randomly
-            for i in range(self.num_racers):
-                if random.random() < 0.7:  # 70% chance to move forward
-                    positions[i] += random.randint(1, 2)
-            
-            # Show race progress
-            race_embed = self._get_race_progress_embed(positions, track_length)
-            await message.edit(embed=race_embed)
-            await asyncio.sleep(1)
-        
-        # Determine winner
-        self.winner = positions.index(max(positions)) + 1
+        self.trajectory = []
+        while max(positions) < TRACK_LENGTH:
+            positions = [
+                pos + self.rng.randint(1, 2) if self.rng.random() < 0.7 else pos
+                for pos in positions
+            ]
+            self.trajectory.append(positions)
+        
+        # Racers level at the finish are split by a fair draw rather than by racer number
+        best = max(positions)
+        leaders = [i + 1 for i, pos in enumerate(positions) if pos == best]
+        self.winner = self.rng.choice(leaders)
+        self.photo_finish = len(leaders) > 1
         
         # Calculate payout
         if self.winner == self.prediction:
@@ -77,10 +68,6 @@ class RaceGame:
         else:
             self.payout = -self.bet_amount
         
-        # Show final result
-        final_embed = self._get_result_embed()
-        await message.edit(embed=final_embed)
-        
         return {
             'success': True,
             'won': self.payout > 0,
@@ -88,6 +75,25 @@ class RaceGame:
             'winner': self.winner
         }
     
+    async def animate(self, interaction: discord.Interaction):
+        """Play back a race decided by run()."""
+        # Render every frame before the first send so playback is only sleeps and edits
+        frames = [
+            EmbedBuilder.game_result(f"🏁 {self.config['name']} Race", f"Race starting in **{i}**...")
+            for i in range(3, 0, -1)
+        ]
+        frames += [self._get_race_progress_embed(positions, TRACK_LENGTH) for positions in self.trajectory]
+        
+        message = await interaction.followup.send(embed=self._get_pre_race_embed())
+        
+        # Animation frames go through the shared scheduler so busy channels skip frames
+        edits = interaction.client.edits
+        for frame in frames:
+            edits.submit(message, embed=frame)
+            await asyncio.sleep(1)
+        
+        await edits.submit(message, final=True, embed=self._get_result_embed())
+    
     def _get_pre_race_embed(self) -> discord.Embed:
         """Get embed before race starts."""
         title = f"🏁 {self.config['name']} Race"
@@ -132,6 +138,8 @@ class RaceGame:
         title = f"🏁 {self.config['name']} Race - Results"
         
         description = f"🏆 **Winner: Racer #{self.winner}** {self.config['emoji']}\n"
+        if self.photo_finish:
+            description += "📸 Photo finish! The tie was decided by a random draw.\n"
         description += f"Your pick: **Racer #{self.prediction}**\n\n"
         
         if self.payout > 0:
@@ -1,48 +1,18 @@
-import random
+from typing import Optional
 import discord
+from games.outcomes import RPSResult, play_rps
 from utils.embeds import EmbedBuilder
+from utils.rng import GameRNG
 
 class RockPaperScissorsGame:
-    """Manages a Rock Paper Scissors game."""
+    """Renders a Rock Paper Scissors result."""
     
-    def __init__(self, player_choice: str, bet_amount: int):
-        self.player_choice = player_choice.lower()
-        self.bet_amount = bet_amount
-        self.bot_choice = None
-        self.result = None
-        self.payout = 0
-        
-        # Normalize player choice
-        choice_map = {
-            'r': 'rock',
-            'p': 'paper', 
-            's': 'scissors'
-        }
-        self.player_choice = choice_map.get(self.player_choice, self.player_choice)
-        
-        self.play()
+    def __init__(self, player_choice: str, bet_amount: int, rng: Optional[GameRNG] = None):
+        self.outcome = play_rps(player_choice, bet_amount, rng)
+        self.payout = self.outcome.payout
     
-    def play(self):
-        """Play Rock Paper Scissors."""
-        choices = ['rock', 'paper', 'scissors']
-        self.bot_choice = random.choice(choices)
-        
-        # Determine winner
-        if self.player_choice == self.bot_choice:
-            self.result = "tie"
-            self.payout = 0  # Tie returns bet
-        elif (
-            (self.player_choice == 'rock' and self.bot_choice == 'scissors') or
-            (self.player_choice == 'paper' and self.bot_choice == 'rock') or
-            (self.player_choice == 'scissors' and self.bot_choice == 'paper')
-        ):
-            self.result = "win"
-            self.payout = int(self.bet_amount * 0.5)  # 3:2 odds
-        else:
-            self.result = "lose"
-            self.payout = -self.bet_amount
-    
-    def _get_emoji(self, choice: str) -> str:
+    @staticmethod
+    def _get_emoji(choice: str) -> str:
         """Get emoji for choice."""
         emojis = {
             'rock': '🪨',
@@ -53,29 +23,34 @@ class RockPaperScissorsGame:
     
     def get_result_embed(self) -> discord.Embed:
         """Get embed showing game result."""
+        return self.render(self.outcome)
+    
+    @staticmethod
+    def render(outcome: RPSResult) -> discord.Embed:
+        """Build the result embed for a Rock Paper Scissors outcome."""
         title = "✂️ Rock Paper Scissors"
         
-        player_emoji = self._get_emoji(self.player_choice)
-        bot_emoji = self._get_emoji(self.bot_choice)
+        player_emoji = RockPaperScissorsGame._get_emoji(outcome.player_choice)
+        bot_emoji = RockPaperScissorsGame._get_emoji(outcome.bot_choice)
         
-        description = f"You chose: **{self.player_choice.title()}** {player_emoji}\n"
-        description += f"Bot chose: **{self.bot_choice.title()}** {bot_emoji}\n\n"
+        description = f"You chose: **{outcome.player_choice.title()}** {player_emoji}\n"
+        description += f"Bot chose: **{outcome.bot_choice.title()}** {bot_emoji}\n\n"
         
-        if self.result == "win":
-            description += f"🎉 **You win! You won {self.payout:,} coins!**"
+        if outcome.result == "win":
+            description += f"🎉 **You win! You won {outcome.payout:,} coins!**"
             color = 0x00ff00
-        elif self.result == "tie":
+        elif outcome.result == "tie":
             description += "🤝 **It's a tie! Your bet is returned.**"
             color = 0xffff00
         else:
-            description += f"💔 **You lose! You lost {abs(self.payout):,} coins!**"
+            description += f"💔 **You lose! You lost {abs(outcome.payout):,} coins!**"
             color = 0xff0000
         
         embed = EmbedBuilder.game_result(title, description, color)
         
         embed.add_field(
             name="💰 Payout",
-            value=f"{self.payout:+,} coins" if self.payout != 0 else "Bet returned",
+            value=f"{outcome.payout:+,} coins" if outcome.payout != 0 else "Bet returned",
             inline=True
         )
         
@@ -1,176 +1,178 @@
-import random
+import asyncio
+from typing import Optional, Dict, Any, List
 import discord
+from games.outcomes import RouletteResult, RouletteSlipResult, settle_roulette_slip, spin_roulette
 from utils.embeds import EmbedBuilder
-from utils.helpers import get_roulette_numbers
+from utils.rng import GameRNG
+
+COLOR_EMOJIS = {"red": "🔴", "black": "⚫", "green": "🟢"}
+
+BETTING_INFO = (
+    "**Betting Options:**\n"
+    "Numbers: 0-36, 00 (35:1)\n"
+    "Colors: red, black (1:1), green (17:1)\n"
+    "Ranges: 1stHalf, 2ndHalf (1:1)\n"
+    "Dozens: 1st12, 2nd12, 3rd12 (2:1)\n"
+    "Columns: 1stCol, 2ndCol, 3rdCol (1:1)\n"
+    "Separate several bets with spaces, e.g. `red 17 1st12`"
+)
+
+def _pocket_display(pocket: int, color: str) -> str:
+    """Format a pocket with its color."""
+    return f"**{'00' if pocket == 37 else pocket}** {COLOR_EMOJIS.get(color, '')}"
 
 class RouletteGame:
-    """Manages a roulette game."""
+    """Renders a roulette slip settled against one spin."""
     
-    def __init__(self, prediction: str, bet_amount: int):
-        self.prediction = prediction.lower().strip()
-        self.bet_amount = bet_amount
-        self.result = None
-        self.result_color = ""
-        self.payout = 0
-        self.odds = ""
-        
-        self.roulette_numbers = get_roulette_numbers()
-        self.play()
-    
-    def play(self):
-        """Play the roulette game."""
-        # Generate result (0-36, where 37 represents 00)
-        possible_outcomes = list(range(37)) + [37]  # 0-36 + 00
-        self.result = random.choice(possible_outcomes)
-        
-        # Determine result color
-        if self.result == 0 or self.result == 37:
-            self.result_color = "green"
-        elif self.result in self.roulette_numbers['red']:
-            self.result_color = "red"
-        else:
-            self.result_color = "black"
-        
-        # Check if prediction wins
-        self._calculate_payout()
-    
-    def _calculate_payout(self):
-        """Calculate payout based on prediction."""
-        prediction = self.prediction
-        
-        # Direct number prediction
-        try:
-            if prediction == "00":
-                if self.result == 37:
-                    self.payout = self.bet_amount * 35  # 35:1
-                    self.odds = "35:1"
-                    return
-            else:
-                pred_num = int(prediction)
-                if 0 <= pred_num <= 36 and self.result == pred_num:
-                    self.payout = self.bet_amount * 35  # 35:1
-                    self.odds = "35:1"
-                    return
-        except ValueError:
-            pass
-        
-        # Color predictions
-        if prediction in ['red', 'black', 'green']:
-            if prediction == self.result_color:
-                if prediction == 'green':
-                    self.payout = self.bet_amount * 17  # 17:1 for green
-                    self.odds = "17:1"
-                else:
-                    self.payout = self.bet_amount  # 1:1 for red/black
-                    self.odds = "1:1"
-                return
-        
-        # Range predictions
-        winning_ranges = {
-            '1sthalf': self.roulette_numbers['1sthalf'],
-            '2ndhalf': self.roulette_numbers['2ndhalf'],
-            '1st12': self.roulette_numbers['1st12'],
-            '2nd12': self.roulette_numbers['2nd12'],
-            '3rd12': self.roulette_numbers['3rd12'],
-            '1stcol': self.roulette_numbers['1stcol'],
-            '2ndcol': self.roulette_numbers['2ndcol'],
-            '3rdcol': self.roulette_numbers['3rdcol'],
-            'col1': self.roulette_numbers['1stcol'],
-            'col2': self.roulette_numbers['2ndcol'],
-            'col3': self.roulette_numbers['3rdcol']
-        }
-        
-        if prediction in winning_ranges:
-            if self.result in winning_ranges[prediction]:
-                if '12' in prediction:
-                    self.payout = self.bet_amount * 2  # 2:1
-                    self.odds = "2:1"
-                elif 'col' in prediction or 'half' in prediction:
-                    self.payout = self.bet_amount  # 1:1
-                    self.odds = "1:1"
-                return
-        
-        # Range betting (e.g., "1-18", "19-36")
-        if '-' in prediction:
-            try:
-                start, end = map(int, prediction.split('-'))
-                if start <= self.result <= end and self.result != 0 and self.result != 37:
-                    # Calculate odds based on range size
-                    range_size = end - start + 1
-                    if range_size <= 18:  # Max half the board
-                        self.payout = self.bet_amount  # 1:1
-                        self.odds = "1:1"
-                    return
-            except ValueError:
-                pass
-        
-        # Comma-separated numbers
-        if ',' in prediction:
-            try:
-                numbers = [int(x.strip()) for x in prediction.split(',')]
-                if self.result in numbers:
-                    # Odds based on number of selections
-                    multiplier = max(1, 36 // len(numbers))
-                    self.payout = self.bet_amount * multiplier
-                    self.odds = f"{multiplier}:1"
-                    return
-            except ValueError:
-                pass
-        
-        # If no win condition met
-        self.payout = -self.bet_amount
-        self.odds = "Loss"
+    def __init__(self, predictions: List[str], bet_amount: int, pocket: int):
+        self.outcome = settle_roulette_slip(predictions, bet_amount, pocket)
+        self.payout = self.outcome.payout
     
     def get_result_embed(self) -> discord.Embed:
         """Get embed showing game result."""
+        if len(self.outcome.bets) == 1:
+            return self.render(self.outcome.bets[0])
+        return self.render_slip(self.outcome)
+    
+    @staticmethod
+    def render(outcome: RouletteResult) -> discord.Embed:
+        """Build the result embed for a roulette outcome."""
         title = "🎰 Roulette Result"
         
-        # Format result display
-        if self.result == 37:
-            result_display = "00"
-        else:
-            result_display = str(self.result)
-        
-        # Color emoji
-        color_emojis = {"red": "🔴", "black": "⚫", "green": "🟢"}
-        color_emoji = color_emojis.get(self.result_color, "")
-        
-        description = f"The ball landed on: **{result_display}** {color_emoji}\n"
-        description += f"You bet on: **{self.prediction}**\n\n"
+        description = f"The ball landed on: {_pocket_display(outcome.pocket, outcome.color)}\n"
+        description += f"You bet on: **{outcome.prediction}**\n\n"
         
-        if self.payout > 0:
-            description += f"🎉 **You won {self.payout:,} coins!**"
+        if outcome.payout > 0:
+            description += f"🎉 **You won {outcome.payout:,} coins!**"
             color = 0x00ff00
         else:
-            description += f"💔 **You lost {abs(self.payout):,} coins!**"
+            description += f"💔 **You lost {abs(outcome.payout):,} coins!**"
             color = 0xff0000
         
         embed = EmbedBuilder.game_result(title, description, color)
         
         embed.add_field(
             name="💰 Payout",
-            value=f"{self.payout:+,} coins",
+            value=f"{outcome.payout:+,} coins",
             inline=True
         )
         
         embed.add_field(
             name="🎯 Odds",
-            value=self.odds,
+            value=outcome.odds,
             inline=True
         )
         
         # Add betting options info
-        betting_info = "**Betting Options:**\n"
-        betting_info += "Numbers: 0-36, 00 (35:1)\n"
-        betting_info += "Colors: red, black (1:1), green (17:1)\n"
-        betting_info += "Ranges: 1stHalf, 2ndHalf (1:1)\n"
-        betting_info += "Dozens: 1st12, 2nd12, 3rd12 (2:1)\n"
-        betting_info += "Columns: 1stCol, 2ndCol, 3rdCol (1:1)"
-        
         embed.add_field(
             name="📋 Betting Guide",
-            value=betting_info,
+            value=BETTING_INFO,
             inline=False
         )
         
         return embed
+    
+    @staticmethod
+    def render_slip(outcome: RouletteSlipResult) -> discord.Embed:
+        """Build the result embed for several bets on one spin."""
+        title = "🎰 Roulette Result"
+        
+        description = f"The ball landed on: {_pocket_display(outcome.pocket, outcome.color)}\n\n"
+        for bet in outcome.bets:
+            description += f"{'✅' if bet.payout > 0 else '❌'} **{bet.prediction}** ({bet.odds}) {bet.payout:+,}\n"
+        description += "\n"
+        
+        if outcome.payout > 0:
+            description += f"🎉 **You won {outcome.payout:,} coins!**"
+            color = 0x00ff00
+        elif outcome.payout == 0:
+            description += "**You broke even!**"
+            color = 0xffff00
+        else:
+            description += f"💔 **You lost {abs(outcome.payout):,} coins!**"
+            color = 0xff0000
+        
+        embed = EmbedBuilder.game_result(title, description, color)
+        
+        embed.add_field(
+            name="🎲 Bets",
+            value=f"{len(outcome.bets)} x {outcome.bets[0].bet_amount:,} coins",
+            inline=True
+        )
+        
+        embed.add_field(
+            name="💰 Payout",
+            value=f"{outcome.payout:+,} coins",
+            inline=True
+        )
+        
+        return embed
+
+class RouletteTable:
+    """One spin shared by every bettor who joined it in a channel."""
+    
+    def __init__(self, channel_id: int, spins_at: float, rng: GameRNG):
+        self.channel_id = channel_id
+        self.spins_at = spins_at
+        self.rng = rng
+        self.pocket: asyncio.Future = asyncio.get_running_loop().create_future()
+        self.bettors = 0
+        self.handle: Optional[asyncio.TimerHandle] = None
+    
+    async def wait(self) -> int:
+        """Wait for the spin, returning the pocket the ball landed on."""
+        # Shielded so one bettor giving up does not cancel the spin for the rest
+        return await asyncio.shield(self.pocket)
+
+class RouletteEngine:
+    """Runs one shared wheel per channel.
+    
+    The first bet in a channel opens a table; every bet placed in the channel before
+    the betting window closes settles against the same spin.
+    """
+    
+    def __init__(self, rng, betting_window: float = 5.0):
+        self.rng = rng
+        self.betting_window = betting_window
+        self.open_tables: Dict[int, RouletteTable] = {}
+        
+        # Engine statistics
+        self.tables = 0
+        self.bets = 0
+    
+    def join(self, channel_id: int) -> RouletteTable:
+        """Place a bet at the channel's open table, opening one if needed."""
+        table = self.open_tables.get(channel_id)
+        if table is None:
+            loop = asyncio.get_running_loop()
+            table = RouletteTable(channel_id, loop.time() + self.betting_window, self.rng.stream())
+            table.handle = loop.call_later(self.betting_window, self._spin, table)
+            self.open_tables[channel_id] = table
+            self.tables += 1
+        
+        table.bettors += 1
+        self.bets += 1
+        return table
+    
+    def _spin(self, table: RouletteTable):
+        """Close betting and spin the wheel for everyone at the table."""
+        if self.open_tables.get(table.channel_id) is table:
+            del self.open_tables[table.channel_id]
+        if not table.pocket.done():
+            table.pocket.set_result(spin_roulette(table.rng))
+    
+    async def stop(self):
+        """Close every open table so its bets are refunded."""
+        for table in self.open_tables.values():
+            table.handle.cancel()
+            if not table.pocket.done():
+                table.pocket.set_exception(RuntimeError("Roulette table was closed"))
+        self.open_tables.clear()
+    
+    def stats(self) -> Dict[str, Any]:
+        """Get roulette engine statistics."""
+        return {
+            'open_tables': len(self.open_tables),
+            'tables': self.tables,
+            'bets': self.bets
+        }
@@ -0,0 +1,161 @@
+"""Monte Carlo return-to-player simulator for the game engines.
+
+Plays millions of rounds per game in batched NumPy arrays, using the payout tables
+in games.outcomes, and reports RTP, variance, hit frequency and
+percentiles of the worst drawdown over a session. Requires NumPy.
+
+Usage: python -m games.simulate [slots roulette sevens rps crash] [--rounds 1000000]
+                                [--session 1000] [--batch 1000000] [--seed N]
+"""
+import argparse
+import time
+from typing import Callable, Dict, List
+
+import numpy as np
+
+from games import outcomes
+
+CRASH_TARGETS = [1.2, 1.5, 2.0, 3.0, 5.0]  # Cash-out multipliers simulated for crash
+DRAWDOWN_PERCENTILES = [50, 95, 99]
+
+# Each simulator takes (rng, rounds) and returns the net result of each round per unit bet
+
+def simulate_slots(rng: np.random.Generator, rounds: int) -> np.ndarray:
+    """Spin three weighted reels."""
+    symbols = list(outcomes.SLOT_SYMBOLS)
+    weights = np.array([outcomes.SLOT_SYMBOLS[symbol] for symbol in symbols], dtype=float)
+    lines = np.array([multiplier for multiplier, _ in outcomes.SLOT_LINES])
+
+    # Same line index as games.outcomes: (first * symbols + second) * symbols + third
+    reels = rng.choice(len(symbols), size=(rounds, 3), p=weights / weights.sum())
+    best = lines[(reels[:, 0] * len(symbols) + reels[:, 1]) * len(symbols) + reels[:, 2]]
+    return np.where(best > 0, best, -1).astype(float)
+
+def _roulette(prediction: str) -> Callable[[np.random.Generator, int], np.ndarray]:
+    """Build a roulette simulator for one bet."""
+    bet = outcomes.compile_roulette_bet(prediction)
+    wins = np.array([bet.wins(pocket) for pocket in range(outcomes.ROULETTE_POCKETS)])
+
+    def simulate(rng: np.random.Generator, rounds: int) -> np.ndarray:
+        """Spin the wheel."""
+        pockets = rng.integers(outcomes.ROULETTE_POCKETS, size=rounds)
+        return np.where(wins[pockets], bet.multiplier, -1).astype(float)
+
+    return simulate
+
+def _sevens(prediction: str) -> Callable[[np.random.Generator, int], np.ndarray]:
+    """Build a sevens simulator for one prediction."""
+    numbers, multiplier = outcomes.SEVENS_PAYOUTS[prediction]
+    wins = np.isin(np.arange(14), list(numbers))
+
+    def simulate(rng: np.random.Generator, rounds: int) -> np.ndarray:
+        """Roll 1-13."""
+        return np.where(wins[rng.integers(1, 14, size=rounds)], multiplier, -1).astype(float)
+
+    return simulate
+
+def simulate_rps(rng: np.random.Generator, rounds: int) -> np.ndarray:
+    """Throw against a uniformly random bot; the player's choice does not matter."""
+    # 0 = tie, 1 = player wins, 2 = bot wins
+    outcome = rng.integers(3, size=rounds)
+    return np.select([outcome == 1, outcome == 2], [outcomes.RPS_WIN_MULTIPLIER, -1], 0.0)
+
+def _crash(target: float, hard_mode: bool) -> Callable[[np.random.Generator, int], np.ndarray]:
+    """Build a crash simulator for a player who cashes out at target."""
+    max_ticks = outcomes.MAX_DURATION // outcomes.TICK_INTERVAL[hard_mode]
+    low, high = outcomes.MULTIPLIER_STEP[hard_mode]
+
+    def simulate(rng: np.random.Generator, rounds: int) -> np.ndarray:
+        """Run rounds until they crash or the player cashes out."""
+        # Same draw as CrashRound._draw_crash_tick; the multiplier rises crash_tick - 1 times
+        crash_ticks = np.minimum(rng.geometric(outcomes.CRASH_CHANCE, size=rounds), max_ticks)
+        multipliers = 1.0 + np.cumsum(rng.uniform(low, high, size=(rounds, max_ticks - 1)), axis=1)
+
+        reached = multipliers >= target
+        rises = reached.argmax(axis=1) + 1
+        cashed_out = reached.any(axis=1) & (rises <= crash_ticks - 1)
+        cash_out_at = multipliers[np.arange(rounds), rises - 1]
+        return np.where(cashed_out, cash_out_at - 1, -1)
+
+    return simulate
+
+GAMES: Dict[str, Dict[str, Callable[[np.random.Generator, int], np.ndarray]]] = {
+    'slots': {'spin': simulate_slots},
+    'roulette': {prediction: _roulette(prediction) for prediction in ['17', 'red', 'black', 'green', '1st12', '1stcol']},
+    'sevens': {prediction: _sevens(prediction) for prediction in outcomes.SEVENS_PAYOUTS},
+    'rps': {'any': simulate_rps},
+    'crash': {
+        f"{'hard' if hard_mode else 'easy'} @{target}x": _crash(target, hard_mode)
+        for hard_mode in (False, True) for target in CRASH_TARGETS
+    }
+}
+
+def run(simulate: Callable[[np.random.Generator, int], np.ndarray], rng: np.random.Generator,
+        rounds: int, session: int, batch: int) -> Dict[str, float]:
+    """Play rounds in batches and summarise the results per unit bet."""
+    # Whole sessions per batch so drawdowns never span two batches
+    batch = max(session, batch // session * session)
+    total = total_sq = hits = 0.0
+    drawdowns: List[np.ndarray] = []
+    played = 0
+
+    while played < rounds:
+        size = min(batch, rounds - played)
+        results = simulate(rng, size)
+        total += results.sum()
+        total_sq += np.square(results).sum()
+        hits += np.count_nonzero(results > 0)
+        played += size
+
+        sessions = size // session
+        if sessions:
+            balance = np.cumsum(results[:sessions * session].reshape(sessions, session), axis=1)
+            peak = np.maximum(np.maximum.accumulate(balance, axis=1), 0)
+            drawdowns.append((peak - balance).max(axis=1))
+
+    mean = total / rounds
+    summary = {
+        'rtp': 1 + mean,
+        'variance': total_sq / rounds - mean * mean,
+        'hit_rate': hits / rounds
+    }
+    if drawdowns:
+        values = np.percentile(np.concatenate(drawdowns), DRAWDOWN_PERCENTILES)
+        for percentile, value in zip(DRAWDOWN_PERCENTILES, values):
+            summary[f'drawdown_p{percentile}'] = value
+    return summary
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('games', nargs='*', metavar='game',
+                        help=f"Games to simulate: {', '.join(GAMES)} (default: all)")
+    parser.add_argument('--rounds', type=int, default=1_000_000, help="Rounds per bet type")
+    parser.add_argument('--session', type=int, default=1000, help="Rounds per session for drawdowns")
+    parser.add_argument('--batch', type=int, default=1_000_000, help="Rounds held in memory at once")
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args()
+
+    unknown = [game for game in args.games if game not in GAMES]
+    if unknown:
+        parser.error(f"unknown game(s): {', '.join(unknown)}")
+
+    rng = np.random.default_rng(args.seed)
+    percentiles = ''.join(f"{f'DD p{p}':>10}" for p in DRAWDOWN_PERCENTILES)
+    print(f"{'game':<10}{'bet':<16}{'RTP':>9}{'edge':>9}{'variance':>11}{'hit rate':>10}{percentiles}{'time':>8}")
+
+    for game in args.games or GAMES:
+        for bet, simulate in GAMES[game].items():
+            # Crash keeps a (rounds x ticks) multiplier path per round, so use smaller batches
+            batch = args.batch // 50 if game == 'crash' else args.batch
+            start = time.perf_counter()
+            summary = run(simulate, rng, args.rounds, args.session, batch)
+            elapsed = time.perf_counter() - start
+
+            drawdowns = ''.join(f"{summary.get(f'drawdown_p{p}', float('nan')):>10.1f}" for p in DRAWDOWN_PERCENTILES)
+            print(
+                f"{game:<10}{bet:<16}{summary['rtp']:>9.2%}{1 - summary['rtp']:>9.2%}"
+                f"{summary['variance']:>11.2f}{summary['hit_rate']:>10.2%}{drawdowns}{elapsed:>7.1f}s"
+            )
+
+if __name__ == '__main__':
+    main()
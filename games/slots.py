@@ -1,127 +1,123 @@
-import random
+from typing import Optional
 import discord
+from games.outcomes import SLOT_PAYOUTS, SlotsBatchResult, SlotsResult, play_slots, play_slots_batch
 from utils.embeds import EmbedBuilder
+from utils.rng import GameRNG
+
+MAX_LISTED_SPINS = 10  # Spin lines shown in a batch result embed
+
+# Built from the payout table the spins are settled with, so the two cannot disagree
+PAYOUT_TABLE = "**Payout Table:**\n" + "\n".join(
+    f"{symbol} " + ", ".join(f"{count}x = {multiplier}:1" for count, multiplier in payouts.items())
+    for symbol, payouts in SLOT_PAYOUTS.items()
+)
 
 class SlotsGame:
-    """Manages a slots game."""
-    
-    def __init__(self, bet_amount: int):
-        self.bet_amount = bet_amount
-        self.result = []
-        self.payout = 0
-        self.winning_combination = ""
-        
-        # Slot symbols and their rarities (higher weight = more common)
-        self.symbols = {
-            '🍒': 30,  # Cherry - most common
-            '🍋': 25,  # Lemon
-            '🍊': 20,  # Orange  
-            '🍇': 15,  # Grapes
-            '🔔': 8,   # Bell
-            '⭐': 2    # Star - rarest
-        }
-        
-        # Payout table
-        self.payouts = {
-            '⭐': {'3': 500, '2': 25},
-            '🔔': {'3': 25, '2': 10},
-            '🍇': {'3': 5, '2': 3},
-            '🍊': {'3': 3, '2': 2},
-            '🍋': {'3': 2, '2': 1},
-            '🍒': {'3': 1, '2': 1}
-        }
-        
-        self.play()
+    """Renders a slots result, or the combined result of several spins."""
     
-    def _get_weighted_symbol(self) -> str:
-        """Get a random symbol based on weights."""
-        symbols = list(self.symbols.keys())
-        weights = list(self.symbols.values())
-        return random.choices(symbols, weights=weights)[0]
-    
-    def play(self):
-        """Play the slots game."""
-        # Spin 3 reels
-        self.result = [self._get_weighted_symbol() for _ in range(3)]
-        
-        # Check for winning combinations
-        self._calculate_payout()
-    
-    def _calculate_payout(self):
-        """Calculate payout based on results."""
-        symbol_counts = {}
-        for symbol in self.result:
-            symbol_counts[symbol] = symbol_counts.get(symbol, 0) + 1
-        
-        # Find best payout (highest multiplier)
-        best_payout = 0
-        best_combination = ""
-        
-        for symbol, count in symbol_counts.items():
-            if symbol in self.payouts:
-                if count >= 3 and '3' in self.payouts[symbol]:
-                    multiplier = self.payouts[symbol]['3']
-                    if multiplier > best_payout:
-                        best_payout = multiplier
-                        best_combination = f"3x {symbol}"
-                elif count >= 2 and '2' in self.payouts[symbol]:
-                    multiplier = self.payouts[symbol]['2']
-                    if multiplier > best_payout:
-                        best_payout = multiplier
-                        best_combination = f"2x {symbol}"
-        
-        if best_payout > 0:
-            self.payout = self.bet_amount * best_payout
-            self.winning_combination = best_combination
+    def __init__(self, bet_amount: int, rng: Optional[GameRNG] = None, spins: int = 1):
+        if spins > 1:
+            self.outcome = play_slots_batch(bet_amount, spins, rng)
         else:
-            self.payout = -self.bet_amount
-            self.winning_combination = "No match"
+            self.outcome = play_slots(bet_amount, rng)
+        self.payout = self.outcome.payout
     
     def get_result_embed(self) -> discord.Embed:
         """Get embed showing game result."""
+        if isinstance(self.outcome, SlotsBatchResult):
+            return self.render_batch(self.outcome)
+        return self.render(self.outcome)
+    
+    @staticmethod
+    def render(outcome: SlotsResult) -> discord.Embed:
+        """Build the result embed for a slots outcome."""
         title = "🎰 Slot Machine"
         
         # Show the slot result
-        slot_display = " | ".join(self.result)
+        slot_display = " | ".join(outcome.reels)
         
         description = f"**{slot_display}**\n\n"
         
-        if self.payout > 0:
-            description += f"🎉 **{self.winning_combination}!**\n"
-            description += f"**You won {self.payout:,} coins!**"
+        if outcome.payout > 0:
+            description += f"🎉 **{outcome.winning_combination}!**\n"
+            description += f"**You won {outcome.payout:,} coins!**"
             color = 0x00ff00
         else:
             description += f"💔 **No match!**\n"
-            description += f"**You lost {abs(self.payout):,} coins!**"
+            description += f"**You lost {abs(outcome.payout):,} coins!**"
             color = 0xff0000
         
         embed = EmbedBuilder.game_result(title, description, color)
         
         embed.add_field(
             name="💰 Result",
-            value=f"{self.winning_combination}",
+            value=f"{outcome.winning_combination}",
             inline=True
         )
         
         embed.add_field(
             name="💸 Payout",
-            value=f"{self.payout:+,} coins",
+            value=f"{outcome.payout:+,} coins",
             inline=True
         )
         
         # Add payout table
-        payout_info = "**Payout Table:**\n"
-        payout_info += "⭐ 3x = 500:1, 2x = 25:1\n"
-        payout_info += "🔔 3x = 25:1, 2x = 10:1\n"
-        payout_info += "🍇 3x = 5:1, 2x = 3:1\n"
-        payout_info += "🍊 3x = 3:1, 2x = 2:1\n"
-        payout_info += "🍋 3x = 2:1, 2x = 1:1\n"
-        payout_info += "🍒 3x = 1:1, 2x = 1:1"
-        
         embed.add_field(
             name="📊 Payouts",
-            value=payout_info,
+            value=PAYOUT_TABLE,
             inline=False
         )
         
         return embed
+    
+    @staticmethod
+    def render_batch(outcome: SlotsBatchResult) -> discord.Embed:
+        """Build the result embed for several spins settled together."""
+        title = f"🎰 Slot Machine x{len(outcome.spins)}"
+        
+        lines = []
+        for spin in outcome.spins[:MAX_LISTED_SPINS]:
+            lines.append(f"**{' | '.join(spin.reels)}** {spin.payout:+,}")
+        hidden = len(outcome.spins) - MAX_LISTED_SPINS
+        if hidden > 0:
+            lines.append(f"...and {hidden} more spins")
+        description = "\n".join(lines) + "\n\n"
+        
+        if outcome.payout > 0:
+            description += f"**You won {outcome.payout:,} coins!**"
+            color = 0x00ff00
+        elif outcome.payout == 0:
+            description += "**You broke even!**"
+            color = 0xffff00
+        else:
+            description += f"**You lost {abs(outcome.payout):,} coins!**"
+            color = 0xff0000
+        
+        embed = EmbedBuilder.game_result(title, description, color)
+        
+        embed.add_field(
+            name="🎲 Spins",
+            value=f"{len(outcome.spins)} x {outcome.bet_amount:,} coins",
+            inline=True
+        )
+        
+        embed.add_field(
+            name="🏆 Wins",
+            value=f"{outcome.wins}/{len(outcome.spins)}",
+            inline=True
+        )
+        
+        best = max(outcome.spins, key=lambda spin: spin.multiplier)
+        embed.add_field(
+            name="💰 Best Line",
+            value=best.winning_combination,
+            inline=True
+        )
+        
+        embed.add_field(
+            name="💸 Payout",
+            value=f"{outcome.payout:+,} coins",
+            inline=True
+        )
+        
+        return embed
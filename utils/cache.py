@@ -0,0 +1,115 @@
+import sys
+import time
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Callable, Hashable
+
+class LRUCache:
+    """Bounded LRU cache with a per-entry TTL and write-through helpers.
+
+    Loads are bracketed with begin_load()/finish_load() so a value read from disk
+    is dropped if the same key was written while the read was in flight.
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._loading: Dict[Hashable, int] = {}
+        self._stale = set()
+
+        # Cache statistics
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Get a cached value, or None on a miss."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self.expirations += 1
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: Hashable, value: Any):
+        """Cache a value, evicting the least recently used entries if full."""
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def update(self, key: Hashable, apply: Callable[[Any], None]):
+        """Apply a committed write to the cached value in place, if cached."""
+        if key in self._loading:
+            self._stale.add(key)
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            apply(entry[1])
+
+    def invalidate(self, key: Hashable):
+        """Drop a cached value."""
+        if key in self._loading:
+            self._stale.add(key)
+        self._entries.pop(key, None)
+
+    def clear(self):
+        """Drop every cached value."""
+        self._stale.update(self._loading)
+        self._entries.clear()
+
+    def begin_load(self, key: Hashable):
+        """Mark that a value for key is being read from disk."""
+        self._loading[key] = self._loading.get(key, 0) + 1
+
+    def finish_load(self, key: Hashable, value: Optional[Any]):
+        """Cache a loaded value unless the key was written during the load."""
+        remaining = self._loading.pop(key, 1) - 1
+        stale = key in self._stale
+
+        if remaining:
+            self._loading[key] = remaining
+        else:
+            self._stale.discard(key)
+
+        if value is not None and not stale:
+            self.put(key, value)
+
+    def memory_usage(self) -> int:
+        """Approximate memory held by cached entries, in bytes."""
+        total = sys.getsizeof(self._entries)
+        for key, entry in self._entries.items():
+            value = entry[1]
+            total += sys.getsizeof(key) + sys.getsizeof(entry) + sys.getsizeof(value)
+            if isinstance(value, dict):
+                total += sum(sys.getsizeof(item) for item in value.values())
+        return total
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self._entries),
+            'max_size': self.max_size,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'memory_bytes': self.memory_usage()
+        }
@@ -0,0 +1,78 @@
+import asyncio
+from functools import partial
+from typing import Optional, List, Tuple
+
+import discord
+
+class GameControls(discord.ui.View):
+    """Buttons for one game session that queue presses for the game loop.
+
+    discord.py routes each component interaction to its view by message and custom_id,
+    so a press reaches the owning game directly instead of every game scanning every
+    reaction event. The game loop awaits next_action() and answers the press with
+    update(), which acknowledges it and edits the message in a single request.
+    """
+
+    def __init__(self, owner_id: int, session_id: int, buttons: List[Tuple[str, Optional[str], str]]):
+        super().__init__(timeout=None)
+        self.owner_id = owner_id
+        self._actions: asyncio.Queue = asyncio.Queue()
+        self._pending: Optional[discord.Interaction] = None
+
+        # buttons are (action, label, emoji)
+        for action, label, emoji in buttons:
+            button = discord.ui.Button(
+                label=label,
+                emoji=emoji,
+                style=discord.ButtonStyle.secondary,
+                custom_id=f"game:{session_id}:{action}"
+            )
+            button.callback = partial(self._pressed, action)
+            self.add_item(button)
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        """Only the player who started the game can press its buttons."""
+        if interaction.user.id == self.owner_id:
+            return True
+
+        await interaction.response.send_message("This isn't your game!", ephemeral=True)
+        return False
+
+    async def _pressed(self, action: str, interaction: discord.Interaction):
+        """Queue a button press for the game loop."""
+        self._actions.put_nowait((action, interaction))
+
+    async def _acknowledge(self):
+        """Acknowledge a press the game loop did not answer with update()."""
+        if self._pending is not None and not self._pending.response.is_done():
+            try:
+                await self._pending.response.defer()
+            except discord.HTTPException:
+                pass
+        self._pending = None
+
+    async def next_action(self, timeout: float) -> Optional[str]:
+        """Wait for the next button press, returning its action or None on timeout."""
+        await self._acknowledge()
+
+        try:
+            action, interaction = await asyncio.wait_for(self._actions.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+        self._pending = interaction
+        return action
+
+    async def update(self, message: discord.Message, embed: discord.Embed, finished: bool = False):
+        """Show a new game state, removing the buttons once the game is finished."""
+        view = None if finished else self
+
+        try:
+            if self._pending is not None and not self._pending.response.is_done():
+                await self._pending.response.edit_message(embed=embed, view=view)
+            else:
+                await message.edit(embed=embed, view=view)
+        finally:
+            self._pending = None
+            if finished:
+                self.stop()
@@ -0,0 +1,174 @@
+import asyncio
+import time
+from typing import Optional, Dict, Any, Iterable, Set, Tuple
+
+UPSERT_COOLDOWN_SQL = '''
+    INSERT OR REPLACE INTO cooldowns (user_id, guild_id, command_name, expires_at)
+    VALUES (?, ?, ?, ?)
+'''
+
+def now_epoch() -> int:
+    """Current time in whole epoch seconds."""
+    return int(time.time())
+
+class CooldownStore:
+    """In-memory cooldowns with write-behind persistence and a timing wheel sweep.
+
+    Expiries are integer epoch seconds held per (guild_id, user_id). The wheel buckets
+    each expiry into a slot of sweep_interval seconds, so a sweep only visits the
+    slots that have fully elapsed and purges the table with one bulk DELETE.
+    """
+
+    def __init__(self, pool, flush_interval: float = 1.0, sweep_interval: int = 60):
+        self.pool = pool
+        self.flush_interval = flush_interval
+        self.sweep_interval = sweep_interval
+        self._entries: Dict[Tuple[int, int], Dict[str, int]] = {}
+        self._wheel: Dict[int, Set[Tuple[int, int, str]]] = {}
+        self._next_slot = now_epoch() // sweep_interval
+        self._pending: Dict[Tuple[int, int, str], int] = {}
+        self._task: Optional[asyncio.Task] = None
+
+        # Cooldown statistics
+        self.lookups = 0
+        self.writes = 0
+        self.flushes = 0
+        self.swept = 0
+
+    async def load(self):
+        """Drop expired rows and load the active cooldowns into memory."""
+        now = now_epoch()
+        async with self.pool.writer() as db:
+            await db.execute("DELETE FROM cooldowns WHERE expires_at <= ?", (now,))
+            await db.commit()
+            cursor = await db.execute("SELECT user_id, guild_id, command_name, expires_at FROM cooldowns")
+            rows = await cursor.fetchall()
+
+        self._entries.clear()
+        self._wheel.clear()
+        self._next_slot = now // self.sweep_interval
+        for user_id, guild_id, command_name, expires_at in rows:
+            self._track(user_id, guild_id, command_name, expires_at)
+
+    def start(self):
+        """Start the background flush and sweep task."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stop the background task and persist any pending writes."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        await self.flush()
+
+    def _track(self, user_id: int, guild_id: int, command_name: str, expires_at: int):
+        """Record an expiry in memory and in the wheel."""
+        self._entries.setdefault((guild_id, user_id), {})[command_name] = expires_at
+        slot = expires_at // self.sweep_interval
+        self._wheel.setdefault(slot, set()).add((guild_id, user_id, command_name))
+
+    def get(self, user_id: int, guild_id: int, command_name: str) -> Optional[int]:
+        """Get the expiry of an active cooldown, or None if it is ready."""
+        self.lookups += 1
+        expires_at = self._entries.get((guild_id, user_id), {}).get(command_name)
+        if expires_at is not None and expires_at > now_epoch():
+            return expires_at
+        return None
+
+    def lookup(self, user_id: int, guild_id: int,
+               names: Iterable[str]) -> Tuple[Dict[str, int], Set[str]]:
+        """Split names into active cooldowns (name -> expiry) and ready commands in a single lookup."""
+        self.lookups += 1
+        now = now_epoch()
+        commands = self._entries.get((guild_id, user_id), {})
+
+        active, ready = {}, set()
+        for name in names:
+            expires_at = commands.get(name)
+            if expires_at is not None and expires_at > now:
+                active[name] = expires_at
+            else:
+                ready.add(name)
+        return active, ready
+
+    def set(self, user_id: int, guild_id: int, command_name: str, duration: float) -> int:
+        """Start a cooldown and queue it for persistence, returning the expiry."""
+        expires_at = now_epoch() + int(duration)
+        self._track(user_id, guild_id, command_name, expires_at)
+        self._pending[(user_id, guild_id, command_name)] = expires_at
+        self.writes += 1
+        return expires_at
+
+    async def flush(self):
+        """Persist queued cooldown writes in one transaction."""
+        if not self._pending:
+            return
+
+        pending, self._pending = self._pending, {}
+        try:
+            async with self.pool.writer() as db:
+                await db.executemany(
+                    UPSERT_COOLDOWN_SQL,
+                    [(user_id, guild_id, name, expires_at) for (user_id, guild_id, name), expires_at in pending.items()]
+                )
+                await db.commit()
+        except Exception:
+            # Keep anything written since, requeue the rest for the next flush
+            for key, expires_at in pending.items():
+                self._pending.setdefault(key, expires_at)
+            raise
+
+        self.flushes += 1
+
+    async def sweep(self):
+        """Purge cooldowns whose wheel slots have fully elapsed."""
+        now = now_epoch()
+        current_slot = now // self.sweep_interval
+
+        for slot in range(self._next_slot, current_slot):
+            for guild_id, user_id, command_name in self._wheel.pop(slot, ()):
+                commands = self._entries.get((guild_id, user_id))
+                # Skip entries that were extended into a later slot
+                if not commands or commands.get(command_name, now + 1) > now:
+                    continue
+
+                del commands[command_name]
+                if not commands:
+                    del self._entries[(guild_id, user_id)]
+                self.swept += 1
+        self._next_slot = max(self._next_slot, current_slot)
+
+        async with self.pool.writer() as db:
+            await db.execute("DELETE FROM cooldowns WHERE expires_at <= ?", (now,))
+            await db.commit()
+
+    async def _run(self):
+        """Flush writes every flush_interval and sweep every sweep_interval."""
+        last_sweep = time.monotonic()
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+                if time.monotonic() - last_sweep >= self.sweep_interval:
+                    await self.sweep()
+                    last_sweep = time.monotonic()
+            except Exception as e:
+                print(f"Cooldown persistence failed: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cooldown store statistics."""
+        return {
+            'players': len(self._entries),
+            'active': sum(len(commands) for commands in self._entries.values()),
+            'pending': len(self._pending),
+            'lookups': self.lookups,
+            'writes': self.writes,
+            'flushes': self.flushes,
+            'swept': self.swept
+        }
@@ -0,0 +1,149 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Optional, Dict, Any
+
+import discord
+
+class EditFrame:
+    """The latest pending edit for one message."""
+
+    __slots__ = ('message', 'kwargs', 'final', 'future')
+
+    def __init__(self, message: discord.Message, kwargs: Dict[str, Any], final: bool, future: asyncio.Future):
+        self.message = message
+        self.kwargs = kwargs
+        self.final = final
+        self.future = future
+
+class ChannelBudget:
+    """Token bucket of message edits for one channel."""
+
+    __slots__ = ('tokens', 'updated', 'frames', 'task')
+
+    def __init__(self, capacity: float):
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        # Pending frames keyed by message id, oldest first
+        self.frames: "OrderedDict[int, EditFrame]" = OrderedDict()
+        self.task: Optional[asyncio.Task] = None
+
+class EditScheduler:
+    """Coalesces message edits and sends them within a per-channel budget.
+
+    Only the newest frame for each message is kept. When a newer frame arrives before
+    the previous one was sent, the two are merged. When a channel's backlog exceeds
+    max_pending messages, new animation frames are dropped. Frames submitted with
+    final=True are always delivered.
+    """
+
+    def __init__(self, rate: int = 5, per: float = 5.0, max_pending: int = 10):
+        self.rate = rate
+        self.per = per
+        self.max_pending = max_pending
+        self._channels: Dict[int, ChannelBudget] = {}
+
+        # Frame statistics
+        self.submitted = 0
+        self.sent = 0
+        self.merged = 0
+        self.dropped = 0
+        self.failed = 0
+
+    def submit(self, message: discord.Message, final: bool = False, **kwargs) -> asyncio.Future:
+        """Queue an edit; the future resolves once it (or a newer frame) is sent."""
+        self.submitted += 1
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        channel = self._channels.get(message.channel.id)
+        if channel is None:
+            channel = self._channels[message.channel.id] = ChannelBudget(self.rate)
+
+        previous = channel.frames.get(message.id)
+        if previous is not None:
+            # The older frame will never be shown; whoever waits on it waits on this one
+            self.merged += 1
+            future.add_done_callback(lambda done: self._chain(done, previous.future))
+            final = final or previous.final
+            channel.frames[message.id] = EditFrame(message, kwargs, final, future)
+        elif not final and len(channel.frames) >= self.max_pending:
+            self.dropped += 1
+            future.set_result(None)
+            return future
+        else:
+            channel.frames[message.id] = EditFrame(message, kwargs, final, future)
+
+        if channel.task is None or channel.task.done():
+            channel.task = asyncio.create_task(self._drain(message.channel.id, channel))
+        return future
+
+    @staticmethod
+    def _chain(done: asyncio.Future, waiting: asyncio.Future):
+        """Resolve a superseded frame's future with its replacement's outcome."""
+        if waiting.done():
+            return
+        if done.cancelled():
+            waiting.cancel()
+        elif done.exception() is not None:
+            waiting.set_exception(done.exception())
+        else:
+            waiting.set_result(None)
+
+    def _take_token(self, channel: ChannelBudget) -> float:
+        """Spend a token, or return how long to wait for the next one."""
+        now = time.monotonic()
+        channel.tokens = min(self.rate, channel.tokens + (now - channel.updated) * self.rate / self.per)
+        channel.updated = now
+
+        if channel.tokens >= 1:
+            channel.tokens -= 1
+            return 0.0
+        return (1 - channel.tokens) * self.per / self.rate
+
+    def _forget(self, channel_id: int, channel: ChannelBudget):
+        """Drop an idle channel whose budget has fully refilled."""
+        if (self._channels.get(channel_id) is channel and not channel.frames
+                and (channel.task is None or channel.task.done())):
+            del self._channels[channel_id]
+
+    async def _drain(self, channel_id: int, channel: ChannelBudget):
+        """Send a channel's pending frames, oldest message first, within its budget."""
+        while channel.frames:
+            wait = self._take_token(channel)
+            if wait:
+                await asyncio.sleep(wait)
+                continue
+
+            _, frame = channel.frames.popitem(last=False)
+            try:
+                await frame.message.edit(**frame.kwargs)
+            except Exception as e:
+                self.failed += 1
+                # Only final frames report failures, animation frames are fire-and-forget
+                if not frame.future.done():
+                    if frame.final:
+                        frame.future.set_exception(e)
+                    else:
+                        frame.future.set_result(None)
+            else:
+                self.sent += 1
+                if not frame.future.done():
+                    frame.future.set_result(None)
+
+        # Keep the budget until it is full again, so a fresh one cannot allow an early burst
+        refill = (self.rate - channel.tokens) * self.per / self.rate
+        asyncio.get_running_loop().call_later(refill, self._forget, channel_id, channel)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get edit scheduler statistics."""
+        return {
+            'channels': len(self._channels),
+            'busy_channels': sum(1 for channel in self._channels.values() if channel.frames),
+            'pending': sum(len(channel.frames) for channel in self._channels.values()),
+            'submitted': self.submitted,
+            'sent': self.sent,
+            'merged': self.merged,
+            'dropped': self.dropped,
+            'failed': self.failed
+        }
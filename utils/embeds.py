@@ -44,6 +44,16 @@ class EmbedBuilder:
         )
         return embed
     
+    @staticmethod
+    def game_result(title: str, description: str = None, color: int = None) -> discord.Embed:
+        """Create a game embed, in the info color unless a result color is given."""
+        embed = discord.Embed(
+            title=title,
+            description=description,
+            color=color if color is not None else Config.COLOR_INFO
+        )
+        return embed
+    
     @staticmethod
     def neutral(title: str, description: str = None) -> discord.Embed:
         """Create a neutral embed."""
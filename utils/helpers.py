@@ -100,5 +100,13 @@ def get_roulette_numbers() -> dict:
     return {
         'red': [1, 3, 5, 7, 9, 12, 14, 16, 18, 19, 21, 23, 25, 27, 30, 32, 34, 36],
         'black': [2, 4, 6, 8, 10, 11, 13, 15, 17, 20, 22, 24, 26, 28, 29, 31, 33, 35],
-        'green': [0]
+        'green': [0],
+        '1sthalf': list(range(1, 19)),
+        '2ndhalf': list(range(19, 37)),
+        '1st12': list(range(1, 13)),
+        '2nd12': list(range(13, 25)),
+        '3rd12': list(range(25, 37)),
+        '1stcol': list(range(1, 37, 3)),
+        '2ndcol': list(range(2, 37, 3)),
+        '3rdcol': list(range(3, 37, 3))
     }
\ No newline at end of file
@@ -0,0 +1,284 @@
+from typing import Optional, List
+
+# Versioned schema migrations, tracked with PRAGMA user_version.
+# Each migration runs in its own transaction; never edit one that has shipped,
+# append a new version instead.
+MIGRATIONS = [
+    {
+        'version': 1,
+        'description': 'Initial schema',
+        'statements': [
+            # Players table
+            '''
+            CREATE TABLE IF NOT EXISTS players (
+                user_id INTEGER PRIMARY KEY,
+                guild_id INTEGER,
+                cash INTEGER DEFAULT 1000,
+                level INTEGER DEFAULT 1,
+                xp INTEGER DEFAULT 0,
+                total_winnings INTEGER DEFAULT 0,
+                total_losses INTEGER DEFAULT 0,
+                games_played INTEGER DEFAULT 0,
+                daily_last_claimed TEXT,
+                weekly_last_claimed TEXT,
+                monthly_last_claimed TEXT,
+                yearly_last_claimed TEXT,
+                work_last_used TEXT,
+                overtime_last_used TEXT,
+                created_at TEXT DEFAULT CURRENT_TIMESTAMP
+            )
+            ''',
+            # Game statistics table
+            '''
+            CREATE TABLE IF NOT EXISTS game_stats (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                user_id INTEGER,
+                guild_id INTEGER,
+                game_name TEXT,
+                bet_amount INTEGER,
+                winnings INTEGER,
+                result TEXT,
+                created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (user_id) REFERENCES players (user_id)
+            )
+            ''',
+            # Player inventory table
+            '''
+            CREATE TABLE IF NOT EXISTS inventory (
+                user_id INTEGER,
+                guild_id INTEGER,
+                item_id TEXT,
+                quantity INTEGER DEFAULT 0,
+                PRIMARY KEY (user_id, guild_id, item_id),
+                FOREIGN KEY (user_id) REFERENCES players (user_id)
+            )
+            ''',
+            # Mining system table
+            '''
+            CREATE TABLE IF NOT EXISTS mining (
+                user_id INTEGER PRIMARY KEY,
+                guild_id INTEGER,
+                mine_name TEXT,
+                coal INTEGER DEFAULT 0,
+                iron INTEGER DEFAULT 0,
+                gold INTEGER DEFAULT 0,
+                diamond INTEGER DEFAULT 0,
+                emerald INTEGER DEFAULT 0,
+                lapis INTEGER DEFAULT 0,
+                redstone INTEGER DEFAULT 0,
+                unprocessed_materials INTEGER DEFAULT 0,
+                prestige_level INTEGER DEFAULT 0,
+                last_dig TEXT,
+                FOREIGN KEY (user_id) REFERENCES players (user_id)
+            )
+            ''',
+            # Guild configuration table
+            '''
+            CREATE TABLE IF NOT EXISTS guild_config (
+                guild_id INTEGER PRIMARY KEY,
+                prefix TEXT DEFAULT '!',
+                allowed_channels TEXT,
+                cash_name TEXT DEFAULT 'coins',
+                cash_emoji TEXT DEFAULT '🪙',
+                crypto_name TEXT DEFAULT 'crypto',
+                crypto_emoji TEXT DEFAULT '💎',
+                force_commands BOOLEAN DEFAULT FALSE,
+                disable_update_messages BOOLEAN DEFAULT FALSE,
+                admin_ids TEXT DEFAULT '[]'
+            )
+            ''',
+            # Cooldowns table
+            '''
+            CREATE TABLE IF NOT EXISTS cooldowns (
+                user_id INTEGER,
+                guild_id INTEGER,
+                command_name TEXT,
+                expires_at TEXT,
+                PRIMARY KEY (user_id, guild_id, command_name)
+            )
+            ''',
+            # Lottery tables (previously created lazily by the lottery cog)
+            '''
+            CREATE TABLE IF NOT EXISTS lottery (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                guild_id INTEGER,
+                user_id INTEGER,
+                tickets INTEGER DEFAULT 0,
+                week_start TEXT,
+                created_at TEXT DEFAULT CURRENT_TIMESTAMP
+            )
+            ''',
+            '''
+            CREATE TABLE IF NOT EXISTS lottery_history (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                guild_id INTEGER,
+                week_start TEXT,
+                winner_id INTEGER,
+                winner_tickets INTEGER,
+                total_tickets INTEGER,
+                prize_amount INTEGER,
+                draw_date TEXT,
+                created_at TEXT DEFAULT CURRENT_TIMESTAMP
+            )
+            ''',
+            '''
+            CREATE TABLE IF NOT EXISTS weekly_events (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                guild_id INTEGER,
+                event_type TEXT,
+                start_date TEXT,
+                end_date TEXT,
+                active BOOLEAN DEFAULT TRUE,
+                created_at TEXT DEFAULT CURRENT_TIMESTAMP
+            )
+            '''
+        ]
+    },
+    {
+        'version': 2,
+        'description': 'Key players on (user_id, guild_id)',
+        'statements': [
+            # SQLite cannot alter a primary key, so rebuild the table
+            '''
+            CREATE TABLE players_new (
+                user_id INTEGER NOT NULL,
+                guild_id INTEGER NOT NULL,
+                cash INTEGER DEFAULT 1000,
+                level INTEGER DEFAULT 1,
+                xp INTEGER DEFAULT 0,
+                total_winnings INTEGER DEFAULT 0,
+                total_losses INTEGER DEFAULT 0,
+                games_played INTEGER DEFAULT 0,
+                daily_last_claimed TEXT,
+                weekly_last_claimed TEXT,
+                monthly_last_claimed TEXT,
+                yearly_last_claimed TEXT,
+                work_last_used TEXT,
+                overtime_last_used TEXT,
+                created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (user_id, guild_id)
+            ) WITHOUT ROWID
+            ''',
+            '''
+            INSERT INTO players_new
+            SELECT user_id, guild_id, cash, level, xp, total_winnings, total_losses, games_played,
+                   daily_last_claimed, weekly_last_claimed, monthly_last_claimed, yearly_last_claimed,
+                   work_last_used, overtime_last_used, created_at
+            FROM players WHERE guild_id IS NOT NULL
+            ''',
+            'DROP TABLE players',
+            'ALTER TABLE players_new RENAME TO players'
+        ]
+    },
+    {
+        'version': 3,
+        'description': 'Secondary and covering indexes for hot access paths',
+        'statements': [
+            # Per-player and per-guild game history
+            'CREATE INDEX IF NOT EXISTS idx_game_stats_guild_user ON game_stats (guild_id, user_id)',
+            'CREATE INDEX IF NOT EXISTS idx_game_stats_guild_created ON game_stats (guild_id, created_at)',
+            # Covering indexes so get_leaderboard never scans or sorts players
+            'CREATE INDEX IF NOT EXISTS idx_players_guild_cash ON players (guild_id, cash DESC, user_id)',
+            'CREATE INDEX IF NOT EXISTS idx_players_guild_winnings ON players (guild_id, total_winnings DESC, user_id)',
+            'CREATE INDEX IF NOT EXISTS idx_players_guild_games ON players (guild_id, games_played DESC, user_id)',
+            # Weekly lottery lookups and draws
+            'CREATE INDEX IF NOT EXISTS idx_lottery_guild_week ON lottery (guild_id, week_start, user_id, tickets)',
+            'CREATE INDEX IF NOT EXISTS idx_lottery_week_guild ON lottery (week_start, guild_id)',
+            'CREATE INDEX IF NOT EXISTS idx_lottery_history_guild_date ON lottery_history (guild_id, draw_date)',
+            # Refresh planner statistics for the new indexes
+            'ANALYZE'
+        ]
+    },
+    {
+        'version': 4,
+        'description': 'Store cooldown expiries as integer epoch seconds',
+        'statements': [
+            '''
+            CREATE TABLE cooldowns_new (
+                user_id INTEGER NOT NULL,
+                guild_id INTEGER NOT NULL,
+                command_name TEXT NOT NULL,
+                expires_at INTEGER NOT NULL,
+                PRIMARY KEY (user_id, guild_id, command_name)
+            ) WITHOUT ROWID
+            ''',
+            # Old expiries are naive local-time ISO strings
+            '''
+            INSERT INTO cooldowns_new
+            SELECT user_id, guild_id, command_name, CAST(strftime('%s', expires_at, 'utc') AS INTEGER)
+            FROM cooldowns WHERE expires_at IS NOT NULL AND guild_id IS NOT NULL
+            ''',
+            'DROP TABLE cooldowns',
+            'ALTER TABLE cooldowns_new RENAME TO cooldowns',
+            # Lets the sweep purge expired cooldowns with a range delete
+            'CREATE INDEX IF NOT EXISTS idx_cooldowns_expires ON cooldowns (expires_at)'
+        ]
+    },
+    {
+        'version': 5,
+        'description': 'Add game session leases',
+        'statements': [
+            '''
+            CREATE TABLE IF NOT EXISTS game_sessions (
+                guild_id INTEGER NOT NULL,
+                user_id INTEGER NOT NULL,
+                game TEXT NOT NULL,
+                session_id INTEGER NOT NULL,
+                bet_amount INTEGER NOT NULL DEFAULT 0,
+                owner TEXT NOT NULL,
+                expires_at INTEGER NOT NULL,
+                PRIMARY KEY (guild_id, user_id)
+            ) WITHOUT ROWID
+            ''',
+            # Lets the sweep find expired and orphaned leases without a scan
+            'CREATE INDEX IF NOT EXISTS idx_game_sessions_expires ON game_sessions (expires_at)',
+            'CREATE INDEX IF NOT EXISTS idx_game_sessions_owner ON game_sessions (owner)'
+        ]
+    },
+    {
+        'version': 6,
+        'description': 'Record the RNG stream behind each game',
+        'statements': [
+            # Seed and draw count of the game's stream, for replaying disputed results
+            'ALTER TABLE game_stats ADD COLUMN rng_seed INTEGER',
+            'ALTER TABLE game_stats ADD COLUMN rng_draws INTEGER'
+        ]
+    }
+]
+
+SCHEMA_VERSION = MIGRATIONS[-1]['version']
+
+async def get_schema_version(db) -> int:
+    """Get the schema version recorded in the database."""
+    cursor = await db.execute("PRAGMA user_version")
+    row = await cursor.fetchone()
+    return row[0]
+
+async def run_migrations(db, target_version: Optional[int] = None) -> List[int]:
+    """Apply pending migrations up to target_version and return the versions applied."""
+    if target_version is None:
+        target_version = SCHEMA_VERSION
+
+    current_version = await get_schema_version(db)
+    applied = []
+
+    for migration in MIGRATIONS:
+        version = migration['version']
+        if version <= current_version or version > target_version:
+            continue
+
+        # Explicit BEGIN so DDL and the version bump commit or roll back together
+        await db.execute("BEGIN")
+        try:
+            for statement in migration['statements']:
+                await db.execute(statement)
+            await db.execute(f"PRAGMA user_version = {version}")
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
+
+        applied.append(version)
+        print(f"Applied database migration {version}: {migration['description']}")
+
+    return applied
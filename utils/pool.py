@@ -0,0 +1,121 @@
+import aiosqlite
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import Optional, Dict, Any, List
+
+class ConnectionPool:
+    """Long-lived SQLite connections: one writer plus a fixed set of readers."""
+
+    def __init__(self, db_path: str, readers: int = 4, pragmas: Optional[Dict[str, Any]] = None):
+        self.db_path = db_path
+        self.reader_count = max(1, readers)
+        self.pragmas = pragmas or {}
+        self._writer: Optional[aiosqlite.Connection] = None
+        self._write_lock = asyncio.Lock()
+        self._readers: List[aiosqlite.Connection] = []
+        self._idle_readers: Optional[asyncio.Queue] = None
+
+        # Pool statistics
+        self.checked_out = 0
+        self.acquisitions = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    @property
+    def is_open(self) -> bool:
+        """Whether the pool currently holds open connections."""
+        return self._writer is not None
+
+    async def _connect(self) -> aiosqlite.Connection:
+        """Open a connection with the configured pragmas applied."""
+        connection = await aiosqlite.connect(self.db_path)
+        for pragma, value in self.pragmas.items():
+            await connection.execute(f"PRAGMA {pragma} = {value}")
+        return connection
+
+    async def open(self):
+        """Open the writer and reader connections."""
+        if self.is_open:
+            return
+
+        # The writer goes first so journal_mode is switched before readers attach
+        self._writer = await self._connect()
+        self._idle_readers = asyncio.Queue()
+
+        for _ in range(self.reader_count):
+            reader = await self._connect()
+            # Readers must never write; all writes go through the single writer
+            await reader.execute("PRAGMA query_only = ON")
+            self._readers.append(reader)
+            self._idle_readers.put_nowait(reader)
+
+    async def close(self):
+        """Close every connection in the pool."""
+        if not self.is_open:
+            return
+
+        # Wait for any in-flight write transaction to finish
+        async with self._write_lock:
+            writer, self._writer = self._writer, None
+            await writer.close()
+
+        for reader in self._readers:
+            await reader.close()
+        self._readers = []
+        self._idle_readers = None
+
+    def _record_wait(self, waited: float):
+        """Record how long a caller waited for a connection."""
+        self.acquisitions += 1
+        self.total_wait += waited
+        if waited > self.max_wait:
+            self.max_wait = waited
+
+    @asynccontextmanager
+    async def reader(self):
+        """Check out a read-only connection."""
+        if not self.is_open:
+            raise RuntimeError("Connection pool is not open")
+
+        start = time.perf_counter()
+        connection = await self._idle_readers.get()
+        self._record_wait(time.perf_counter() - start)
+        self.checked_out += 1
+
+        try:
+            yield connection
+        finally:
+            self.checked_out -= 1
+            self._idle_readers.put_nowait(connection)
+
+    @asynccontextmanager
+    async def writer(self):
+        """Check out the writer connection for exclusive use."""
+        if not self.is_open:
+            raise RuntimeError("Connection pool is not open")
+
+        start = time.perf_counter()
+        async with self._write_lock:
+            self._record_wait(time.perf_counter() - start)
+            self.checked_out += 1
+
+            try:
+                yield self._writer
+            except BaseException:
+                # Never leave a half-applied transaction on the shared writer
+                await self._writer.rollback()
+                raise
+            finally:
+                self.checked_out -= 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Get pool usage statistics."""
+        return {
+            'readers': self.reader_count,
+            'checked_out': self.checked_out,
+            'acquisitions': self.acquisitions,
+            'total_wait': self.total_wait,
+            'avg_wait': self.total_wait / self.acquisitions if self.acquisitions else 0.0,
+            'max_wait': self.max_wait
+        }
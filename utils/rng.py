@@ -0,0 +1,156 @@
+import random
+import secrets
+from math import floor, log, log2, lgamma, sqrt
+from array import array
+from typing import Optional, Dict, Any, List, Sequence
+
+class GameRNG(random.Random):
+    """A seeded random stream for one game session.
+
+    Drop-in for the random module's interface. Every call into the generator and every
+    buffered word consumed is counted, so a result can be audited by replaying the
+    stream from its seed and checking it ends on the same draw count. randbelow_batch()
+    serves bounded integers from a buffer of 32-bit words that is refilled with one
+    bulk draw, and binomialvariate() and multinomial() draw counts for any number of
+    trials in time independent of it.
+    """
+
+    def __init__(self, seed: Optional[int] = None, buffer_words: int = 256):
+        if seed is None:
+            seed = secrets.randbits(63)  # Fits a signed SQLite INTEGER
+        self.stream_seed = seed
+        self.draws = 0
+        self.refills = 0
+        self.buffer_words = buffer_words
+        self._words = array('I')
+        self._index = 0
+        super().__init__(seed)
+
+    def random(self) -> float:
+        self.draws += 1
+        return super().random()
+
+    def getrandbits(self, k: int) -> int:
+        self.draws += 1
+        return super().getrandbits(k)
+
+    def _refill(self):
+        """Pre-draw the next buffer of 32-bit words in one call."""
+        self._words = array('I')
+        size = self._words.itemsize * self.buffer_words
+        # Bypasses the draw counter; words are counted as they are consumed
+        self._words.frombytes(super().getrandbits(8 * size).to_bytes(size, 'little'))
+        self._index = 0
+        self.refills += 1
+
+    def randbelow_batch(self, bound: int, k: int) -> List[int]:
+        """Draw k integers in [0, bound) from the pre-drawn buffer."""
+        # Reject words past the last whole multiple of bound so every value is equally likely
+        limit = (1 << (8 * self._words.itemsize)) // bound * bound
+        values = []
+        while len(values) < k:
+            if self._index >= len(self._words):
+                self._refill()
+            word = self._words[self._index]
+            self._index += 1
+            self.draws += 1
+            if word < limit:
+                values.append(word % bound)
+        return values
+
+    def binomialvariate(self, n: int = 1, p: float = 0.5) -> int:
+        """Number of successes in n independent trials with success chance p.
+
+        The same algorithms as random.binomialvariate() in Python 3.12, defined here so a
+        replayed stream draws the same counts on every Python version.
+        """
+        if n < 0:
+            raise ValueError("n must be non-negative")
+        if p <= 0.0 or p >= 1.0:
+            if p == 0.0:
+                return 0
+            if p == 1.0:
+                return n
+            raise ValueError("p must be in the range 0.0 <= p <= 1.0")
+        if n == 1:
+            return int(self.random() < p)
+        if p > 0.5:
+            return n - self.binomialvariate(n, 1.0 - p)
+
+        if n * p < 10.0:
+            # Skip from success to success with geometric gaps, O(n * p)
+            x = y = 0
+            c = log2(1.0 - p)
+            if not c:
+                return x
+            while True:
+                y += floor(log2(1.0 - self.random()) / c) + 1
+                if y > n:
+                    return x
+                x += 1
+
+        # Transformed rejection with squeeze (Hörmann's BTRS), O(1) expected draws
+        spq = sqrt(n * p * (1.0 - p))
+        b = 1.15 + 2.53 * spq
+        a = -0.0873 + 0.0248 * b + 0.01 * p
+        c = n * p + 0.5
+        vr = 0.92 - 4.2 / b
+        alpha = (2.83 + 5.1 / b) * spq
+        lpq = log(p / (1.0 - p))
+        m = floor((n + 1) * p)
+        h = lgamma(m + 1) + lgamma(n - m + 1)
+        while True:
+            u = self.random() - 0.5
+            us = 0.5 - abs(u)
+            k = floor((2.0 * a / us + b) * u + c)
+            if k < 0 or k > n:
+                continue
+            v = self.random()
+            if us >= 0.07 and v <= vr:
+                return k
+            v *= alpha / (a / (us * us) + b)
+            if log(v) <= h - lgamma(k + 1) - lgamma(n - k + 1) + (k - m) * lpq:
+                return k
+
+    def multinomial(self, n: int, weights: Sequence[float]) -> List[int]:
+        """Split n trials across outcomes with the given relative weights.
+
+        One binomial per outcome on the trials and weight left, so the cost depends on
+        the number of outcomes and not on n.
+        """
+        counts = []
+        left = float(sum(weights))
+        for weight in weights[:-1]:
+            count = self.binomialvariate(n, min(1.0, weight / left)) if n and left > 0 else 0
+            counts.append(count)
+            n -= count
+            left -= weight
+        counts.append(n)
+        return counts
+
+class RNGService:
+    """Hands out a fresh, independently seeded stream to each game session."""
+
+    def __init__(self, buffer_words: int = 256):
+        self.buffer_words = buffer_words
+
+        # Service statistics
+        self.streams = 0
+        self.replays = 0
+
+    def stream(self) -> GameRNG:
+        """Create a stream with a new random seed."""
+        self.streams += 1
+        return GameRNG(buffer_words=self.buffer_words)
+
+    def replay(self, seed: int) -> GameRNG:
+        """Recreate the stream recorded with a game_stats row."""
+        self.replays += 1
+        return GameRNG(seed, self.buffer_words)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get RNG service statistics."""
+        return {
+            'streams': self.streams,
+            'replays': self.replays
+        }
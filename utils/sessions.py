@@ -0,0 +1,336 @@
+import asyncio
+from typing import Optional, Dict, Any, List, Tuple, Callable
+
+from utils.cooldowns import now_epoch
+
+CREDIT_CASH_SQL = "UPDATE players SET cash = cash + ? WHERE user_id = ? AND guild_id = ?"
+DEBIT_CASH_SQL = "UPDATE players SET cash = cash - ? WHERE user_id = ? AND guild_id = ? AND cash >= ? RETURNING cash"
+
+async def debit_cash(db, user_id: int, guild_id: int, amount: int) -> Optional[int]:
+    """Take amount from a player on the caller's connection if they can afford it.
+
+    Returns the new balance, or None if the player cannot cover it. The caller commits.
+    """
+    cursor = await db.execute(DEBIT_CASH_SQL, (amount, user_id, guild_id, amount))
+    rows = await cursor.fetchall()
+    return rows[0][0] if rows else None
+
+class GameSession:
+    """A lease on a player's game slot in one guild, holding their escrowed bet."""
+
+    __slots__ = ('guild_id', 'user_id', 'game', 'session_id', 'bet_amount', 'owner', 'expires_at')
+
+    def __init__(self, guild_id: int, user_id: int, game: str, session_id: int,
+                 bet_amount: int, owner: str, expires_at: int):
+        self.guild_id = guild_id
+        self.user_id = user_id
+        self.game = game
+        self.session_id = session_id
+        self.bet_amount = bet_amount
+        self.owner = owner
+        self.expires_at = expires_at
+
+    @property
+    def key(self) -> Tuple[int, int]:
+        """The (guild_id, user_id) slot this session holds."""
+        return (self.guild_id, self.user_id)
+
+class MemorySessionBackend:
+    """Leases held by this process only.
+
+    Cheapest option for a single process, but leases and their escrowed bets are not
+    visible to other processes and are forgotten on restart.
+    """
+
+    def __init__(self):
+        self._sessions: Dict[Tuple[int, int], GameSession] = {}
+
+    async def insert(self, db, session: GameSession) -> bool:
+        """Take the lease unless the player already holds one."""
+        if session.key in self._sessions:
+            return False
+        self._sessions[session.key] = session
+        return True
+
+    async def delete(self, db, guild_id: int, user_id: int, session_id: int) -> Optional[GameSession]:
+        """Remove a lease if it is still held by session_id, returning it."""
+        session = self._sessions.get((guild_id, user_id))
+        if session is None or session.session_id != session_id:
+            return None
+        return self._sessions.pop((guild_id, user_id))
+
+    async def extend(self, db, guild_id: int, user_id: int, session_id: int, expires_at: int) -> bool:
+        """Push back a held lease's expiry."""
+        session = self._sessions.get((guild_id, user_id))
+        if session is None or session.session_id != session_id:
+            return False
+        session.expires_at = expires_at
+        return True
+
+    async def claim(self, db, now: int, owner: Optional[str] = None,
+                    key: Optional[Tuple[int, int]] = None) -> List[GameSession]:
+        """Remove and return expired leases, plus every lease held by owner."""
+        if key is not None:
+            sessions = [self._sessions[key]] if key in self._sessions else []
+        else:
+            sessions = list(self._sessions.values())
+        claimed = [session for session in sessions if session.expires_at <= now or session.owner == owner]
+        for session in claimed:
+            del self._sessions[session.key]
+        return claimed
+
+    async def count_by_game(self, db, now: int) -> Dict[str, int]:
+        """Count live leases per game."""
+        counts: Dict[str, int] = {}
+        for session in self._sessions.values():
+            if session.expires_at > now:
+                counts[session.game] = counts.get(session.game, 0) + 1
+        return counts
+
+class SQLiteSessionBackend:
+    """Leases stored in the game_sessions table.
+
+    Every call runs on the caller's connection, so taking or dropping a lease commits
+    in the same transaction as the cash it escrows or refunds. Leases survive restarts
+    and are shared by every process using the database.
+    """
+
+    COLUMNS = 'guild_id, user_id, game, session_id, bet_amount, owner, expires_at'
+
+    async def insert(self, db, session: GameSession) -> bool:
+        """Take the lease unless the player already holds one."""
+        cursor = await db.execute(
+            f"INSERT OR IGNORE INTO game_sessions ({self.COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (session.guild_id, session.user_id, session.game, session.session_id,
+             session.bet_amount, session.owner, session.expires_at)
+        )
+        return cursor.rowcount == 1
+
+    async def delete(self, db, guild_id: int, user_id: int, session_id: int) -> Optional[GameSession]:
+        """Remove a lease if it is still held by session_id, returning it."""
+        cursor = await db.execute(
+            f"DELETE FROM game_sessions WHERE guild_id = ? AND user_id = ? AND session_id = ? RETURNING {self.COLUMNS}",
+            (guild_id, user_id, session_id)
+        )
+        rows = await cursor.fetchall()
+        return GameSession(*rows[0]) if rows else None
+
+    async def extend(self, db, guild_id: int, user_id: int, session_id: int, expires_at: int) -> bool:
+        """Push back a held lease's expiry."""
+        cursor = await db.execute(
+            "UPDATE game_sessions SET expires_at = ? WHERE guild_id = ? AND user_id = ? AND session_id = ?",
+            (expires_at, guild_id, user_id, session_id)
+        )
+        return cursor.rowcount == 1
+
+    async def claim(self, db, now: int, owner: Optional[str] = None,
+                    key: Optional[Tuple[int, int]] = None) -> List[GameSession]:
+        """Remove and return expired leases, plus every lease held by owner."""
+        where = "(expires_at <= ? OR owner = ?)"
+        params: Tuple = (now, owner)
+        if key is not None:
+            where += " AND guild_id = ? AND user_id = ?"
+            params += key
+
+        cursor = await db.execute(f"DELETE FROM game_sessions WHERE {where} RETURNING {self.COLUMNS}", params)
+        rows = await cursor.fetchall()
+        return [GameSession(*row) for row in rows]
+
+    async def count_by_game(self, db, now: int) -> Dict[str, int]:
+        """Count live leases per game."""
+        cursor = await db.execute(
+            "SELECT game, COUNT(*) FROM game_sessions WHERE expires_at > ? GROUP BY game", (now,)
+        )
+        return dict(await cursor.fetchall())
+
+SESSION_BACKENDS = {
+    'memory': MemorySessionBackend,
+    'sqlite': SQLiteSessionBackend
+}
+
+def get_session_backend(name: str):
+    """Create a session backend by name."""
+    try:
+        return SESSION_BACKENDS[name.lower()]()
+    except KeyError:
+        raise ValueError(
+            f"Unknown session backend '{name}'. Choose from: {', '.join(SESSION_BACKENDS)}"
+        )
+
+class SessionRegistry:
+    """Active games as TTL leases keyed by (guild_id, user_id).
+
+    Opening a session leases the player's slot and debits their bet together; whoever
+    later removes the lease (the game settling, the game being cancelled, or the sweep
+    finding it expired) owns the escrowed bet, so it is paid back exactly once. On
+    startup every lease held by this owner is an orphan of the previous run and is
+    refunded immediately; leases of other owners are refunded once they expire.
+    """
+
+    def __init__(self, pool, backend, ttl: int = 300, sweep_interval: float = 30,
+                 owner: str = "main", on_commit: Optional[Callable[[List[Tuple[int, int, int]]], None]] = None):
+        self.pool = pool
+        self.backend = backend
+        self.ttl = ttl
+        self.sweep_interval = sweep_interval
+        self.owner = owner
+        # Receives committed (guild_id, user_id, cash_delta) changes
+        self.on_commit = on_commit
+        self._task: Optional[asyncio.Task] = None
+
+        # Session statistics
+        self.opened = 0
+        self.busy = 0
+        self.closed = 0
+        self.cancelled = 0
+        self.renewed = 0
+        self.refunded = 0
+
+    def start(self):
+        """Start the background expiry sweep."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stop the background sweep."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def _committed(self, changes: List[Tuple[int, int, int]]):
+        """Report committed cash changes to the owner of any cache."""
+        if changes and self.on_commit is not None:
+            self.on_commit(changes)
+
+    async def _refund(self, db, sessions: List[GameSession]) -> List[Tuple[int, int, int]]:
+        """Credit claimed sessions' bets on the caller's connection."""
+        changes = [(session.guild_id, session.user_id, session.bet_amount)
+                   for session in sessions if session.bet_amount]
+        if changes:
+            await db.executemany(CREDIT_CASH_SQL, [(amount, user_id, guild_id) for guild_id, user_id, amount in changes])
+        self.refunded += len(sessions)
+        return changes
+
+    async def open(self, user_id: int, guild_id: int, game: str, session_id: int, bet_amount: int) -> bool:
+        """Lease the player's game slot and escrow their bet.
+
+        Returns False if the player cannot cover the bet and raises ValueError if they
+        already have a game running in this guild.
+        """
+        now = now_epoch()
+        session = GameSession(guild_id, user_id, game, session_id, bet_amount, self.owner, now + self.ttl)
+
+        async with self.pool.writer() as db:
+            # An expired lease on this slot is refunded rather than blocking the player
+            changes = await self._refund(db, await self.backend.claim(db, now, key=session.key))
+
+            leased = await self.backend.insert(db, session)
+            # A game without a stake has nothing to escrow
+            funded = leased and not bet_amount
+            if leased and bet_amount:
+                funded = await debit_cash(db, user_id, guild_id, bet_amount) is not None
+                if not funded:
+                    await self.backend.delete(db, guild_id, user_id, session_id)
+
+            await db.commit()
+
+        if funded and bet_amount:
+            changes.append((guild_id, user_id, -bet_amount))
+        self._committed(changes)
+
+        if not leased:
+            self.busy += 1
+            raise ValueError("You already have a game running in this server!")
+        if funded:
+            self.opened += 1
+        return funded
+
+    async def renew(self, user_id: int, guild_id: int, session_id: int) -> bool:
+        """Extend a session's lease by another ttl seconds."""
+        async with self.pool.writer() as db:
+            renewed = await self.backend.extend(db, guild_id, user_id, session_id, now_epoch() + self.ttl)
+            await db.commit()
+
+        if renewed:
+            self.renewed += 1
+        return renewed
+
+    async def close(self, user_id: int, guild_id: int, session_id: int) -> Optional[GameSession]:
+        """Drop a finished session's lease, returning it if its bet is still escrowed."""
+        async with self.pool.writer() as db:
+            session = await self.backend.delete(db, guild_id, user_id, session_id)
+            await db.commit()
+
+        if session is not None:
+            self.closed += 1
+        return session
+
+    async def close_many(self, db, sessions: List[Tuple[int, int, int]]) -> List[Optional[GameSession]]:
+        """Drop several finished sessions' leases on the caller's connection.
+
+        Takes (user_id, guild_id, session_id) tuples and returns each lease if its bet
+        is still escrowed. The caller commits, together with whatever settles them.
+        """
+        closed = [await self.backend.delete(db, guild_id, user_id, session_id)
+                  for user_id, guild_id, session_id in sessions]
+        self.closed += sum(1 for session in closed if session is not None)
+        return closed
+
+    async def cancel(self, user_id: int, guild_id: int, session_id: int) -> Optional[GameSession]:
+        """Drop an unfinished session's lease and refund its bet."""
+        async with self.pool.writer() as db:
+            session = await self.backend.delete(db, guild_id, user_id, session_id)
+            changes = await self._refund(db, [session]) if session is not None else []
+            await db.commit()
+
+        self._committed(changes)
+        if session is not None:
+            self.cancelled += 1
+        return session
+
+    async def reap(self, owner: Optional[str] = None) -> List[GameSession]:
+        """Refund expired sessions, plus every session held by owner."""
+        async with self.pool.writer() as db:
+            sessions = await self.backend.claim(db, now_epoch(), owner)
+            changes = await self._refund(db, sessions)
+            await db.commit()
+
+        self._committed(changes)
+        return sessions
+
+    async def recover(self) -> List[GameSession]:
+        """Refund sessions orphaned by this owner's previous run."""
+        sessions = await self.reap(self.owner)
+        if sessions:
+            print(f"Refunded {len(sessions)} orphaned game session(s)")
+        return sessions
+
+    async def live_sessions(self) -> Dict[str, int]:
+        """Count live sessions per game across every process sharing the backend."""
+        async with self.pool.reader() as db:
+            return await self.backend.count_by_game(db, now_epoch())
+
+    async def _run(self):
+        """Refund expired sessions every sweep_interval."""
+        while True:
+            await asyncio.sleep(self.sweep_interval)
+            try:
+                await self.reap()
+            except Exception as e:
+                print(f"Game session sweep failed: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        """Get session registry statistics."""
+        return {
+            'backend': type(self.backend).__name__,
+            'opened': self.opened,
+            'busy': self.busy,
+            'closed': self.closed,
+            'cancelled': self.cancelled,
+            'renewed': self.renewed,
+            'refunded': self.refunded
+        }
@@ -0,0 +1,190 @@
+import asyncio
+import time
+from typing import Optional, Dict, Any, List, Tuple, Callable
+
+# Cash delta plus lifetime totals, applied in one statement per settlement
+SETTLE_PLAYER_SQL = '''
+    UPDATE players SET
+        cash = cash + ?,
+        total_winnings = total_winnings + ?,
+        total_losses = total_losses + ?,
+        games_played = games_played + 1
+    WHERE user_id = ? AND guild_id = ?
+'''
+
+INSERT_GAME_STAT_SQL = '''
+    INSERT INTO game_stats (user_id, guild_id, game_name, bet_amount, winnings, result, rng_seed, rng_draws)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+class Settlement:
+    """A single game result waiting to be written."""
+
+    __slots__ = ('user_id', 'guild_id', 'game_name', 'bet_amount', 'cash_delta', 'result', 'escrow',
+                 'rng_seed', 'rng_draws', 'future')
+
+    def __init__(self, user_id: int, guild_id: int, game_name: str, bet_amount: int,
+                 cash_delta: int, result: str, escrow: int = 0,
+                 rng_seed: Optional[int] = None, rng_draws: Optional[int] = None,
+                 future: Optional[asyncio.Future] = None):
+        self.user_id = user_id
+        self.guild_id = guild_id
+        self.game_name = game_name
+        self.bet_amount = bet_amount
+        self.cash_delta = cash_delta
+        self.result = result
+        # Bet escrowed when its session was opened, returned to the player with the payout
+        self.escrow = escrow
+        # Stream that decided the game, so the result can be replayed
+        self.rng_seed = rng_seed
+        self.rng_draws = rng_draws
+        self.future = future
+
+    @property
+    def winnings(self) -> int:
+        """Winnings recorded in game_stats (never negative)."""
+        return max(0, self.cash_delta)
+
+    def player_params(self) -> Tuple:
+        """Parameters for SETTLE_PLAYER_SQL."""
+        credit = self.escrow + self.cash_delta
+        if self.winnings > 0:
+            return (credit, self.winnings, 0, self.user_id, self.guild_id)
+        return (credit, 0, self.bet_amount, self.user_id, self.guild_id)
+
+    def stat_params(self) -> Tuple:
+        """Parameters for INSERT_GAME_STAT_SQL."""
+        return (self.user_id, self.guild_id, self.game_name, self.bet_amount, self.winnings, self.result,
+                self.rng_seed, self.rng_draws)
+
+async def write_settlements(db, settlements: List[Settlement]):
+    """Write settlements in a single transaction on the given connection."""
+    await db.executemany(SETTLE_PLAYER_SQL, [s.player_params() for s in settlements])
+    await db.executemany(INSERT_GAME_STAT_SQL, [s.stat_params() for s in settlements])
+    await db.commit()
+
+class SettlementQueue:
+    """Write-behind queue that groups game settlements into shared transactions."""
+
+    def __init__(self, pool, max_batch: int = 100, max_delay: float = 0.005,
+                 on_commit: Optional[Callable[[List[Settlement]], None]] = None):
+        self.pool = pool
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.on_commit = on_commit
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+
+        # Queue statistics
+        self.batches = 0
+        self.settled = 0
+        self.failed = 0
+        self.total_flush_time = 0.0
+        self.largest_batch = 0
+
+    def start(self):
+        """Start the background writer task."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stop the writer task after flushing anything still queued."""
+        if self._task is not None:
+            # Sentinel lets the in-flight batch finish instead of being cancelled
+            self._queue.put_nowait(None)
+            await self._task
+            self._task = None
+
+        remaining = self._drain(self._queue.qsize())
+        if remaining:
+            await self._flush(remaining)
+
+    def submit(self, settlement: Settlement) -> asyncio.Future:
+        """Queue a settlement; the future resolves once it is committed."""
+        settlement.future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait(settlement)
+        return settlement.future
+
+    def _drain(self, limit: int) -> List[Optional[Settlement]]:
+        """Take up to limit queued settlements without waiting."""
+        batch = []
+        while len(batch) < limit:
+            try:
+                batch.append(self._queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        return batch
+
+    async def _run(self):
+        """Collect settlements for max_delay (or max_batch items) and flush them."""
+        while True:
+            first = await self._queue.get()
+            if first is None:
+                return
+
+            # Give concurrent games a moment to join this transaction
+            if self._queue.qsize() < self.max_batch - 1:
+                await asyncio.sleep(self.max_delay)
+
+            batch = [first] + self._drain(self.max_batch - 1)
+            stopping = None in batch
+            await self._flush([settlement for settlement in batch if settlement is not None])
+            if stopping:
+                return
+
+    async def _flush(self, batch: List[Settlement]):
+        """Commit a batch and resolve its futures."""
+        start = time.perf_counter()
+
+        try:
+            async with self.pool.writer() as db:
+                await write_settlements(db, batch)
+        except Exception:
+            # Retry one by one so a single bad settlement cannot fail the whole batch
+            for settlement in batch:
+                await self._flush_single(settlement)
+        else:
+            self._committed(batch)
+            self.settled += len(batch)
+
+        self.batches += 1
+        self.largest_batch = max(self.largest_batch, len(batch))
+        self.total_flush_time += time.perf_counter() - start
+
+    async def _flush_single(self, settlement: Settlement):
+        """Commit one settlement on its own."""
+        try:
+            async with self.pool.writer() as db:
+                await write_settlements(db, [settlement])
+        except Exception as e:
+            self.failed += 1
+            if not settlement.future.done():
+                settlement.future.set_exception(e)
+        else:
+            self._committed([settlement])
+            self.settled += 1
+
+    def _committed(self, settlements: List[Settlement]):
+        """Resolve the callers' futures, then run the commit hook."""
+        for settlement in settlements:
+            if not settlement.future.done():
+                settlement.future.set_result(None)
+
+        if self.on_commit:
+            # The writes are already committed; a failing hook must not stop the writer
+            try:
+                self.on_commit(settlements)
+            except Exception as e:
+                print(f"Settlement commit hook failed: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        """Get settlement queue statistics."""
+        return {
+            'queued': self._queue.qsize(),
+            'batches': self.batches,
+            'settled': self.settled,
+            'failed': self.failed,
+            'avg_batch': self.settled / self.batches if self.batches else 0.0,
+            'largest_batch': self.largest_batch,
+            'avg_flush_time': self.total_flush_time / self.batches if self.batches else 0.0
+        }
@@ -0,0 +1,133 @@
+import asyncio
+import os
+import time
+from typing import Optional, Dict, Any
+
+# Named SQLite tuning profiles applied to every pooled connection at startup.
+# Pragmas are applied in order; journal_mode must come first.
+STORAGE_PROFILES = {
+    # Every commit is fsynced, safe against power loss
+    'durable': {
+        'journal_mode': 'WAL',
+        'synchronous': 'FULL',
+        'busy_timeout': 5000,
+        'cache_size': -16000,  # 16 MB
+        'mmap_size': 0,
+        'wal_autocheckpoint': 1000
+    },
+    # WAL with NORMAL sync: survives app crashes, may lose the last commits on power loss
+    'balanced': {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'busy_timeout': 5000,
+        'cache_size': -32000,  # 32 MB
+        'mmap_size': 67108864,  # 64 MB
+        'temp_store': 'MEMORY',
+        'wal_autocheckpoint': 1000
+    },
+    # No fsyncs and no auto-checkpoints, the checkpoint scheduler owns the WAL
+    'throughput': {
+        'journal_mode': 'WAL',
+        'synchronous': 'OFF',
+        'busy_timeout': 10000,
+        'cache_size': -131072,  # 128 MB
+        'mmap_size': 268435456,  # 256 MB
+        'temp_store': 'MEMORY',
+        'wal_autocheckpoint': 0
+    }
+}
+
+def get_storage_profile(name: str) -> Dict[str, Any]:
+    """Get the pragmas for a named storage profile."""
+    try:
+        return STORAGE_PROFILES[name.lower()]
+    except KeyError:
+        raise ValueError(
+            f"Unknown storage profile '{name}'. Choose from: {', '.join(STORAGE_PROFILES)}"
+        )
+
+class CheckpointScheduler:
+    """Background task that checkpoints the WAL on a size or time threshold."""
+
+    def __init__(self, pool, interval: float, max_wal_bytes: int, poll_interval: float = 5.0):
+        self.pool = pool
+        self.wal_path = f"{pool.db_path}-wal"
+        self.interval = interval
+        self.max_wal_bytes = max_wal_bytes
+        self.poll_interval = poll_interval
+        self._task: Optional[asyncio.Task] = None
+        self._last_checkpoint = time.monotonic()
+
+        # Checkpoint statistics
+        self.checkpoints = 0
+        self.total_duration = 0.0
+        self.last_duration = 0.0
+        self.max_duration = 0.0
+        self.last_result = None
+
+    def start(self):
+        """Start the background checkpoint task."""
+        if self._task is None or self._task.done():
+            self._last_checkpoint = time.monotonic()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stop the background checkpoint task."""
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def _wal_size(self) -> int:
+        """Get the current WAL file size in bytes."""
+        try:
+            return os.path.getsize(self.wal_path)
+        except OSError:
+            return 0
+
+    async def checkpoint(self, mode: str = "PASSIVE") -> float:
+        """Run a WAL checkpoint and return how long it took."""
+        start = time.perf_counter()
+
+        async with self.pool.writer() as db:
+            cursor = await db.execute(f"PRAGMA wal_checkpoint({mode})")
+            # (busy, wal pages, checkpointed pages)
+            self.last_result = await cursor.fetchone()
+
+        duration = time.perf_counter() - start
+        self._last_checkpoint = time.monotonic()
+        self.checkpoints += 1
+        self.total_duration += duration
+        self.last_duration = duration
+        self.max_duration = max(self.max_duration, duration)
+        return duration
+
+    async def _run(self):
+        """Poll the WAL and checkpoint when a threshold is crossed."""
+        while True:
+            await asyncio.sleep(self.poll_interval)
+
+            try:
+                if self._wal_size() >= self.max_wal_bytes:
+                    # Oversized WAL: checkpoint and shrink the file back down
+                    await self.checkpoint("TRUNCATE")
+                elif time.monotonic() - self._last_checkpoint >= self.interval:
+                    await self.checkpoint("PASSIVE")
+            except Exception as e:
+                print(f"Error in WAL checkpoint task: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        """Get checkpoint statistics."""
+        return {
+            'checkpoints': self.checkpoints,
+            'wal_bytes': self._wal_size(),
+            'last_duration': self.last_duration,
+            'max_duration': self.max_duration,
+            'avg_duration': self.total_duration / self.checkpoints if self.checkpoints else 0.0,
+            'last_result': self.last_result
+        }